@@ -1,8 +1,10 @@
 from django.contrib import admin
+
+from core.admin import ReplicaReadAdmin
 from .models import User
 
 
 @admin.register(User)
-class UserAdmin(admin.ModelAdmin):
+class UserAdmin(ReplicaReadAdmin):
     list_display = ('username', 'alias')
     search_fields = ('username', 'alias')
\ No newline at end of file
@@ -0,0 +1,21 @@
+from django.contrib import admin
+
+from core.replicas import read_db
+
+
+class ReplicaReadAdmin(admin.ModelAdmin):
+    """
+    Reads the change list from a read replica. Change forms and actions keep reading from the primary.
+    """
+
+    def changelist_view(self, request, extra_context=None):
+        if request.method == 'GET':
+            request.admin_read_db = read_db(request)
+
+        return super().changelist_view(request, extra_context)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        db = getattr(request, 'admin_read_db', None)
+
+        return queryset.using(db) if db else queryset
@@ -1,5 +1,23 @@
+import os
+
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import post_save
 
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        from core.identity import record_saved
+
+        # Keeps the request's tracked instances in step with saves made through other instances of the same rows
+        post_save.connect(record_saved, dispatch_uid='core.identity.record_saved')
+
+        # Load pre-trained name models so world generation only pays for sampling, falls back to training lazily
+        path = settings.MARKOV_MODELS_PATH
+
+        if path and os.path.exists(path):
+            from core.utils import generators
+
+            generators.load_models(path)
@@ -0,0 +1,135 @@
+"""
+Request-scoped identity map.
+
+Views track the rows they load for a request (the player with its state, owner and location) and code that writes
+those rows through queryset updates records the values it wrote, which are applied to the tracked instances. Saves
+of other instances of a tracked row are copied over the same way. The view's objects so stay current through event
+processing, deaths and travel without being fetched again.
+
+The map lives in a context variable set by IdentityMapMiddleware, outside a request (world generation threads,
+management commands) there is none and recording does nothing. Only writes made by the request itself are seen,
+views that must notice writes of other requests check for them, see BaseView.save_refresh.
+"""
+from contextvars import ContextVar
+from typing import Any, Iterable
+
+from django.contrib.auth import HASH_SESSION_KEY
+from django.db.models import Model
+from django.utils.crypto import constant_time_compare
+
+_current: ContextVar['IdentityMap | None'] = ContextVar('identity_map', default=None)
+
+
+class IdentityMap:
+    def __init__(self):
+        self._objects: dict[tuple[str, Any], Model] = {}
+
+    @staticmethod
+    def _key(model: type[Model], pk: Any) -> tuple[str, Any]:
+        return model._meta.concrete_model._meta.label, pk
+
+    def track(self, obj: Model) -> None:
+        """
+        Tracks an instance and the related instances loaded with it (select_related and cached relations).
+        """
+        pending = [obj]
+        seen = set()
+
+        while pending:
+            obj = pending.pop()
+
+            if obj is None or id(obj) in seen or obj.pk is None:
+                continue
+
+            seen.add(id(obj))
+            self._objects.setdefault(self._key(type(obj), obj.pk), obj)
+            pending.extend(obj._state.fields_cache.values())
+
+    def get(self, model: type[Model], pk: Any) -> Model | None:
+        return self._objects.get(self._key(model, pk))
+
+    def record(self, model: type[Model], pk: Any, **values) -> None:
+        obj = self.get(model, pk)
+
+        if obj is not None:
+            for field, value in values.items():
+                setattr(obj, field, value)
+
+
+def track(*objs: Model | None) -> None:
+    identity_map = _current.get()
+
+    if identity_map is not None:
+        for obj in objs:
+            if obj is not None:
+                identity_map.track(obj)
+
+
+def record(model: type[Model], pk: Any, **values) -> None:
+    """
+    Applies values written to a row with a queryset update to the request's instance of it, if tracked.
+    """
+    identity_map = _current.get()
+
+    if identity_map is not None:
+        identity_map.record(model, pk, **values)
+
+
+def record_update(objs: Iterable[Model], fields: list[str]) -> None:
+    """
+    Same as record for the instances written with bulk_update(objs, fields).
+    """
+    identity_map = _current.get()
+
+    if identity_map is not None:
+        for obj in objs:
+            identity_map.record(type(obj), obj.pk, **{field: getattr(obj, field) for field in fields})
+
+
+def record_saved(sender, instance, update_fields=None, **kwargs) -> None:
+    """
+    post_save receiver copying the saved fields of an instance onto the tracked instance of the same row.
+    """
+    identity_map = _current.get()
+
+    if identity_map is None:
+        return
+
+    tracked = identity_map.get(sender, instance.pk)
+
+    if tracked is None or tracked is instance:
+        return
+
+    if update_fields:
+        fields = [sender._meta.get_field(name) for name in update_fields]
+    else:
+        fields = [field for field in sender._meta.concrete_fields if not field.primary_key]
+
+    for field in fields:
+        # Attribute names, so foreign keys copy the id without loading the related row
+        setattr(tracked, field.attname, getattr(instance, field.attname))
+
+
+def share_user(request, user) -> None:
+    """
+    Lets request.user reuse a user the view already loaded, instead of loading it again when a template or
+    middleware touches it. Only done when the user matches the session exactly as the auth middleware would check.
+    """
+    session_hash = request.session.get(HASH_SESSION_KEY)
+
+    if (str(user.pk) == str(request.session.get('_auth_user_id')) and user.is_active
+            and session_hash and constant_time_compare(session_hash, user.get_session_auth_hash())):
+        request._cached_user = user
+
+
+class IdentityMapMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _current.set(IdentityMap())
+
+        try:
+            return self.get_response(request)
+        finally:
+            _current.reset(token)
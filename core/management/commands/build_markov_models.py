@@ -0,0 +1,25 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.utils import generators
+
+
+class Command(BaseCommand):
+    help = 'Trains the Markov name models for every corpus list and writes them to the models artifact.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default=settings.MARKOV_MODELS_PATH,
+                            help='Output path (default: settings.MARKOV_MODELS_PATH)')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        start = time.perf_counter()
+        count = generators.save_models(path)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {count} models to {path} ({os.path.getsize(path) / 1024:.0f} KiB) '
+            f'in {time.perf_counter() - start:.2f}s'
+        ))
@@ -0,0 +1,56 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.utils import loadtest
+
+
+class Command(BaseCommand):
+    help = ('Plays a running server with scripted virtual players and reports throughput, latency percentiles, '
+            'error rates and queries per request for every endpoint.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000',
+                            help='Server to test (default http://127.0.0.1:8000)')
+        parser.add_argument('--players', type=int, default=100, help='Virtual players (default 100)')
+        parser.add_argument('--duration', type=float, default=60,
+                            help='Seconds from the start until players stop (default 60)')
+        parser.add_argument('--ramp-up', type=float, default=10,
+                            help='Seconds over which players are started (default 10)')
+        parser.add_argument('--worlds', type=int, default=1,
+                            help='New worlds the players are spread over (default 1)')
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='Seconds between map update polls of a player (default 1)')
+        parser.add_argument('--travel-every', type=int, default=30,
+                            help='A player travels on average once per this many polls, 0 to never (default 30)')
+        parser.add_argument('--chat-every', type=int, default=60,
+                            help='A player chats on average once per this many polls, 0 to never (default 60)')
+        parser.add_argument('--output', default=None,
+                            help='Also write the results as JSON to this path, to compare runs')
+
+    def handle(self, *args, **options):
+        results = loadtest.run_load_test(base_url=options['url'], players=options['players'],
+                                         duration=options['duration'], ramp_up=options['ramp_up'],
+                                         worlds=options['worlds'], poll_interval=options['poll_interval'],
+                                         travel_every=options['travel_every'], chat_every=options['chat_every'])
+
+        self.stdout.write(f"{'endpoint':<22} {'requests':>9} {'req/s':>8} {'errors':>7} {'p50 ms':>8} "
+                          f"{'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'queries':>8}")
+
+        for endpoint, r in results['endpoints'].items():
+            queries = '-' if r['queries'] is None else f"{r['queries']:.1f}"
+            self.stdout.write(f"{endpoint:<22} {r['requests']:>9} {r['rps']:>8.1f} {r['error_rate']:>7.1%} "
+                              f"{r['p50'] * 1000:>8.1f} {r['p95'] * 1000:>8.1f} {r['p99'] * 1000:>8.1f} "
+                              f"{r['max'] * 1000:>8.1f} {queries:>8}")
+
+        self.stdout.write(f"{results['players'] - results['failed_players']}/{results['players']} players set up "
+                          f"in {results['elapsed']:.1f}s (run {results['run_id']})")
+
+        for failure in results['failures']:
+            self.stdout.write(self.style.WARNING(failure))
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(results, f, indent=2)
+
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
@@ -0,0 +1,34 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.utils import benchmark
+
+
+class Command(BaseCommand):
+    help = 'Times the procedural generators over the fixed benchmark seeds and reports their allocations.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Timed passes over the seeds per generator (default 5)')
+        parser.add_argument('--case', action='append', dest='cases', choices=list(benchmark.CASES),
+                            help='Only run this case, can be given more than once (default: all)')
+        parser.add_argument('--output', default=None,
+                            help='Also write the results as JSON to this path, to compare runs')
+
+    def handle(self, *args, **options):
+        results = benchmark.run_benchmark(repeat=options['repeat'], cases=options['cases'])
+
+        self.stdout.write(f"{'case':<12} {'best ms':>9} {'mean ms':>9} {'per call ms':>12} "
+                          f"{'peak KiB':>9} {'retained KiB':>13}")
+
+        for name, r in results.items():
+            self.stdout.write(f"{name:<12} {r['best'] * 1000:>9.2f} {r['mean'] * 1000:>9.2f} "
+                              f"{r['per_call'] * 1000:>12.3f} {r['peak_bytes'] / 1024:>9.1f} "
+                              f"{r['retained_bytes'] / 1024:>13.1f}")
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump({'seeds': list(benchmark.SEEDS), 'results': results}, f, indent=2)
+
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
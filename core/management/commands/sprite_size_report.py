@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from core.utils import corpus
+from core.utils.procgen_svg import size_report
+
+
+class Command(BaseCommand):
+    help = 'Reports how many bytes the sprite optimization stage saves over a corpus of seeds.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=2000,
+                            help='Number of seeds, taken from the enemy name corpus (default 2000)')
+
+    def handle(self, *args, **options):
+        seeds = [word for key in corpus.keys() if key.endswith('.enemies') for word in corpus.words(key)]
+        report = size_report(seeds[:options['limit']])
+
+        def saved(before, after):
+            return f'{before} -> {after} bytes ({100 * (1 - after / max(before, 1)):.1f}% smaller)'
+
+        self.stdout.write(f"{report['sprites']} sprites")
+        self.stdout.write(f"raw:  {saved(report['raw_bytes'], report['compact_bytes'])}")
+        self.stdout.write(f"gzip: {saved(report['raw_gzip'], report['compact_gzip'])}")
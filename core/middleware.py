@@ -0,0 +1,37 @@
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+class QueryCountMiddleware:
+    """
+    Reports the database queries made while handling a request in an X-Query-Count response header, across every
+    database alias. Only installed when settings.QUERY_COUNT_HEADER is on, e.g. for the load test harness.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_COUNT_HEADER:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        count = 0
+
+        def counter(execute, sql, params, many, context):
+            nonlocal count
+            count += 1
+
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(counter))
+
+            response = self.get_response(request)
+
+        response['X-Query-Count'] = str(count)
+
+        return response
@@ -0,0 +1,87 @@
+"""
+Read replica routing.
+
+Replicas are listed in settings.DATABASE_READ_ALIASES. Nothing is sent to them implicitly: views opt selected pure
+reads in with `.using(read_db(request))`, so the alias is bound when the queryset is built and a lazy queryset still
+reads where it was meant to when the template evaluates it. Every write goes to the primary.
+
+Only reads that are complete on their own belong there, like the region's online players or a character list.
+Delta reads (rows created after a cursor such as the owner's last refresh) stay on the primary: the cursor moves
+on the primary, so a row that reached the primary before it but not yet the replica would be skipped for good.
+
+Read-your-writes: a successful non-GET request pins the user's session to the primary for
+settings.READ_YOUR_WRITES_WINDOW seconds, so a chat post, travel or character change is never followed by a read
+from a replica that has not caught up with it yet.
+"""
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+PIN_SESSION_KEY = '_read_primary_until'
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def read_db(request) -> str:
+    """
+    Database alias for the opted-in reads of a request: the primary while the user is pinned or without replicas,
+    otherwise a replica. A user always gets the same replica, so consecutive polls never go back in time.
+    Token authenticated API clients have no session to pin, nothing they read from a replica depends on their own
+    writes.
+    """
+    replicas = settings.DATABASE_READ_ALIASES
+
+    if not replicas or request.session.get(PIN_SESSION_KEY, 0) > time.time():
+        return DEFAULT_DB_ALIAS
+
+    # Token clients are only known from the authenticated user, checked after the session so views don't load it
+    user_id = request.session.get('_auth_user_id') or getattr(getattr(request, 'user', None), 'pk', None) or 0
+
+    return replicas[int(user_id) % len(replicas)]
+
+
+def pin_primary(request) -> None:
+    if settings.DATABASE_READ_ALIASES:
+        request.session[PIN_SESSION_KEY] = time.time() + settings.READ_YOUR_WRITES_WINDOW
+
+
+class ReplicaRouter:
+    """
+    Writes always go to the primary, including saves of instances that were read from a replica, and objects from
+    the primary and its replicas may be related to each other. Reads are left to Django's default routing.
+    """
+
+    def db_for_read(self, model, **hints):
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        dbs = {DEFAULT_DB_ALIAS, *settings.DATABASE_READ_ALIASES}
+
+        if obj1._state.db in dbs and obj2._state.db in dbs:
+            return True
+
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema through replication
+        if db in settings.DATABASE_READ_ALIASES:
+            return False
+
+        return None
+
+
+class ReadYourWritesMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400 and hasattr(request, 'session'):
+            pin_primary(request)
+
+        return response
@@ -1,3 +1,270 @@
-from django.test import TestCase
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.http import HttpResponse
+from django.test import SimpleTestCase, RequestFactory, override_settings
+
+from authentication.models import User
+from core import identity, replicas
+from core.utils import benchmark, generators, loadtest
+from core.utils.procgen_svg import EntitySpriteGenerator, render_abstract_entity
+from world import gamedata
+from world.models import Location, Player, PlayerState
+
+# Output digests of every procgen case per seed, see core/utils/benchmark.py.
+# A change here changes the worlds, dungeons and enemies generated for existing seeds, so only regenerate them with
+# benchmark.golden_digests() when that is intended.
+GOLDEN = {
+    'markov': {
+        'alpha': '54781f0bd8022016bbb054ad09984ab0',
+        'Bravo World': 'fd2125f12aa022f549971cc4c46b7a55',
+        'x': 'd9ff61b36ed37d1f588ee07e4dcd9525',
+        'Dred Calen': 'c9978d718aebcdada0e7c68c7f839a91',
+        '12345': 'b4e82e8107525b2a26826ee50d61142c',
+        'qumud': 'f4ca7e6a0c4f3bdd9a46b404afee515c',
+        'Ülmheim': '058115b4bb6944808a072e2baa18bb03',
+        'a much longer world seed': 'd0914921669f3033df8610b9fcc4d856',
+    },
+    'town': {
+        'alpha': 'd70bdd63f6b605a10eb2f69a5f00079e',
+        'Bravo World': 'cbc933c1703c632169e64a07059ba4e4',
+        'x': '316c0458604e6127fb57f7cbb9c97853',
+        'Dred Calen': 'd93e0e0145be14e946dd0aad4bbfcd99',
+        '12345': '605345de2a160c2cb1371a18910336fa',
+        'qumud': '873573555af08414ccc4ced7b0f13368',
+        'Ülmheim': '104f8689412d288863744782a6e0c569',
+        'a much longer world seed': '55d032eb8856045af2e711d4c747fd93',
+    },
+    'dungeons': {
+        'alpha': '647d7c74bba7848d14c110fda88ff046',
+        'Bravo World': 'e07ed24646633df27f1a9d93d5557c18',
+        'x': '70938d658b9a4360883f4d5b80ac636f',
+        'Dred Calen': 'e5f8fc4f4ffa98d3706992479e59e23e',
+        '12345': '74e8e069d93592602b8a9c5436265360',
+        'qumud': '49784f08a66189c97e7163f3a86516a7',
+        'Ülmheim': '2e223bddf9015d9cdcac2234c992b101',
+        'a much longer world seed': '4c9c81d2bf05805e31199ed317a14db4',
+    },
+    'region': {
+        'alpha': '2b287484f0f7dc5343288e0835c7d59e',
+        'Bravo World': '418e90ab711c97e0881efc8e23566da2',
+        'x': 'a4a3dc6043bca3d27e6548338f3912cb',
+        'Dred Calen': '2be910f505cb918f1383ee79d41604ec',
+        '12345': 'ca20394cc4c2f95f01c61876038abeff',
+        'qumud': '76b1ac56135f87fb001fe57724e1bfc8',
+        'Ülmheim': '23efb46c2cb26ae3e7c62822a3bd0a8a',
+        'a much longer world seed': '1b6342bca8a9cf6a263baff8568b5417',
+    },
+    'enemies': {
+        'alpha': 'b3a44b0c22b19762d99568a4ff2582c9',
+        'Bravo World': 'e98ef49c19464f1103d4b9d77cafe318',
+        'x': '13a18ad593bd1ae69747b53645497871',
+        'Dred Calen': '9ce21b309b8a6678c5d96d18eacba983',
+        '12345': '2148f500466304519508a9b660f9e00e',
+        'qumud': '883e99fd2d82f947ee548ede14befcf5',
+        'Ülmheim': 'cb648dd993b9219048956c404b76b624',
+        'a much longer world seed': '4068a9b9f9d3b3f5466bde67b873d2b8',
+    },
+    'svg': {
+        'alpha': '30bb2b06bb5c37f4b25e2a4e7a8984b6',
+        'Bravo World': '7f2f79ad1411571410cac4f7339331be',
+        'x': 'd188051ec1070d4b51e07b337b3a1354',
+        'Dred Calen': '676ff48201323cd0837cb70b5b8f64c8',
+        '12345': '98926b576e1a51117c359da75b01ca39',
+        'qumud': 'fba8c1f67b7dfe8a5cddecf5154eb4f8',
+        'Ülmheim': 'd516b50989e853ce0beb81ddf2dadb66',
+        'a much longer world seed': '9d37350ea72f0a6f748616cf1a12a887',
+    },
+    'svg_compact': {
+        'alpha': 'a5d1685bd14a57150fc9fb3b51f21078',
+        'Bravo World': '25d872de06f807c8f465cde30c7bb514',
+        'x': '2869190d19429fd641513498da6de5ca',
+        'Dred Calen': 'ac7458082d782559d0f1d3770eca0b07',
+        '12345': 'c99cf8e27be4b677447fcf5c6280cd62',
+        'qumud': '1b75b56ecfafddd2c51c8c2e6ea24a02',
+        'Ülmheim': '2f1e2d4a13a74fc09f5311565ae6e3d9',
+        'a much longer world seed': '705ed3c28330eed8cc1a74dda987f4c9',
+    },
+}
+
+
+class GoldenSeedTests(SimpleTestCase):
+    def test_cases_match_golden_digests(self):
+        self.assertEqual(set(GOLDEN), set(benchmark.CASES))
+
+        for name, case in benchmark.CASES.items():
+            for seed in benchmark.SEEDS:
+                with self.subTest(case=name, seed=seed):
+                    self.assertEqual(benchmark.digest(case(seed)), GOLDEN[name][seed])
+
+    def test_region_shape(self):
+        region = generators.generate_region(seed='alpha', level=1)
+
+        self.assertEqual(len(region['locations']['towns']), 1)
+        self.assertEqual(len(region['locations']['dungeons']), 5)
+        self.assertTrue(all(1 <= d['level'] <= 4 for d in region['locations']['dungeons']))
+
+    def test_generation_is_thread_safe(self):
+        seeds = list(benchmark.SEEDS) * 4
+        expected = [generators.generate_region(seed=seed, level=1) for seed in seeds]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda seed: generators.generate_region(seed=seed, level=1), seeds))
+
+        self.assertEqual(results, expected)
+
+    def test_sprite_batch_matches_single_renders(self):
+        seeds = ['alpha', 'x', 'alpha', 'qumud']
+        sprites = EntitySpriteGenerator(cache_size=2).generate_many(seeds)
+
+        self.assertEqual(sprites, [render_abstract_entity(seed) for seed in seeds])
+
+
+class BenchmarkTests(SimpleTestCase):
+    def test_benchmark_reports_every_case(self):
+        results = benchmark.run_benchmark(repeat=1, cases=['town', 'svg'])
+
+        self.assertEqual(set(results), {'town', 'svg'})
+        self.assertGreater(results['svg']['best'], 0)
+        self.assertGreater(results['svg']['peak_bytes'], 0)
+
+
+@override_settings(DATABASE_READ_ALIASES=['replica_1', 'replica_2'], READ_YOUR_WRITES_WINDOW=5)
+class ReplicaRoutingTests(SimpleTestCase):
+    def request(self, method='get', user_id='3'):
+        request = getattr(RequestFactory(), method)('/')
+        request.session = {'_auth_user_id': user_id}
+
+        return request
+
+    def test_reads_stick_to_one_replica_per_user(self):
+        self.assertEqual(replicas.read_db(self.request(user_id='3')), 'replica_2')
+        self.assertEqual(replicas.read_db(self.request(user_id='4')), 'replica_1')
+
+    def test_token_clients_are_spread_by_user(self):
+        request = self.request()
+        request.session = {}
+        request.user = SimpleNamespace(pk=3)
+
+        self.assertEqual(replicas.read_db(request), 'replica_2')
+
+    @override_settings(DATABASE_READ_ALIASES=[])
+    def test_without_replicas_reads_use_primary(self):
+        self.assertEqual(replicas.read_db(self.request()), 'default')
+
+    def test_writes_pin_reads_to_primary(self):
+        middleware = replicas.ReadYourWritesMiddleware(lambda request: HttpResponse())
+        request = self.request('post')
+        middleware(request)
+
+        self.assertEqual(replicas.read_db(request), 'default')
+
+        request.session[replicas.PIN_SESSION_KEY] = time.time() - 1
+        self.assertEqual(replicas.read_db(request), 'replica_2')
+
+    def test_failed_writes_and_reads_do_not_pin(self):
+        for method, status in (('get', 200), ('post', 400)):
+            request = self.request(method)
+            replicas.ReadYourWritesMiddleware(lambda request: HttpResponse(status=status))(request)
+
+            self.assertNotIn(replicas.PIN_SESSION_KEY, request.session)
+
+    def test_router_sends_writes_to_primary(self):
+        router = replicas.ReplicaRouter()
+
+        self.assertEqual(router.db_for_write(None), 'default')
+        self.assertFalse(router.allow_migrate('replica_1', 'world'))
+        self.assertIsNone(router.allow_migrate('default', 'world'))
+
+
+class LoadTestStatsTests(SimpleTestCase):
+    def test_summary_per_endpoint(self):
+        stats = loadtest.Stats()
+
+        for i in range(1, 101):
+            stats.record('poll', i / 1000, 200, 10)
+
+        stats.record('travel', 0.5, 500, None)
+        stats.record('travel', 0.1, None, None)
+        summary = stats.summary(elapsed=10)
+
+        self.assertEqual(summary['poll']['requests'], 100)
+        self.assertEqual(summary['poll']['p50'], 0.05)
+        self.assertEqual(summary['poll']['p99'], 0.099)
+        self.assertEqual(summary['poll']['queries'], 10)
+        self.assertEqual(summary['travel']['error_rate'], 1)
+        self.assertIsNone(summary['travel']['queries'])
+        self.assertEqual(summary['all']['requests'], 102)
+        self.assertEqual(summary['all']['rps'], 10.2)
+
+
+class IdentityMapTests(SimpleTestCase):
+    def setUp(self):
+        token = identity._current.set(identity.IdentityMap())
+        self.addCleanup(identity._current.reset, token)
+
+        self.player = Player(pk=1, xp=0, last_travel=0)
+        self.player.owner = User(pk=2, last_refresh=0)
+        self.player.state = PlayerState(player_id=1, health=10)
+        identity.track(self.player)
+
+    def test_records_reach_tracked_related_instances(self):
+        town = Location(pk=3, type='T')
+        identity.record(Player, 1, location=town, last_travel=5)
+        identity.record(PlayerState, 1, event=None, health=30)
+        identity.record_update([PlayerState(player_id=1, position=44)], ['position'])
+        identity.record(User, 9, last_refresh=5)
+
+        self.assertIs(self.player.location, town)
+        self.assertEqual(self.player.last_travel, 5)
+        self.assertEqual((self.player.state.health, self.player.state.position), (30, 44))
+        self.assertEqual(self.player.owner.last_refresh, 0)
+
+    def test_saves_of_other_instances_are_copied(self):
+        other = Player(pk=1, xp=50, level=2, last_travel=7)
+        identity.record_saved(Player, other, update_fields=['xp', 'level'])
+
+        self.assertEqual((self.player.xp, self.player.level), (50, 2))
+        self.assertEqual(self.player.last_travel, 0)
+
+    def test_no_map_outside_requests(self):
+        identity._current.set(None)
+        identity.record(Player, 1, xp=99)
+
+        self.assertEqual(self.player.xp, 0)
+
+
+class GameDataCacheTests(SimpleTestCase):
+    def dataset(self, version=1):
+        loads = []
+        dataset = gamedata.Dataset('test', version, lambda region_id: loads.append(region_id) or (region_id,))
+
+        return dataset, loads
+
+    def test_entries_load_once_until_invalidated(self):
+        for backend in ('local', 'shared'):
+            with self.subTest(backend=backend), override_settings(GAME_DATA_CACHE=backend):
+                dataset, loads = self.dataset()
+                dataset.invalidate(7)
+
+                self.assertEqual(dataset.get(7), (7,))
+                self.assertEqual(dataset.get(7), (7,))
+                self.assertEqual(loads, [7])
+
+                dataset.invalidate(7)
+                dataset.get(7)
+                dataset.get(8)
+
+                self.assertEqual(loads, [7, 7, 8])
+
+    def test_versions_do_not_share_entries(self):
+        self.assertNotEqual(self.dataset(1)[0].key(7), self.dataset(2)[0].key(7))
+
+    def test_local_entries_expire(self):
+        backend = gamedata.LocalBackend()
+        backend.set('a', 1, timeout=60)
+        backend.set('b', 2, timeout=-1)
+
+        self.assertEqual(backend.get('a'), 1)
+        self.assertIsNone(backend.get('b'))
@@ -0,0 +1,99 @@
+"""
+Fixed-seed cases for the procedural generators, shared by the golden regression tests in core/tests.py and the
+`procgen_benchmark` management command.
+
+Every case maps a seed to a JSON-serializable result. `digest` hashes that result, so the tests can pin the exact
+output of each generator and `run_benchmark` can time and measure the same work.
+"""
+import json
+import time
+import hashlib
+import tracemalloc
+
+from . import corpus, generators
+from .markov import MarkovNameGenerator
+from .procgen_svg import render_abstract_entity, render_compact_entity
+
+SEEDS = ('alpha', 'Bravo World', 'x', 'Dred Calen', '12345', 'qumud', 'Ülmheim', 'a much longer world seed')
+
+
+def _markov(seed: str) -> list[str]:
+    gen = MarkovNameGenerator(order=generators.MARKOV_ORDER, seed=seed)
+    gen.fit(corpus.words('towns'))
+
+    return gen.generate_many(k=20, max_len=24, min_len=6)
+
+
+def _enemies(seed: str) -> dict:
+    return {biome: generators.procgen_enemies(seed=seed, biome=biome, count=5) for biome in corpus.biomes()}
+
+
+CASES = {
+    'markov': _markov,
+    'town': lambda seed: generators.generate_town(seed=seed, level=2),
+    'dungeons': lambda seed: generators.generate_dungeons(seed=seed, level=3, count=5),
+    'region': lambda seed: generators.generate_region(seed=seed, level=1),
+    'enemies': _enemies,
+    'svg': render_abstract_entity,
+    'svg_compact': render_compact_entity,
+}
+
+
+def digest(value) -> str:
+    return hashlib.md5(json.dumps(value, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+def golden_digests() -> dict[str, dict[str, str]]:
+    """
+    {case: {seed: digest}} for every case and seed, the values pinned by the regression tests.
+    """
+    return {name: {seed: digest(case(seed)) for seed in SEEDS} for name, case in CASES.items()}
+
+
+def run_benchmark(repeat: int = 5, cases: list[str] | None = None) -> dict[str, dict]:
+    """
+    Times every case over all seeds `repeat` times and measures one extra pass under tracemalloc.
+
+    Returns per case: best and mean seconds for a pass over the seeds, seconds per call, and the allocation peak
+    of the traced pass along with the bytes it left allocated. The svg cases call the renderers directly, so the
+    sprite cache does not hide their cost, and the Markov models are warmed first so training only shows up in the
+    `markov` case.
+    """
+    for key in corpus.keys():
+        generators.get_model(key)
+
+    results = {}
+
+    for name in cases or CASES:
+        case = CASES[name]
+        timings = []
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+
+            for seed in SEEDS:
+                case(seed)
+
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+
+            for seed in SEEDS:
+                case(seed)
+
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        results[name] = {
+            'best': min(timings),
+            'mean': sum(timings) / len(timings),
+            'per_call': min(timings) / len(SEEDS),
+            'peak_bytes': peak - before,
+            'retained_bytes': current - before,
+        }
+
+    return results
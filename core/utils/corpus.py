@@ -1,30 +1,97 @@
-CORPUS = {
-    'biomes': {
-        'D': {
-            'regions': ['Arid Dunes', 'Arid Desert', 'Arid Expanse', 'Arid Oasis', 'Arid Basin', 'Arid Flats', 'Arid Wastes', 'Arid Reach', 'Arid Sea', 'Arid Silt', 'Arid Badlands', 'Arid Arroyo', 'Arid Fan', 'Arid Mesa', 'White Dunes', 'White Desert', 'White Expanse', 'White Oasis', 'White Basin', 'White Flats', 'White Wastes', 'White Reach', 'White Sea', 'White Silt', 'White Badlands', 'White Arroyo', 'White Fan', 'White Mesa', 'Bone Dunes', 'Bone Desert', 'Bone Expanse', 'Bone Oasis', 'Bone Basin', 'Bone Flats', 'Bone Wastes', 'Bone Reach', 'Bone Sea', 'Bone Silt', 'Bone Badlands', 'Bone Arroyo', 'Bone Fan', 'Bone Mesa', 'Sand Dunes', 'Sand Desert', 'Sand Expanse', 'Sand Oasis', 'Sand Basin', 'Sand Flats', 'Sand Wastes', 'Sand Reach', 'Sand Sea', 'Sand Silt', 'Sand Badlands', 'Sand Arroyo', 'Sand Fan', 'Sand Mesa', 'Scorpion Dunes', 'Scorpion Desert', 'Scorpion Expanse', 'Scorpion Oasis', 'Scorpion Basin', 'Scorpion Flats', 'Scorpion Wastes', 'Scorpion Reach', 'Scorpion Sea', 'Scorpion Silt', 'Scorpion Badlands', 'Scorpion Arroyo', 'Scorpion Fan', 'Scorpion Mesa', 'Vulture Dunes', 'Vulture Desert', 'Vulture Expanse', 'Vulture Oasis', 'Vulture Basin', 'Vulture Flats', 'Vulture Wastes', 'Vulture Reach', 'Vulture Sea', 'Vulture Silt', 'Vulture Badlands', 'Vulture Arroyo', 'Vulture Fan', 'Vulture Mesa', 'Dusty Dunes', 'Dusty Desert', 'Dusty Expanse', 'Dusty Oasis', 'Dusty Basin', 'Dusty Flats', 'Dusty Wastes', 'Dusty Reach', 'Dusty Sea', 'Dusty Silt', 'Dusty Badlands', 'Dusty Arroyo', 'Dusty Fan', 'Dusty Mesa', 'Thirsty Dunes', 'Thirsty Desert', 'Thirsty Expanse', 'Thirsty Oasis', 'Thirsty Basin', 'Thirsty Flats', 'Thirsty Wastes', 'Thirsty Reach', 'Thirsty Sea', 'Thirsty Silt', 'Thirsty Badlands', 'Thirsty Arroyo', 'Thirsty Fan', 'Thirsty Mesa', 'Salt Dunes', 'Salt Desert', 'Salt Expanse', 'Salt Oasis', 'Salt Basin', 'Salt Flats', 'Salt Wastes', 'Salt Reach', 'Salt Sea', 'Salt Silt', 'Salt Badlands', 'Salt Arroyo', 'Salt Fan', 'Salt Mesa', 'Glass Dunes', 'Glass Desert', 'Glass Expanse', 'Glass Oasis', 'Glass Basin', 'Glass Flats', 'Glass Wastes', 'Glass Reach', 'Glass Sea', 'Glass Silt', 'Glass Badlands', 'Glass Arroyo', 'Glass Fan', 'Glass Mesa', 'Bleached Dunes', 'Bleached Desert', 'Bleached Expanse', 'Bleached Oasis', 'Bleached Basin', 'Bleached Flats', 'Bleached Wastes', 'Bleached Reach', 'Bleached Sea', 'Bleached Silt', 'Bleached Badlands', 'Bleached Arroyo', 'Bleached Fan', 'Bleached Mesa', 'Mirage Dunes', 'Mirage Desert', 'Mirage Expanse', 'Mirage Oasis', 'Mirage Basin', 'Mirage Flats', 'Mirage Wastes', 'Mirage Reach', 'Mirage Sea', 'Mirage Silt', 'Mirage Badlands', 'Mirage Arroyo', 'Mirage Fan', 'Mirage Mesa', 'Barren Dunes', 'Barren Desert', 'Barren Expanse', 'Barren Oasis', 'Barren Basin', 'Barren Flats', 'Barren Wastes', 'Barren Reach', 'Barren Sea', 'Barren Silt', 'Barren Badlands', 'Barren Arroyo', 'Barren Fan', 'Barren Mesa', 'Snake Dunes', 'Snake Desert', 'Snake Expanse', 'Snake Oasis', 'Snake Basin', 'Snake Flats', 'Snake Wastes', 'Snake Reach', 'Snake Sea', 'Snake Silt', 'Snake Badlands', 'Snake Arroyo', 'Snake Fan', 'Snake Mesa', 'Cactus Dunes', 'Cactus Desert', 'Cactus Expanse', 'Cactus Oasis', 'Cactus Basin', 'Cactus Flats', 'Cactus Wastes', 'Cactus Reach', 'Cactus Sea', 'Cactus Silt', 'Cactus Badlands', 'Cactus Arroyo', 'Cactus Fan', 'Cactus Mesa', 'Camel Dunes', 'Camel Desert', 'Camel Expanse', 'Camel Oasis', 'Camel Basin', 'Camel Flats', 'Camel Wastes', 'Camel Reach', 'Camel Sea', 'Camel Silt', 'Camel Badlands', 'Camel Arroyo', 'Camel Fan', 'Camel Mesa', 'Blistering Dunes', 'Barren Flatlands'],
-            'enemies': ['Dunes Dragon', 'Desert Dragon', 'Expanse Dragon', 'Oasis Dragon', 'Basin Dragon', 'Flats Dragon', 'Wastes Dragon', 'Reach Dragon', 'Sea Dragon', 'Silt Dragon', 'Badlands Dragon', 'Arroyo Dragon', 'Fan Dragon', 'Mesa Dragon', 'Dunes Drake', 'Desert Drake', 'Expanse Drake', 'Oasis Drake', 'Basin Drake', 'Flats Drake', 'Wastes Drake', 'Reach Drake', 'Sea Drake', 'Silt Drake', 'Badlands Drake', 'Arroyo Drake', 'Fan Drake', 'Mesa Drake', 'Dunes Ghost', 'Desert Ghost', 'Expanse Ghost', 'Oasis Ghost', 'Basin Ghost', 'Flats Ghost', 'Wastes Ghost', 'Reach Ghost', 'Sea Ghost', 'Silt Ghost', 'Badlands Ghost', 'Arroyo Ghost', 'Fan Ghost', 'Mesa Ghost', 'Dunes Ghoul', 'Desert Ghoul', 'Expanse Ghoul', 'Oasis Ghoul', 'Basin Ghoul', 'Flats Ghoul', 'Wastes Ghoul', 'Reach Ghoul', 'Sea Ghoul', 'Silt Ghoul', 'Badlands Ghoul', 'Arroyo Ghoul', 'Fan Ghoul', 'Mesa Ghoul', 'Dunes Zombie', 'Desert Zombie', 'Expanse Zombie', 'Oasis Zombie', 'Basin Zombie', 'Flats Zombie', 'Wastes Zombie', 'Reach Zombie', 'Sea Zombie', 'Silt Zombie', 'Badlands Zombie', 'Arroyo Zombie', 'Fan Zombie', 'Mesa Zombie', 'Dunes Werewolf', 'Desert Werewolf', 'Expanse Werewolf', 'Oasis Werewolf', 'Basin Werewolf', 'Flats Werewolf', 'Wastes Werewolf', 'Reach Werewolf', 'Sea Werewolf', 'Silt Werewolf', 'Badlands Werewolf', 'Arroyo Werewolf', 'Fan Werewolf', 'Mesa Werewolf', 'Dunes Warg', 'Desert Warg', 'Expanse Warg', 'Oasis Warg', 'Basin Warg', 'Flats Warg', 'Wastes Warg', 'Reach Warg', 'Sea Warg', 'Silt Warg', 'Badlands Warg', 'Arroyo Warg', 'Fan Warg', 'Mesa Warg', 'Dunes Orc', 'Desert Orc', 'Expanse Orc', 'Oasis Orc', 'Basin Orc', 'Flats Orc', 'Wastes Orc', 'Reach Orc', 'Sea Orc', 'Silt Orc', 'Badlands Orc', 'Arroyo Orc', 'Fan Orc', 'Mesa Orc', 'Dunes Troll', 'Desert Troll', 'Expanse Troll', 'Oasis Troll', 'Basin Troll', 'Flats Troll', 'Wastes Troll', 'Reach Troll', 'Sea Troll', 'Silt Troll', 'Badlands Troll', 'Arroyo Troll', 'Fan Troll', 'Mesa Troll', 'Dunes Goblin', 'Desert Goblin', 'Expanse Goblin', 'Oasis Goblin', 'Basin Goblin', 'Flats Goblin', 'Wastes Goblin', 'Reach Goblin', 'Sea Goblin', 'Silt Goblin', 'Badlands Goblin', 'Arroyo Goblin', 'Fan Goblin', 'Mesa Goblin', 'Dunes Undead', 'Desert Undead', 'Expanse Undead', 'Oasis Undead', 'Basin Undead', 'Flats Undead', 'Wastes Undead', 'Reach Undead', 'Sea Undead', 'Silt Undead', 'Badlands Undead', 'Arroyo Undead', 'Fan Undead', 'Mesa Undead', 'Dunes Mimic', 'Desert Mimic', 'Expanse Mimic', 'Oasis Mimic', 'Basin Mimic', 'Flats Mimic', 'Wastes Mimic', 'Reach Mimic', 'Sea Mimic', 'Silt Mimic', 'Badlands Mimic', 'Arroyo Mimic', 'Fan Mimic', 'Mesa Mimic', 'Dunes Chimera', 'Desert Chimera', 'Expanse Chimera', 'Oasis Chimera', 'Basin Chimera', 'Flats Chimera', 'Wastes Chimera', 'Reach Chimera', 'Sea Chimera', 'Silt Chimera', 'Badlands Chimera', 'Arroyo Chimera', 'Fan Chimera', 'Mesa Chimera', 'Dunes Unicorn', 'Desert Unicorn', 'Expanse Unicorn', 'Oasis Unicorn', 'Basin Unicorn', 'Flats Unicorn', 'Wastes Unicorn', 'Reach Unicorn', 'Sea Unicorn', 'Silt Unicorn', 'Badlands Unicorn', 'Arroyo Unicorn', 'Fan Unicorn', 'Mesa Unicorn', 'Dunes Pegasus', 'Desert Pegasus', 'Expanse Pegasus', 'Oasis Pegasus', 'Basin Pegasus', 'Flats Pegasus', 'Wastes Pegasus', 'Reach Pegasus', 'Sea Pegasus', 'Silt Pegasus', 'Badlands Pegasus', 'Arroyo Pegasus', 'Fan Pegasus', 'Mesa Pegasus', 'Dunes Griffon', 'Desert Griffon', 'Expanse Griffon', 'Oasis Griffon', 'Basin Griffon', 'Flats Griffon', 'Wastes Griffon', 'Reach Griffon', 'Sea Griffon', 'Silt Griffon', 'Badlands Griffon', 'Arroyo Griffon', 'Fan Griffon', 'Mesa Griffon', 'Dunes Slime', 'Desert Slime', 'Expanse Slime', 'Oasis Slime', 'Basin Slime', 'Flats Slime', 'Wastes Slime', 'Reach Slime', 'Sea Slime', 'Silt Slime', 'Badlands Slime', 'Arroyo Slime', 'Fan Slime', 'Mesa Slime', 'Dunes Golem', 'Desert Golem', 'Expanse Golem', 'Oasis Golem', 'Basin Golem', 'Flats Golem', 'Wastes Golem', 'Reach Golem', 'Sea Golem', 'Silt Golem', 'Badlands Golem', 'Arroyo Golem', 'Fan Golem', 'Mesa Golem', 'Dunes Lizardman', 'Desert Lizardman', 'Expanse Lizardman', 'Oasis Lizardman', 'Basin Lizardman', 'Flats Lizardman', 'Wastes Lizardman', 'Reach Lizardman', 'Sea Lizardman', 'Silt Lizardman', 'Badlands Lizardman', 'Arroyo Lizardman', 'Fan Lizardman', 'Mesa Lizardman', 'Dunes Hydra', 'Desert Hydra', 'Expanse Hydra', 'Oasis Hydra', 'Basin Hydra', 'Flats Hydra', 'Wastes Hydra', 'Reach Hydra', 'Sea Hydra', 'Silt Hydra', 'Badlands Hydra', 'Arroyo Hydra', 'Fan Hydra', 'Mesa Hydra', 'Dunes Basilisk', 'Desert Basilisk', 'Expanse Basilisk', 'Oasis Basilisk', 'Basin Basilisk', 'Flats Basilisk', 'Wastes Basilisk', 'Reach Basilisk', 'Sea Basilisk', 'Silt Basilisk', 'Badlands Basilisk', 'Arroyo Basilisk', 'Fan Basilisk', 'Mesa Basilisk', 'Dunes Cyclops', 'Desert Cyclops', 'Expanse Cyclops', 'Oasis Cyclops', 'Basin Cyclops', 'Flats Cyclops', 'Wastes Cyclops', 'Reach Cyclops', 'Sea Cyclops', 'Silt Cyclops', 'Badlands Cyclops', 'Arroyo Cyclops', 'Fan Cyclops', 'Mesa Cyclops', 'Dunes Wyvern', 'Desert Wyvern', 'Expanse Wyvern', 'Oasis Wyvern', 'Basin Wyvern', 'Flats Wyvern', 'Wastes Wyvern', 'Reach Wyvern', 'Sea Wyvern', 'Silt Wyvern', 'Badlands Wyvern', 'Arroyo Wyvern', 'Fan Wyvern', 'Mesa Wyvern', 'Dunes Centipede', 'Desert Centipede', 'Expanse Centipede', 'Oasis Centipede', 'Basin Centipede', 'Flats Centipede', 'Wastes Centipede', 'Reach Centipede', 'Sea Centipede', 'Silt Centipede', 'Badlands Centipede', 'Arroyo Centipede', 'Fan Centipede', 'Mesa Centipede', 'Dunes Spider', 'Desert Spider', 'Expanse Spider', 'Oasis Spider', 'Basin Spider', 'Flats Spider', 'Wastes Spider', 'Reach Spider', 'Sea Spider', 'Silt Spider', 'Badlands Spider', 'Arroyo Spider', 'Fan Spider', 'Mesa Spider', 'Dunes Gnoll', 'Desert Gnoll', 'Expanse Gnoll', 'Oasis Gnoll', 'Basin Gnoll', 'Flats Gnoll', 'Wastes Gnoll', 'Reach Gnoll', 'Sea Gnoll', 'Silt Gnoll', 'Badlands Gnoll', 'Arroyo Gnoll', 'Fan Gnoll', 'Mesa Gnoll', 'Dunes Yeti', 'Desert Yeti', 'Expanse Yeti', 'Oasis Yeti', 'Basin Yeti', 'Flats Yeti', 'Wastes Yeti', 'Reach Yeti', 'Sea Yeti', 'Silt Yeti', 'Badlands Yeti', 'Arroyo Yeti', 'Fan Yeti', 'Mesa Yeti', 'Dunes Skeleton', 'Desert Skeleton', 'Expanse Skeleton', 'Oasis Skeleton', 'Basin Skeleton', 'Flats Skeleton', 'Wastes Skeleton', 'Reach Skeleton', 'Sea Skeleton', 'Silt Skeleton', 'Badlands Skeleton', 'Arroyo Skeleton', 'Fan Skeleton', 'Mesa Skeleton', 'Dunes Demon', 'Desert Demon', 'Expanse Demon', 'Oasis Demon', 'Basin Demon', 'Flats Demon', 'Wastes Demon', 'Reach Demon', 'Sea Demon', 'Silt Demon', 'Badlands Demon', 'Arroyo Demon', 'Fan Demon', 'Mesa Demon', 'Dunes Devil', 'Desert Devil', 'Expanse Devil', 'Oasis Devil', 'Basin Devil', 'Flats Devil', 'Wastes Devil', 'Reach Devil', 'Sea Devil', 'Silt Devil', 'Badlands Devil', 'Arroyo Devil', 'Fan Devil', 'Mesa Devil', 'Dunes Kraken', 'Desert Kraken', 'Expanse Kraken', 'Oasis Kraken', 'Basin Kraken', 'Flats Kraken', 'Wastes Kraken', 'Reach Kraken', 'Sea Kraken', 'Silt Kraken', 'Badlands Kraken', 'Arroyo Kraken', 'Fan Kraken', 'Mesa Kraken', 'Dunes Lich', 'Desert Lich', 'Expanse Lich', 'Oasis Lich', 'Basin Lich', 'Flats Lich', 'Wastes Lich', 'Reach Lich', 'Sea Lich', 'Silt Lich', 'Badlands Lich', 'Arroyo Lich', 'Fan Lich', 'Mesa Lich', 'Dunes Balrog', 'Desert Balrog', 'Expanse Balrog', 'Oasis Balrog', 'Basin Balrog', 'Flats Balrog', 'Wastes Balrog', 'Reach Balrog', 'Sea Balrog', 'Silt Balrog', 'Badlands Balrog', 'Arroyo Balrog', 'Fan Balrog', 'Mesa Balrog', 'Dunes Ent', 'Desert Ent', 'Expanse Ent', 'Oasis Ent', 'Basin Ent', 'Flats Ent', 'Wastes Ent', 'Reach Ent', 'Sea Ent', 'Silt Ent', 'Badlands Ent', 'Arroyo Ent', 'Fan Ent', 'Mesa Ent', 'Dunes Dryad', 'Desert Dryad', 'Expanse Dryad', 'Oasis Dryad', 'Basin Dryad', 'Flats Dryad', 'Wastes Dryad', 'Reach Dryad', 'Sea Dryad', 'Silt Dryad', 'Badlands Dryad', 'Arroyo Dryad', 'Fan Dryad', 'Mesa Dryad', 'Dunes Giant', 'Desert Giant', 'Expanse Giant', 'Oasis Giant', 'Basin Giant', 'Flats Giant', 'Wastes Giant', 'Reach Giant', 'Sea Giant', 'Silt Giant', 'Badlands Giant', 'Arroyo Giant', 'Fan Giant', 'Mesa Giant', 'Dunes Ettin', 'Desert Ettin', 'Expanse Ettin', 'Oasis Ettin', 'Basin Ettin', 'Flats Ettin', 'Wastes Ettin', 'Reach Ettin', 'Sea Ettin', 'Silt Ettin', 'Badlands Ettin', 'Arroyo Ettin', 'Fan Ettin', 'Mesa Ettin', 'Dunes Treant', 'Desert Treant', 'Expanse Treant', 'Oasis Treant', 'Basin Treant', 'Flats Treant', 'Wastes Treant', 'Reach Treant', 'Sea Treant', 'Silt Treant', 'Badlands Treant', 'Arroyo Treant', 'Fan Treant', 'Mesa Treant', 'Dunes Ogre', 'Desert Ogre', 'Expanse Ogre', 'Oasis Ogre', 'Basin Ogre', 'Flats Ogre', 'Wastes Ogre', 'Reach Ogre', 'Sea Ogre', 'Silt Ogre', 'Badlands Ogre', 'Arroyo Ogre', 'Fan Ogre', 'Mesa Ogre', 'Dunes Wraith', 'Desert Wraith', 'Expanse Wraith', 'Oasis Wraith', 'Basin Wraith', 'Flats Wraith', 'Wastes Wraith', 'Reach Wraith', 'Sea Wraith', 'Silt Wraith', 'Badlands Wraith', 'Arroyo Wraith', 'Fan Wraith', 'Mesa Wraith', 'Dunes Banshee', 'Desert Banshee', 'Expanse Banshee', 'Oasis Banshee', 'Basin Banshee', 'Flats Banshee', 'Wastes Banshee', 'Reach Banshee', 'Sea Banshee', 'Silt Banshee', 'Badlands Banshee', 'Arroyo Banshee', 'Fan Banshee', 'Mesa Banshee', 'Dunes Vampire', 'Desert Vampire', 'Expanse Vampire', 'Oasis Vampire', 'Basin Vampire', 'Flats Vampire', 'Wastes Vampire', 'Reach Vampire', 'Sea Vampire', 'Silt Vampire', 'Badlands Vampire', 'Arroyo Vampire', 'Fan Vampire', 'Mesa Vampire', 'Dunes Mummy', 'Desert Mummy', 'Expanse Mummy', 'Oasis Mummy', 'Basin Mummy', 'Flats Mummy', 'Wastes Mummy', 'Reach Mummy', 'Sea Mummy', 'Silt Mummy', 'Badlands Mummy', 'Arroyo Mummy', 'Fan Mummy', 'Mesa Mummy', 'Dunes Specter', 'Desert Specter', 'Expanse Specter', 'Oasis Specter', 'Basin Specter', 'Flats Specter', 'Wastes Specter', 'Reach Specter', 'Sea Specter', 'Silt Specter', 'Badlands Specter', 'Arroyo Specter', 'Fan Specter', 'Mesa Specter', 'Dunes Kobold', 'Desert Kobold', 'Expanse Kobold', 'Oasis Kobold', 'Basin Kobold', 'Flats Kobold', 'Wastes Kobold', 'Reach Kobold', 'Sea Kobold', 'Silt Kobold', 'Badlands Kobold', 'Arroyo Kobold', 'Fan Kobold', 'Mesa Kobold', 'Dunes Minotaur', 'Desert Minotaur', 'Expanse Minotaur', 'Oasis Minotaur', 'Basin Minotaur', 'Flats Minotaur', 'Wastes Minotaur', 'Reach Minotaur', 'Sea Minotaur', 'Silt Minotaur', 'Badlands Minotaur', 'Arroyo Minotaur', 'Fan Minotaur', 'Mesa Minotaur', 'Dunes Harpy', 'Desert Harpy', 'Expanse Harpy', 'Oasis Harpy', 'Basin Harpy', 'Flats Harpy', 'Wastes Harpy', 'Reach Harpy', 'Sea Harpy', 'Silt Harpy', 'Badlands Harpy', 'Arroyo Harpy', 'Fan Harpy', 'Mesa Harpy', 'Dunes Sphinx', 'Desert Sphinx', 'Expanse Sphinx', 'Oasis Sphinx', 'Basin Sphinx', 'Flats Sphinx', 'Wastes Sphinx', 'Reach Sphinx', 'Sea Sphinx', 'Silt Sphinx', 'Badlands Sphinx', 'Arroyo Sphinx', 'Fan Sphinx', 'Mesa Sphinx', 'Dunes Serpent', 'Desert Serpent', 'Expanse Serpent', 'Oasis Serpent', 'Basin Serpent', 'Flats Serpent', 'Wastes Serpent', 'Reach Serpent', 'Sea Serpent', 'Silt Serpent', 'Badlands Serpent', 'Arroyo Serpent', 'Fan Serpent', 'Mesa Serpent', 'Dunes Beast', 'Desert Beast', 'Expanse Beast', 'Oasis Beast', 'Basin Beast', 'Flats Beast', 'Wastes Beast', 'Reach Beast', 'Sea Beast', 'Silt Beast', 'Badlands Beast', 'Arroyo Beast', 'Fan Beast', 'Mesa Beast', 'Glittering Scarab', 'Focused Crystal']
-        },
-        'F': {
-            'regions': ['Shrouded Forest', 'Shrouded Woods', 'Shrouded Orchard', 'Shrouded Thicket', 'Shrouded Woodland', 'Shrouded Pines', 'Shrouded Oaks', 'Shrouded Arbor', 'Shrouded Brush', 'Shrouded Grove', 'Shrouded Timberland', 'Shrouded Jungle', 'Shrouded Rainforest', 'Shrouded Copse', 'Shrouded Covert', 'Shrouded Growth', 'Foggy Forest', 'Foggy Woods', 'Foggy Orchard', 'Foggy Thicket', 'Foggy Woodland', 'Foggy Pines', 'Foggy Oaks', 'Foggy Arbor', 'Foggy Brush', 'Foggy Grove', 'Foggy Timberland', 'Foggy Jungle', 'Foggy Rainforest', 'Foggy Copse', 'Foggy Covert', 'Foggy Growth', 'Evergreen Forest', 'Evergreen Woods', 'Evergreen Orchard', 'Evergreen Thicket', 'Evergreen Woodland', 'Evergreen Pines', 'Evergreen Oaks', 'Evergreen Arbor', 'Evergreen Brush', 'Evergreen Grove', 'Evergreen Timberland', 'Evergreen Jungle', 'Evergreen Rainforest', 'Evergreen Copse', 'Evergreen Covert', 'Evergreen Growth', 'Cedar Forest', 'Cedar Woods', 'Cedar Orchard', 'Cedar Thicket', 'Cedar Woodland', 'Cedar Pines', 'Cedar Oaks', 'Cedar Arbor', 'Cedar Brush', 'Cedar Grove', 'Cedar Timberland', 'Cedar Jungle', 'Cedar Rainforest', 'Cedar Copse', 'Cedar Covert', 'Cedar Growth', 'Wolf Forest', 'Wolf Woods', 'Wolf Orchard', 'Wolf Thicket', 'Wolf Woodland', 'Wolf Pines', 'Wolf Oaks', 'Wolf Arbor', 'Wolf Brush', 'Wolf Grove', 'Wolf Timberland', 'Wolf Jungle', 'Wolf Rainforest', 'Wolf Copse', 'Wolf Covert', 'Wolf Growth', 'Deer Forest', 'Deer Woods', 'Deer Orchard', 'Deer Thicket', 'Deer Woodland', 'Deer Pines', 'Deer Oaks', 'Deer Arbor', 'Deer Brush', 'Deer Grove', 'Deer Timberland', 'Deer Jungle', 'Deer Rainforest', 'Deer Copse', 'Deer Covert', 'Deer Growth', 'Grizzly Forest', 'Grizzly Woods', 'Grizzly Orchard', 'Grizzly Thicket', 'Grizzly Woodland', 'Grizzly Pines', 'Grizzly Oaks', 'Grizzly Arbor', 'Grizzly Brush', 'Grizzly Grove', 'Grizzly Timberland', 'Grizzly Jungle', 'Grizzly Rainforest', 'Grizzly Copse', 'Grizzly Covert', 'Grizzly Growth', 'Verdant Forest', 'Verdant Woods', 'Verdant Orchard', 'Verdant Thicket', 'Verdant Woodland', 'Verdant Pines', 'Verdant Oaks', 'Verdant Arbor', 'Verdant Brush', 'Verdant Grove', 'Verdant Timberland', 'Verdant Jungle', 'Verdant Rainforest', 'Verdant Copse', 'Verdant Covert', 'Verdant Growth', 'Wild Forest', 'Wild Woods', 'Wild Orchard', 'Wild Thicket', 'Wild Woodland', 'Wild Pines', 'Wild Oaks', 'Wild Arbor', 'Wild Brush', 'Wild Grove', 'Wild Timberland', 'Wild Jungle', 'Wild Rainforest', 'Wild Copse', 'Wild Covert', 'Wild Growth', 'Misty Grove', 'Lush Wood'],
-            'enemies': ['Forest Dragon', 'Woods Dragon', 'Orchard Dragon', 'Thicket Dragon', 'Woodland Dragon', 'Pines Dragon', 'Oaks Dragon', 'Arbor Dragon', 'Brush Dragon', 'Grove Dragon', 'Timberland Dragon', 'Jungle Dragon', 'Rainforest Dragon', 'Copse Dragon', 'Covert Dragon', 'Growth Dragon', 'Forest Drake', 'Woods Drake', 'Orchard Drake', 'Thicket Drake', 'Woodland Drake', 'Pines Drake', 'Oaks Drake', 'Arbor Drake', 'Brush Drake', 'Grove Drake', 'Timberland Drake', 'Jungle Drake', 'Rainforest Drake', 'Copse Drake', 'Covert Drake', 'Growth Drake', 'Forest Ghost', 'Woods Ghost', 'Orchard Ghost', 'Thicket Ghost', 'Woodland Ghost', 'Pines Ghost', 'Oaks Ghost', 'Arbor Ghost', 'Brush Ghost', 'Grove Ghost', 'Timberland Ghost', 'Jungle Ghost', 'Rainforest Ghost', 'Copse Ghost', 'Covert Ghost', 'Growth Ghost', 'Forest Ghoul', 'Woods Ghoul', 'Orchard Ghoul', 'Thicket Ghoul', 'Woodland Ghoul', 'Pines Ghoul', 'Oaks Ghoul', 'Arbor Ghoul', 'Brush Ghoul', 'Grove Ghoul', 'Timberland Ghoul', 'Jungle Ghoul', 'Rainforest Ghoul', 'Copse Ghoul', 'Covert Ghoul', 'Growth Ghoul', 'Forest Zombie', 'Woods Zombie', 'Orchard Zombie', 'Thicket Zombie', 'Woodland Zombie', 'Pines Zombie', 'Oaks Zombie', 'Arbor Zombie', 'Brush Zombie', 'Grove Zombie', 'Timberland Zombie', 'Jungle Zombie', 'Rainforest Zombie', 'Copse Zombie', 'Covert Zombie', 'Growth Zombie', 'Forest Werewolf', 'Woods Werewolf', 'Orchard Werewolf', 'Thicket Werewolf', 'Woodland Werewolf', 'Pines Werewolf', 'Oaks Werewolf', 'Arbor Werewolf', 'Brush Werewolf', 'Grove Werewolf', 'Timberland Werewolf', 'Jungle Werewolf', 'Rainforest Werewolf', 'Copse Werewolf', 'Covert Werewolf', 'Growth Werewolf', 'Forest Warg', 'Woods Warg', 'Orchard Warg', 'Thicket Warg', 'Woodland Warg', 'Pines Warg', 'Oaks Warg', 'Arbor Warg', 'Brush Warg', 'Grove Warg', 'Timberland Warg', 'Jungle Warg', 'Rainforest Warg', 'Copse Warg', 'Covert Warg', 'Growth Warg', 'Forest Orc', 'Woods Orc', 'Orchard Orc', 'Thicket Orc', 'Woodland Orc', 'Pines Orc', 'Oaks Orc', 'Arbor Orc', 'Brush Orc', 'Grove Orc', 'Timberland Orc', 'Jungle Orc', 'Rainforest Orc', 'Copse Orc', 'Covert Orc', 'Growth Orc', 'Forest Troll', 'Woods Troll', 'Orchard Troll', 'Thicket Troll', 'Woodland Troll', 'Pines Troll', 'Oaks Troll', 'Arbor Troll', 'Brush Troll', 'Grove Troll', 'Timberland Troll', 'Jungle Troll', 'Rainforest Troll', 'Copse Troll', 'Covert Troll', 'Growth Troll', 'Forest Goblin', 'Woods Goblin', 'Orchard Goblin', 'Thicket Goblin', 'Woodland Goblin', 'Pines Goblin', 'Oaks Goblin', 'Arbor Goblin', 'Brush Goblin', 'Grove Goblin', 'Timberland Goblin', 'Jungle Goblin', 'Rainforest Goblin', 'Copse Goblin', 'Covert Goblin', 'Growth Goblin', 'Forest Undead', 'Woods Undead', 'Orchard Undead', 'Thicket Undead', 'Woodland Undead', 'Pines Undead', 'Oaks Undead', 'Arbor Undead', 'Brush Undead', 'Grove Undead', 'Timberland Undead', 'Jungle Undead', 'Rainforest Undead', 'Copse Undead', 'Covert Undead', 'Growth Undead', 'Forest Mimic', 'Woods Mimic', 'Orchard Mimic', 'Thicket Mimic', 'Woodland Mimic', 'Pines Mimic', 'Oaks Mimic', 'Arbor Mimic', 'Brush Mimic', 'Grove Mimic', 'Timberland Mimic', 'Jungle Mimic', 'Rainforest Mimic', 'Copse Mimic', 'Covert Mimic', 'Growth Mimic', 'Forest Chimera', 'Woods Chimera', 'Orchard Chimera', 'Thicket Chimera', 'Woodland Chimera', 'Pines Chimera', 'Oaks Chimera', 'Arbor Chimera', 'Brush Chimera', 'Grove Chimera', 'Timberland Chimera', 'Jungle Chimera', 'Rainforest Chimera', 'Copse Chimera', 'Covert Chimera', 'Growth Chimera', 'Forest Unicorn', 'Woods Unicorn', 'Orchard Unicorn', 'Thicket Unicorn', 'Woodland Unicorn', 'Pines Unicorn', 'Oaks Unicorn', 'Arbor Unicorn', 'Brush Unicorn', 'Grove Unicorn', 'Timberland Unicorn', 'Jungle Unicorn', 'Rainforest Unicorn', 'Copse Unicorn', 'Covert Unicorn', 'Growth Unicorn', 'Forest Pegasus', 'Woods Pegasus', 'Orchard Pegasus', 'Thicket Pegasus', 'Woodland Pegasus', 'Pines Pegasus', 'Oaks Pegasus', 'Arbor Pegasus', 'Brush Pegasus', 'Grove Pegasus', 'Timberland Pegasus', 'Jungle Pegasus', 'Rainforest Pegasus', 'Copse Pegasus', 'Covert Pegasus', 'Growth Pegasus', 'Forest Griffon', 'Woods Griffon', 'Orchard Griffon', 'Thicket Griffon', 'Woodland Griffon', 'Pines Griffon', 'Oaks Griffon', 'Arbor Griffon', 'Brush Griffon', 'Grove Griffon', 'Timberland Griffon', 'Jungle Griffon', 'Rainforest Griffon', 'Copse Griffon', 'Covert Griffon', 'Growth Griffon', 'Forest Slime', 'Woods Slime', 'Orchard Slime', 'Thicket Slime', 'Woodland Slime', 'Pines Slime', 'Oaks Slime', 'Arbor Slime', 'Brush Slime', 'Grove Slime', 'Timberland Slime', 'Jungle Slime', 'Rainforest Slime', 'Copse Slime', 'Covert Slime', 'Growth Slime', 'Forest Golem', 'Woods Golem', 'Orchard Golem', 'Thicket Golem', 'Woodland Golem', 'Pines Golem', 'Oaks Golem', 'Arbor Golem', 'Brush Golem', 'Grove Golem', 'Timberland Golem', 'Jungle Golem', 'Rainforest Golem', 'Copse Golem', 'Covert Golem', 'Growth Golem', 'Forest Lizardman', 'Woods Lizardman', 'Orchard Lizardman', 'Thicket Lizardman', 'Woodland Lizardman', 'Pines Lizardman', 'Oaks Lizardman', 'Arbor Lizardman', 'Brush Lizardman', 'Grove Lizardman', 'Timberland Lizardman', 'Jungle Lizardman', 'Rainforest Lizardman', 'Copse Lizardman', 'Covert Lizardman', 'Growth Lizardman', 'Forest Hydra', 'Woods Hydra', 'Orchard Hydra', 'Thicket Hydra', 'Woodland Hydra', 'Pines Hydra', 'Oaks Hydra', 'Arbor Hydra', 'Brush Hydra', 'Grove Hydra', 'Timberland Hydra', 'Jungle Hydra', 'Rainforest Hydra', 'Copse Hydra', 'Covert Hydra', 'Growth Hydra', 'Forest Basilisk', 'Woods Basilisk', 'Orchard Basilisk', 'Thicket Basilisk', 'Woodland Basilisk', 'Pines Basilisk', 'Oaks Basilisk', 'Arbor Basilisk', 'Brush Basilisk', 'Grove Basilisk', 'Timberland Basilisk', 'Jungle Basilisk', 'Rainforest Basilisk', 'Copse Basilisk', 'Covert Basilisk', 'Growth Basilisk', 'Forest Cyclops', 'Woods Cyclops', 'Orchard Cyclops', 'Thicket Cyclops', 'Woodland Cyclops', 'Pines Cyclops', 'Oaks Cyclops', 'Arbor Cyclops', 'Brush Cyclops', 'Grove Cyclops', 'Timberland Cyclops', 'Jungle Cyclops', 'Rainforest Cyclops', 'Copse Cyclops', 'Covert Cyclops', 'Growth Cyclops', 'Forest Wyvern', 'Woods Wyvern', 'Orchard Wyvern', 'Thicket Wyvern', 'Woodland Wyvern', 'Pines Wyvern', 'Oaks Wyvern', 'Arbor Wyvern', 'Brush Wyvern', 'Grove Wyvern', 'Timberland Wyvern', 'Jungle Wyvern', 'Rainforest Wyvern', 'Copse Wyvern', 'Covert Wyvern', 'Growth Wyvern', 'Forest Centipede', 'Woods Centipede', 'Orchard Centipede', 'Thicket Centipede', 'Woodland Centipede', 'Pines Centipede', 'Oaks Centipede', 'Arbor Centipede', 'Brush Centipede', 'Grove Centipede', 'Timberland Centipede', 'Jungle Centipede', 'Rainforest Centipede', 'Copse Centipede', 'Covert Centipede', 'Growth Centipede', 'Forest Spider', 'Woods Spider', 'Orchard Spider', 'Thicket Spider', 'Woodland Spider', 'Pines Spider', 'Oaks Spider', 'Arbor Spider', 'Brush Spider', 'Grove Spider', 'Timberland Spider', 'Jungle Spider', 'Rainforest Spider', 'Copse Spider', 'Covert Spider', 'Growth Spider', 'Forest Gnoll', 'Woods Gnoll', 'Orchard Gnoll', 'Thicket Gnoll', 'Woodland Gnoll', 'Pines Gnoll', 'Oaks Gnoll', 'Arbor Gnoll', 'Brush Gnoll', 'Grove Gnoll', 'Timberland Gnoll', 'Jungle Gnoll', 'Rainforest Gnoll', 'Copse Gnoll', 'Covert Gnoll', 'Growth Gnoll', 'Forest Yeti', 'Woods Yeti', 'Orchard Yeti', 'Thicket Yeti', 'Woodland Yeti', 'Pines Yeti', 'Oaks Yeti', 'Arbor Yeti', 'Brush Yeti', 'Grove Yeti', 'Timberland Yeti', 'Jungle Yeti', 'Rainforest Yeti', 'Copse Yeti', 'Covert Yeti', 'Growth Yeti', 'Forest Skeleton', 'Woods Skeleton', 'Orchard Skeleton', 'Thicket Skeleton', 'Woodland Skeleton', 'Pines Skeleton', 'Oaks Skeleton', 'Arbor Skeleton', 'Brush Skeleton', 'Grove Skeleton', 'Timberland Skeleton', 'Jungle Skeleton', 'Rainforest Skeleton', 'Copse Skeleton', 'Covert Skeleton', 'Growth Skeleton', 'Forest Demon', 'Woods Demon', 'Orchard Demon', 'Thicket Demon', 'Woodland Demon', 'Pines Demon', 'Oaks Demon', 'Arbor Demon', 'Brush Demon', 'Grove Demon', 'Timberland Demon', 'Jungle Demon', 'Rainforest Demon', 'Copse Demon', 'Covert Demon', 'Growth Demon', 'Forest Devil', 'Woods Devil', 'Orchard Devil', 'Thicket Devil', 'Woodland Devil', 'Pines Devil', 'Oaks Devil', 'Arbor Devil', 'Brush Devil', 'Grove Devil', 'Timberland Devil', 'Jungle Devil', 'Rainforest Devil', 'Copse Devil', 'Covert Devil', 'Growth Devil', 'Forest Kraken', 'Woods Kraken', 'Orchard Kraken', 'Thicket Kraken', 'Woodland Kraken', 'Pines Kraken', 'Oaks Kraken', 'Arbor Kraken', 'Brush Kraken', 'Grove Kraken', 'Timberland Kraken', 'Jungle Kraken', 'Rainforest Kraken', 'Copse Kraken', 'Covert Kraken', 'Growth Kraken', 'Forest Lich', 'Woods Lich', 'Orchard Lich', 'Thicket Lich', 'Woodland Lich', 'Pines Lich', 'Oaks Lich', 'Arbor Lich', 'Brush Lich', 'Grove Lich', 'Timberland Lich', 'Jungle Lich', 'Rainforest Lich', 'Copse Lich', 'Covert Lich', 'Growth Lich', 'Forest Balrog', 'Woods Balrog', 'Orchard Balrog', 'Thicket Balrog', 'Woodland Balrog', 'Pines Balrog', 'Oaks Balrog', 'Arbor Balrog', 'Brush Balrog', 'Grove Balrog', 'Timberland Balrog', 'Jungle Balrog', 'Rainforest Balrog', 'Copse Balrog', 'Covert Balrog', 'Growth Balrog', 'Forest Ent', 'Woods Ent', 'Orchard Ent', 'Thicket Ent', 'Woodland Ent', 'Pines Ent', 'Oaks Ent', 'Arbor Ent', 'Brush Ent', 'Grove Ent', 'Timberland Ent', 'Jungle Ent', 'Rainforest Ent', 'Copse Ent', 'Covert Ent', 'Growth Ent', 'Forest Dryad', 'Woods Dryad', 'Orchard Dryad', 'Thicket Dryad', 'Woodland Dryad', 'Pines Dryad', 'Oaks Dryad', 'Arbor Dryad', 'Brush Dryad', 'Grove Dryad', 'Timberland Dryad', 'Jungle Dryad', 'Rainforest Dryad', 'Copse Dryad', 'Covert Dryad', 'Growth Dryad', 'Forest Giant', 'Woods Giant', 'Orchard Giant', 'Thicket Giant', 'Woodland Giant', 'Pines Giant', 'Oaks Giant', 'Arbor Giant', 'Brush Giant', 'Grove Giant', 'Timberland Giant', 'Jungle Giant', 'Rainforest Giant', 'Copse Giant', 'Covert Giant', 'Growth Giant', 'Forest Ettin', 'Woods Ettin', 'Orchard Ettin', 'Thicket Ettin', 'Woodland Ettin', 'Pines Ettin', 'Oaks Ettin', 'Arbor Ettin', 'Brush Ettin', 'Grove Ettin', 'Timberland Ettin', 'Jungle Ettin', 'Rainforest Ettin', 'Copse Ettin', 'Covert Ettin', 'Growth Ettin', 'Forest Treant', 'Woods Treant', 'Orchard Treant', 'Thicket Treant', 'Woodland Treant', 'Pines Treant', 'Oaks Treant', 'Arbor Treant', 'Brush Treant', 'Grove Treant', 'Timberland Treant', 'Jungle Treant', 'Rainforest Treant', 'Copse Treant', 'Covert Treant', 'Growth Treant', 'Forest Ogre', 'Woods Ogre', 'Orchard Ogre', 'Thicket Ogre', 'Woodland Ogre', 'Pines Ogre', 'Oaks Ogre', 'Arbor Ogre', 'Brush Ogre', 'Grove Ogre', 'Timberland Ogre', 'Jungle Ogre', 'Rainforest Ogre', 'Copse Ogre', 'Covert Ogre', 'Growth Ogre', 'Forest Wraith', 'Woods Wraith', 'Orchard Wraith', 'Thicket Wraith', 'Woodland Wraith', 'Pines Wraith', 'Oaks Wraith', 'Arbor Wraith', 'Brush Wraith', 'Grove Wraith', 'Timberland Wraith', 'Jungle Wraith', 'Rainforest Wraith', 'Copse Wraith', 'Covert Wraith', 'Growth Wraith', 'Forest Banshee', 'Woods Banshee', 'Orchard Banshee', 'Thicket Banshee', 'Woodland Banshee', 'Pines Banshee', 'Oaks Banshee', 'Arbor Banshee', 'Brush Banshee', 'Grove Banshee', 'Timberland Banshee', 'Jungle Banshee', 'Rainforest Banshee', 'Copse Banshee', 'Covert Banshee', 'Growth Banshee', 'Forest Vampire', 'Woods Vampire', 'Orchard Vampire', 'Thicket Vampire', 'Woodland Vampire', 'Pines Vampire', 'Oaks Vampire', 'Arbor Vampire', 'Brush Vampire', 'Grove Vampire', 'Timberland Vampire', 'Jungle Vampire', 'Rainforest Vampire', 'Copse Vampire', 'Covert Vampire', 'Growth Vampire', 'Forest Mummy', 'Woods Mummy', 'Orchard Mummy', 'Thicket Mummy', 'Woodland Mummy', 'Pines Mummy', 'Oaks Mummy', 'Arbor Mummy', 'Brush Mummy', 'Grove Mummy', 'Timberland Mummy', 'Jungle Mummy', 'Rainforest Mummy', 'Copse Mummy', 'Covert Mummy', 'Growth Mummy', 'Forest Specter', 'Woods Specter', 'Orchard Specter', 'Thicket Specter', 'Woodland Specter', 'Pines Specter', 'Oaks Specter', 'Arbor Specter', 'Brush Specter', 'Grove Specter', 'Timberland Specter', 'Jungle Specter', 'Rainforest Specter', 'Copse Specter', 'Covert Specter', 'Growth Specter', 'Forest Kobold', 'Woods Kobold', 'Orchard Kobold', 'Thicket Kobold', 'Woodland Kobold', 'Pines Kobold', 'Oaks Kobold', 'Arbor Kobold', 'Brush Kobold', 'Grove Kobold', 'Timberland Kobold', 'Jungle Kobold', 'Rainforest Kobold', 'Copse Kobold', 'Covert Kobold', 'Growth Kobold', 'Forest Minotaur', 'Woods Minotaur', 'Orchard Minotaur', 'Thicket Minotaur', 'Woodland Minotaur', 'Pines Minotaur', 'Oaks Minotaur', 'Arbor Minotaur', 'Brush Minotaur', 'Grove Minotaur', 'Timberland Minotaur', 'Jungle Minotaur', 'Rainforest Minotaur', 'Copse Minotaur', 'Covert Minotaur', 'Growth Minotaur', 'Forest Harpy', 'Woods Harpy', 'Orchard Harpy', 'Thicket Harpy', 'Woodland Harpy', 'Pines Harpy', 'Oaks Harpy', 'Arbor Harpy', 'Brush Harpy', 'Grove Harpy', 'Timberland Harpy', 'Jungle Harpy', 'Rainforest Harpy', 'Copse Harpy', 'Covert Harpy', 'Growth Harpy', 'Forest Sphinx', 'Woods Sphinx', 'Orchard Sphinx', 'Thicket Sphinx', 'Woodland Sphinx', 'Pines Sphinx', 'Oaks Sphinx', 'Arbor Sphinx', 'Brush Sphinx', 'Grove Sphinx', 'Timberland Sphinx', 'Jungle Sphinx', 'Rainforest Sphinx', 'Copse Sphinx', 'Covert Sphinx', 'Growth Sphinx', 'Forest Serpent', 'Woods Serpent', 'Orchard Serpent', 'Thicket Serpent', 'Woodland Serpent', 'Pines Serpent', 'Oaks Serpent', 'Arbor Serpent', 'Brush Serpent', 'Grove Serpent', 'Timberland Serpent', 'Jungle Serpent', 'Rainforest Serpent', 'Copse Serpent', 'Covert Serpent', 'Growth Serpent', 'Forest Beast', 'Woods Beast', 'Orchard Beast', 'Thicket Beast', 'Woodland Beast', 'Pines Beast', 'Oaks Beast', 'Arbor Beast', 'Brush Beast', 'Grove Beast', 'Timberland Beast', 'Jungle Beast', 'Rainforest Beast', 'Copse Beast', 'Covert Beast', 'Growth Beast', 'Giant Boar', ]
-        },
-        'P': {
-            'regions': ['Grassy Plains', 'Grassy Prairie', 'Grassy Savanna', 'Grassy Steppe', 'Grassy Veldt', 'Grassy Floodplains', 'Grassy Meadow', 'Grassy Flats', 'Grassy Plateau', 'Grassy Grassland', 'Grassy Heath', 'Grassy Moor', 'Rolling Plains', 'Rolling Prairie', 'Rolling Savanna', 'Rolling Steppe', 'Rolling Veldt', 'Rolling Floodplains', 'Rolling Meadow', 'Rolling Flats', 'Rolling Plateau', 'Rolling Grassland', 'Rolling Heath', 'Rolling Moor', 'Buffalo Plains', 'Buffalo Prairie', 'Buffalo Savanna', 'Buffalo Steppe', 'Buffalo Veldt', 'Buffalo Floodplains', 'Buffalo Meadow', 'Buffalo Flats', 'Buffalo Plateau', 'Buffalo Grassland', 'Buffalo Heath', 'Buffalo Moor', 'Gazelle Plains', 'Gazelle Prairie', 'Gazelle Savanna', 'Gazelle Steppe', 'Gazelle Veldt', 'Gazelle Floodplains', 'Gazelle Meadow', 'Gazelle Flats', 'Gazelle Plateau', 'Gazelle Grassland', 'Gazelle Heath', 'Gazelle Moor', 'Coyote Plains', 'Coyote Prairie', 'Coyote Savanna', 'Coyote Steppe', 'Coyote Veldt', 'Coyote Floodplains', 'Coyote Meadow', 'Coyote Flats', 'Coyote Plateau', 'Coyote Grassland', 'Coyote Heath', 'Coyote Moor', 'Wheated Plains', 'Wheated Prairie', 'Wheated Savanna', 'Wheated Steppe', 'Wheated Veldt', 'Wheated Floodplains', 'Wheated Meadow', 'Wheated Flats', 'Wheated Plateau', 'Wheated Grassland', 'Wheated Heath', 'Wheated Moor', 'Windy Plains', 'Windy Prairie', 'Windy Savanna', 'Windy Steppe', 'Windy Veldt', 'Windy Floodplains', 'Windy Meadow', 'Windy Flats', 'Windy Plateau', 'Windy Grassland', 'Windy Heath', 'Windy Moor', 'Lush Plains', 'Lush Prairie', 'Lush Savanna', 'Lush Steppe', 'Lush Veldt', 'Lush Floodplains', 'Lush Meadow', 'Lush Flats', 'Lush Plateau', 'Lush Grassland', 'Lush Heath', 'Lush Moor', 'Sweeping Plains', 'Sweeping Prairie', 'Sweeping Savanna', 'Sweeping Steppe', 'Sweeping Veldt', 'Sweeping Floodplains', 'Sweeping Meadow', 'Sweeping Flats', 'Sweeping Plateau', 'Sweeping Grassland', 'Sweeping Heath', 'Sweeping Moor', 'Golden Plains', 'Golden Prairie', 'Golden Savanna', 'Golden Steppe', 'Golden Veldt', 'Golden Floodplains', 'Golden Meadow', 'Golden Flats', 'Golden Plateau', 'Golden Grassland', 'Golden Heath', 'Golden Moor'],
-            'enemies': ['Plains Dragon', 'Prairie Dragon', 'Savanna Dragon', 'Steppe Dragon', 'Veldt Dragon', 'Floodplains Dragon', 'Meadow Dragon', 'Flats Dragon', 'Plateau Dragon', 'Grassland Dragon', 'Heath Dragon', 'Moor Dragon', 'Plains Drake', 'Prairie Drake', 'Savanna Drake', 'Steppe Drake', 'Veldt Drake', 'Floodplains Drake', 'Meadow Drake', 'Flats Drake', 'Plateau Drake', 'Grassland Drake', 'Heath Drake', 'Moor Drake', 'Plains Ghost', 'Prairie Ghost', 'Savanna Ghost', 'Steppe Ghost', 'Veldt Ghost', 'Floodplains Ghost', 'Meadow Ghost', 'Flats Ghost', 'Plateau Ghost', 'Grassland Ghost', 'Heath Ghost', 'Moor Ghost', 'Plains Ghoul', 'Prairie Ghoul', 'Savanna Ghoul', 'Steppe Ghoul', 'Veldt Ghoul', 'Floodplains Ghoul', 'Meadow Ghoul', 'Flats Ghoul', 'Plateau Ghoul', 'Grassland Ghoul', 'Heath Ghoul', 'Moor Ghoul', 'Plains Zombie', 'Prairie Zombie', 'Savanna Zombie', 'Steppe Zombie', 'Veldt Zombie', 'Floodplains Zombie', 'Meadow Zombie', 'Flats Zombie', 'Plateau Zombie', 'Grassland Zombie', 'Heath Zombie', 'Moor Zombie', 'Plains Werewolf', 'Prairie Werewolf', 'Savanna Werewolf', 'Steppe Werewolf', 'Veldt Werewolf', 'Floodplains Werewolf', 'Meadow Werewolf', 'Flats Werewolf', 'Plateau Werewolf', 'Grassland Werewolf', 'Heath Werewolf', 'Moor Werewolf', 'Plains Warg', 'Prairie Warg', 'Savanna Warg', 'Steppe Warg', 'Veldt Warg', 'Floodplains Warg', 'Meadow Warg', 'Flats Warg', 'Plateau Warg', 'Grassland Warg', 'Heath Warg', 'Moor Warg', 'Plains Orc', 'Prairie Orc', 'Savanna Orc', 'Steppe Orc', 'Veldt Orc', 'Floodplains Orc', 'Meadow Orc', 'Flats Orc', 'Plateau Orc', 'Grassland Orc', 'Heath Orc', 'Moor Orc', 'Plains Troll', 'Prairie Troll', 'Savanna Troll', 'Steppe Troll', 'Veldt Troll', 'Floodplains Troll', 'Meadow Troll', 'Flats Troll', 'Plateau Troll', 'Grassland Troll', 'Heath Troll', 'Moor Troll', 'Plains Goblin', 'Prairie Goblin', 'Savanna Goblin', 'Steppe Goblin', 'Veldt Goblin', 'Floodplains Goblin', 'Meadow Goblin', 'Flats Goblin', 'Plateau Goblin', 'Grassland Goblin', 'Heath Goblin', 'Moor Goblin', 'Plains Undead', 'Prairie Undead', 'Savanna Undead', 'Steppe Undead', 'Veldt Undead', 'Floodplains Undead', 'Meadow Undead', 'Flats Undead', 'Plateau Undead', 'Grassland Undead', 'Heath Undead', 'Moor Undead', 'Plains Mimic', 'Prairie Mimic', 'Savanna Mimic', 'Steppe Mimic', 'Veldt Mimic', 'Floodplains Mimic', 'Meadow Mimic', 'Flats Mimic', 'Plateau Mimic', 'Grassland Mimic', 'Heath Mimic', 'Moor Mimic', 'Plains Chimera', 'Prairie Chimera', 'Savanna Chimera', 'Steppe Chimera', 'Veldt Chimera', 'Floodplains Chimera', 'Meadow Chimera', 'Flats Chimera', 'Plateau Chimera', 'Grassland Chimera', 'Heath Chimera', 'Moor Chimera', 'Plains Unicorn', 'Prairie Unicorn', 'Savanna Unicorn', 'Steppe Unicorn', 'Veldt Unicorn', 'Floodplains Unicorn', 'Meadow Unicorn', 'Flats Unicorn', 'Plateau Unicorn', 'Grassland Unicorn', 'Heath Unicorn', 'Moor Unicorn', 'Plains Pegasus', 'Prairie Pegasus', 'Savanna Pegasus', 'Steppe Pegasus', 'Veldt Pegasus', 'Floodplains Pegasus', 'Meadow Pegasus', 'Flats Pegasus', 'Plateau Pegasus', 'Grassland Pegasus', 'Heath Pegasus', 'Moor Pegasus', 'Plains Griffon', 'Prairie Griffon', 'Savanna Griffon', 'Steppe Griffon', 'Veldt Griffon', 'Floodplains Griffon', 'Meadow Griffon', 'Flats Griffon', 'Plateau Griffon', 'Grassland Griffon', 'Heath Griffon', 'Moor Griffon', 'Plains Slime', 'Prairie Slime', 'Savanna Slime', 'Steppe Slime', 'Veldt Slime', 'Floodplains Slime', 'Meadow Slime', 'Flats Slime', 'Plateau Slime', 'Grassland Slime', 'Heath Slime', 'Moor Slime', 'Plains Golem', 'Prairie Golem', 'Savanna Golem', 'Steppe Golem', 'Veldt Golem', 'Floodplains Golem', 'Meadow Golem', 'Flats Golem', 'Plateau Golem', 'Grassland Golem', 'Heath Golem', 'Moor Golem', 'Plains Lizardman', 'Prairie Lizardman', 'Savanna Lizardman', 'Steppe Lizardman', 'Veldt Lizardman', 'Floodplains Lizardman', 'Meadow Lizardman', 'Flats Lizardman', 'Plateau Lizardman', 'Grassland Lizardman', 'Heath Lizardman', 'Moor Lizardman', 'Plains Hydra', 'Prairie Hydra', 'Savanna Hydra', 'Steppe Hydra', 'Veldt Hydra', 'Floodplains Hydra', 'Meadow Hydra', 'Flats Hydra', 'Plateau Hydra', 'Grassland Hydra', 'Heath Hydra', 'Moor Hydra', 'Plains Basilisk', 'Prairie Basilisk', 'Savanna Basilisk', 'Steppe Basilisk', 'Veldt Basilisk', 'Floodplains Basilisk', 'Meadow Basilisk', 'Flats Basilisk', 'Plateau Basilisk', 'Grassland Basilisk', 'Heath Basilisk', 'Moor Basilisk', 'Plains Cyclops', 'Prairie Cyclops', 'Savanna Cyclops', 'Steppe Cyclops', 'Veldt Cyclops', 'Floodplains Cyclops', 'Meadow Cyclops', 'Flats Cyclops', 'Plateau Cyclops', 'Grassland Cyclops', 'Heath Cyclops', 'Moor Cyclops', 'Plains Wyvern', 'Prairie Wyvern', 'Savanna Wyvern', 'Steppe Wyvern', 'Veldt Wyvern', 'Floodplains Wyvern', 'Meadow Wyvern', 'Flats Wyvern', 'Plateau Wyvern', 'Grassland Wyvern', 'Heath Wyvern', 'Moor Wyvern', 'Plains Centipede', 'Prairie Centipede', 'Savanna Centipede', 'Steppe Centipede', 'Veldt Centipede', 'Floodplains Centipede', 'Meadow Centipede', 'Flats Centipede', 'Plateau Centipede', 'Grassland Centipede', 'Heath Centipede', 'Moor Centipede', 'Plains Spider', 'Prairie Spider', 'Savanna Spider', 'Steppe Spider', 'Veldt Spider', 'Floodplains Spider', 'Meadow Spider', 'Flats Spider', 'Plateau Spider', 'Grassland Spider', 'Heath Spider', 'Moor Spider', 'Plains Gnoll', 'Prairie Gnoll', 'Savanna Gnoll', 'Steppe Gnoll', 'Veldt Gnoll', 'Floodplains Gnoll', 'Meadow Gnoll', 'Flats Gnoll', 'Plateau Gnoll', 'Grassland Gnoll', 'Heath Gnoll', 'Moor Gnoll', 'Plains Yeti', 'Prairie Yeti', 'Savanna Yeti', 'Steppe Yeti', 'Veldt Yeti', 'Floodplains Yeti', 'Meadow Yeti', 'Flats Yeti', 'Plateau Yeti', 'Grassland Yeti', 'Heath Yeti', 'Moor Yeti', 'Plains Skeleton', 'Prairie Skeleton', 'Savanna Skeleton', 'Steppe Skeleton', 'Veldt Skeleton', 'Floodplains Skeleton', 'Meadow Skeleton', 'Flats Skeleton', 'Plateau Skeleton', 'Grassland Skeleton', 'Heath Skeleton', 'Moor Skeleton', 'Plains Demon', 'Prairie Demon', 'Savanna Demon', 'Steppe Demon', 'Veldt Demon', 'Floodplains Demon', 'Meadow Demon', 'Flats Demon', 'Plateau Demon', 'Grassland Demon', 'Heath Demon', 'Moor Demon', 'Plains Devil', 'Prairie Devil', 'Savanna Devil', 'Steppe Devil', 'Veldt Devil', 'Floodplains Devil', 'Meadow Devil', 'Flats Devil', 'Plateau Devil', 'Grassland Devil', 'Heath Devil', 'Moor Devil', 'Plains Kraken', 'Prairie Kraken', 'Savanna Kraken', 'Steppe Kraken', 'Veldt Kraken', 'Floodplains Kraken', 'Meadow Kraken', 'Flats Kraken', 'Plateau Kraken', 'Grassland Kraken', 'Heath Kraken', 'Moor Kraken', 'Plains Lich', 'Prairie Lich', 'Savanna Lich', 'Steppe Lich', 'Veldt Lich', 'Floodplains Lich', 'Meadow Lich', 'Flats Lich', 'Plateau Lich', 'Grassland Lich', 'Heath Lich', 'Moor Lich', 'Plains Balrog', 'Prairie Balrog', 'Savanna Balrog', 'Steppe Balrog', 'Veldt Balrog', 'Floodplains Balrog', 'Meadow Balrog', 'Flats Balrog', 'Plateau Balrog', 'Grassland Balrog', 'Heath Balrog', 'Moor Balrog', 'Plains Ent', 'Prairie Ent', 'Savanna Ent', 'Steppe Ent', 'Veldt Ent', 'Floodplains Ent', 'Meadow Ent', 'Flats Ent', 'Plateau Ent', 'Grassland Ent', 'Heath Ent', 'Moor Ent', 'Plains Dryad', 'Prairie Dryad', 'Savanna Dryad', 'Steppe Dryad', 'Veldt Dryad', 'Floodplains Dryad', 'Meadow Dryad', 'Flats Dryad', 'Plateau Dryad', 'Grassland Dryad', 'Heath Dryad', 'Moor Dryad', 'Plains Giant', 'Prairie Giant', 'Savanna Giant', 'Steppe Giant', 'Veldt Giant', 'Floodplains Giant', 'Meadow Giant', 'Flats Giant', 'Plateau Giant', 'Grassland Giant', 'Heath Giant', 'Moor Giant', 'Plains Ettin', 'Prairie Ettin', 'Savanna Ettin', 'Steppe Ettin', 'Veldt Ettin', 'Floodplains Ettin', 'Meadow Ettin', 'Flats Ettin', 'Plateau Ettin', 'Grassland Ettin', 'Heath Ettin', 'Moor Ettin', 'Plains Treant', 'Prairie Treant', 'Savanna Treant', 'Steppe Treant', 'Veldt Treant', 'Floodplains Treant', 'Meadow Treant', 'Flats Treant', 'Plateau Treant', 'Grassland Treant', 'Heath Treant', 'Moor Treant', 'Plains Ogre', 'Prairie Ogre', 'Savanna Ogre', 'Steppe Ogre', 'Veldt Ogre', 'Floodplains Ogre', 'Meadow Ogre', 'Flats Ogre', 'Plateau Ogre', 'Grassland Ogre', 'Heath Ogre', 'Moor Ogre', 'Plains Wraith', 'Prairie Wraith', 'Savanna Wraith', 'Steppe Wraith', 'Veldt Wraith', 'Floodplains Wraith', 'Meadow Wraith', 'Flats Wraith', 'Plateau Wraith', 'Grassland Wraith', 'Heath Wraith', 'Moor Wraith', 'Plains Banshee', 'Prairie Banshee', 'Savanna Banshee', 'Steppe Banshee', 'Veldt Banshee', 'Floodplains Banshee', 'Meadow Banshee', 'Flats Banshee', 'Plateau Banshee', 'Grassland Banshee', 'Heath Banshee', 'Moor Banshee', 'Plains Vampire', 'Prairie Vampire', 'Savanna Vampire', 'Steppe Vampire', 'Veldt Vampire', 'Floodplains Vampire', 'Meadow Vampire', 'Flats Vampire', 'Plateau Vampire', 'Grassland Vampire', 'Heath Vampire', 'Moor Vampire', 'Plains Mummy', 'Prairie Mummy', 'Savanna Mummy', 'Steppe Mummy', 'Veldt Mummy', 'Floodplains Mummy', 'Meadow Mummy', 'Flats Mummy', 'Plateau Mummy', 'Grassland Mummy', 'Heath Mummy', 'Moor Mummy', 'Plains Specter', 'Prairie Specter', 'Savanna Specter', 'Steppe Specter', 'Veldt Specter', 'Floodplains Specter', 'Meadow Specter', 'Flats Specter', 'Plateau Specter', 'Grassland Specter', 'Heath Specter', 'Moor Specter', 'Plains Kobold', 'Prairie Kobold', 'Savanna Kobold', 'Steppe Kobold', 'Veldt Kobold', 'Floodplains Kobold', 'Meadow Kobold', 'Flats Kobold', 'Plateau Kobold', 'Grassland Kobold', 'Heath Kobold', 'Moor Kobold', 'Plains Minotaur', 'Prairie Minotaur', 'Savanna Minotaur', 'Steppe Minotaur', 'Veldt Minotaur', 'Floodplains Minotaur', 'Meadow Minotaur', 'Flats Minotaur', 'Plateau Minotaur', 'Grassland Minotaur', 'Heath Minotaur', 'Moor Minotaur', 'Plains Harpy', 'Prairie Harpy', 'Savanna Harpy', 'Steppe Harpy', 'Veldt Harpy', 'Floodplains Harpy', 'Meadow Harpy', 'Flats Harpy', 'Plateau Harpy', 'Grassland Harpy', 'Heath Harpy', 'Moor Harpy', 'Plains Sphinx', 'Prairie Sphinx', 'Savanna Sphinx', 'Steppe Sphinx', 'Veldt Sphinx', 'Floodplains Sphinx', 'Meadow Sphinx', 'Flats Sphinx', 'Plateau Sphinx', 'Grassland Sphinx', 'Heath Sphinx', 'Moor Sphinx', 'Plains Serpent', 'Prairie Serpent', 'Savanna Serpent', 'Steppe Serpent', 'Veldt Serpent', 'Floodplains Serpent', 'Meadow Serpent', 'Flats Serpent', 'Plateau Serpent', 'Grassland Serpent', 'Heath Serpent', 'Moor Serpent', 'Plains Beast', 'Prairie Beast', 'Savanna Beast', 'Steppe Beast', 'Veldt Beast', 'Floodplains Beast', 'Meadow Beast', 'Flats Beast', 'Plateau Beast', 'Grassland Beast', 'Heath Beast', 'Moor Beast', 'Runaway Wagon', 'Mangy Bison']
-        },
-        'M': {
-            'regions': ['Rocky Mountain', 'Rocky Peaks', 'Rocky Volcano', 'Rocky Ravine', 'Rocky Climb', 'Rocky Summit', 'Rocky Crags', 'Rocky Glacier', 'Rocky Pinnacle', 'Rocky Ridge', 'Rocky Horn', 'Rocky Heights', 'Jagged Mountain', 'Jagged Peaks', 'Jagged Volcano', 'Jagged Ravine', 'Jagged Climb', 'Jagged Summit', 'Jagged Crags', 'Jagged Glacier', 'Jagged Pinnacle', 'Jagged Ridge', 'Jagged Horn', 'Jagged Heights', 'Howling Mountain', 'Howling Peaks', 'Howling Volcano', 'Howling Ravine', 'Howling Climb', 'Howling Summit', 'Howling Crags', 'Howling Glacier', 'Howling Pinnacle', 'Howling Ridge', 'Howling Horn', 'Howling Heights', 'Towering Mountain', 'Towering Peaks', 'Towering Volcano', 'Towering Ravine', 'Towering Climb', 'Towering Summit', 'Towering Crags', 'Towering Glacier', 'Towering Pinnacle', 'Towering Ridge', 'Towering Horn', 'Towering Heights', 'Craggy Mountain', 'Craggy Peaks', 'Craggy Volcano', 'Craggy Ravine', 'Craggy Climb', 'Craggy Summit', 'Craggy Crags', 'Craggy Glacier', 'Craggy Pinnacle', 'Craggy Ridge', 'Craggy Horn', 'Craggy Heights', 'Steep Mountain', 'Steep Peaks', 'Steep Volcano', 'Steep Ravine', 'Steep Climb', 'Steep Summit', 'Steep Crags', 'Steep Glacier', 'Steep Pinnacle', 'Steep Ridge', 'Steep Horn', 'Steep Heights', 'Cloudy Mountain', 'Cloudy Peaks', 'Cloudy Volcano', 'Cloudy Ravine', 'Cloudy Climb', 'Cloudy Summit', 'Cloudy Crags', 'Cloudy Glacier', 'Cloudy Pinnacle', 'Cloudy Ridge', 'Cloudy Horn', 'Cloudy Heights', 'Obsidian Mountain', 'Obsidian Peaks', 'Obsidian Volcano', 'Obsidian Ravine', 'Obsidian Climb', 'Obsidian Summit', 'Obsidian Crags', 'Obsidian Glacier', 'Obsidian Pinnacle', 'Obsidian Ridge', 'Obsidian Horn', 'Obsidian Heights', 'High Mountain', 'High Peaks', 'High Volcano', 'High Ravine', 'High Climb', 'High Summit', 'High Crags', 'High Glacier', 'High Pinnacle', 'High Ridge', 'High Horn', 'High Heights', 'Snowy Mountain', 'Snowy Peaks', 'Snowy Volcano', 'Snowy Ravine', 'Snowy Climb', 'Snowy Summit', 'Snowy Crags', 'Snowy Glacier', 'Snowy Pinnacle', 'Snowy Ridge', 'Snowy Horn', 'Snowy Heights', 'Alpine Mountain', 'Alpine Peaks', 'Alpine Volcano', 'Alpine Ravine', 'Alpine Climb', 'Alpine Summit', 'Alpine Crags', 'Alpine Glacier', 'Alpine Pinnacle', 'Alpine Ridge', 'Alpine Horn', 'Alpine Heights', 'Rusted Grit', 'Rocky Cliffs', 'Desolate Rock', 'Craggle Rock', 'Crusty Canyon'],
-            'enemies': ['Mountain Dragon', 'Peaks Dragon', 'Volcano Dragon', 'Ravine Dragon', 'Climb Dragon', 'Summit Dragon', 'Crags Dragon', 'Glacier Dragon', 'Pinnacle Dragon', 'Ridge Dragon', 'Horn Dragon', 'Heights Dragon', 'Mountain Drake', 'Peaks Drake', 'Volcano Drake', 'Ravine Drake', 'Climb Drake', 'Summit Drake', 'Crags Drake', 'Glacier Drake', 'Pinnacle Drake', 'Ridge Drake', 'Horn Drake', 'Heights Drake', 'Mountain Ghost', 'Peaks Ghost', 'Volcano Ghost', 'Ravine Ghost', 'Climb Ghost', 'Summit Ghost', 'Crags Ghost', 'Glacier Ghost', 'Pinnacle Ghost', 'Ridge Ghost', 'Horn Ghost', 'Heights Ghost', 'Mountain Ghoul', 'Peaks Ghoul', 'Volcano Ghoul', 'Ravine Ghoul', 'Climb Ghoul', 'Summit Ghoul', 'Crags Ghoul', 'Glacier Ghoul', 'Pinnacle Ghoul', 'Ridge Ghoul', 'Horn Ghoul', 'Heights Ghoul', 'Mountain Zombie', 'Peaks Zombie', 'Volcano Zombie', 'Ravine Zombie', 'Climb Zombie', 'Summit Zombie', 'Crags Zombie', 'Glacier Zombie', 'Pinnacle Zombie', 'Ridge Zombie', 'Horn Zombie', 'Heights Zombie', 'Mountain Werewolf', 'Peaks Werewolf', 'Volcano Werewolf', 'Ravine Werewolf', 'Climb Werewolf', 'Summit Werewolf', 'Crags Werewolf', 'Glacier Werewolf', 'Pinnacle Werewolf', 'Ridge Werewolf', 'Horn Werewolf', 'Heights Werewolf', 'Mountain Warg', 'Peaks Warg', 'Volcano Warg', 'Ravine Warg', 'Climb Warg', 'Summit Warg', 'Crags Warg', 'Glacier Warg', 'Pinnacle Warg', 'Ridge Warg', 'Horn Warg', 'Heights Warg', 'Mountain Orc', 'Peaks Orc', 'Volcano Orc', 'Ravine Orc', 'Climb Orc', 'Summit Orc', 'Crags Orc', 'Glacier Orc', 'Pinnacle Orc', 'Ridge Orc', 'Horn Orc', 'Heights Orc', 'Mountain Troll', 'Peaks Troll', 'Volcano Troll', 'Ravine Troll', 'Climb Troll', 'Summit Troll', 'Crags Troll', 'Glacier Troll', 'Pinnacle Troll', 'Ridge Troll', 'Horn Troll', 'Heights Troll', 'Mountain Goblin', 'Peaks Goblin', 'Volcano Goblin', 'Ravine Goblin', 'Climb Goblin', 'Summit Goblin', 'Crags Goblin', 'Glacier Goblin', 'Pinnacle Goblin', 'Ridge Goblin', 'Horn Goblin', 'Heights Goblin', 'Mountain Undead', 'Peaks Undead', 'Volcano Undead', 'Ravine Undead', 'Climb Undead', 'Summit Undead', 'Crags Undead', 'Glacier Undead', 'Pinnacle Undead', 'Ridge Undead', 'Horn Undead', 'Heights Undead', 'Mountain Mimic', 'Peaks Mimic', 'Volcano Mimic', 'Ravine Mimic', 'Climb Mimic', 'Summit Mimic', 'Crags Mimic', 'Glacier Mimic', 'Pinnacle Mimic', 'Ridge Mimic', 'Horn Mimic', 'Heights Mimic', 'Mountain Chimera', 'Peaks Chimera', 'Volcano Chimera', 'Ravine Chimera', 'Climb Chimera', 'Summit Chimera', 'Crags Chimera', 'Glacier Chimera', 'Pinnacle Chimera', 'Ridge Chimera', 'Horn Chimera', 'Heights Chimera', 'Mountain Unicorn', 'Peaks Unicorn', 'Volcano Unicorn', 'Ravine Unicorn', 'Climb Unicorn', 'Summit Unicorn', 'Crags Unicorn', 'Glacier Unicorn', 'Pinnacle Unicorn', 'Ridge Unicorn', 'Horn Unicorn', 'Heights Unicorn', 'Mountain Pegasus', 'Peaks Pegasus', 'Volcano Pegasus', 'Ravine Pegasus', 'Climb Pegasus', 'Summit Pegasus', 'Crags Pegasus', 'Glacier Pegasus', 'Pinnacle Pegasus', 'Ridge Pegasus', 'Horn Pegasus', 'Heights Pegasus', 'Mountain Griffon', 'Peaks Griffon', 'Volcano Griffon', 'Ravine Griffon', 'Climb Griffon', 'Summit Griffon', 'Crags Griffon', 'Glacier Griffon', 'Pinnacle Griffon', 'Ridge Griffon', 'Horn Griffon', 'Heights Griffon', 'Mountain Slime', 'Peaks Slime', 'Volcano Slime', 'Ravine Slime', 'Climb Slime', 'Summit Slime', 'Crags Slime', 'Glacier Slime', 'Pinnacle Slime', 'Ridge Slime', 'Horn Slime', 'Heights Slime', 'Mountain Golem', 'Peaks Golem', 'Volcano Golem', 'Ravine Golem', 'Climb Golem', 'Summit Golem', 'Crags Golem', 'Glacier Golem', 'Pinnacle Golem', 'Ridge Golem', 'Horn Golem', 'Heights Golem', 'Mountain Lizardman', 'Peaks Lizardman', 'Volcano Lizardman', 'Ravine Lizardman', 'Climb Lizardman', 'Summit Lizardman', 'Crags Lizardman', 'Glacier Lizardman', 'Pinnacle Lizardman', 'Ridge Lizardman', 'Horn Lizardman', 'Heights Lizardman', 'Mountain Hydra', 'Peaks Hydra', 'Volcano Hydra', 'Ravine Hydra', 'Climb Hydra', 'Summit Hydra', 'Crags Hydra', 'Glacier Hydra', 'Pinnacle Hydra', 'Ridge Hydra', 'Horn Hydra', 'Heights Hydra', 'Mountain Basilisk', 'Peaks Basilisk', 'Volcano Basilisk', 'Ravine Basilisk', 'Climb Basilisk', 'Summit Basilisk', 'Crags Basilisk', 'Glacier Basilisk', 'Pinnacle Basilisk', 'Ridge Basilisk', 'Horn Basilisk', 'Heights Basilisk', 'Mountain Cyclops', 'Peaks Cyclops', 'Volcano Cyclops', 'Ravine Cyclops', 'Climb Cyclops', 'Summit Cyclops', 'Crags Cyclops', 'Glacier Cyclops', 'Pinnacle Cyclops', 'Ridge Cyclops', 'Horn Cyclops', 'Heights Cyclops', 'Mountain Wyvern', 'Peaks Wyvern', 'Volcano Wyvern', 'Ravine Wyvern', 'Climb Wyvern', 'Summit Wyvern', 'Crags Wyvern', 'Glacier Wyvern', 'Pinnacle Wyvern', 'Ridge Wyvern', 'Horn Wyvern', 'Heights Wyvern', 'Mountain Centipede', 'Peaks Centipede', 'Volcano Centipede', 'Ravine Centipede', 'Climb Centipede', 'Summit Centipede', 'Crags Centipede', 'Glacier Centipede', 'Pinnacle Centipede', 'Ridge Centipede', 'Horn Centipede', 'Heights Centipede', 'Mountain Spider', 'Peaks Spider', 'Volcano Spider', 'Ravine Spider', 'Climb Spider', 'Summit Spider', 'Crags Spider', 'Glacier Spider', 'Pinnacle Spider', 'Ridge Spider', 'Horn Spider', 'Heights Spider', 'Mountain Gnoll', 'Peaks Gnoll', 'Volcano Gnoll', 'Ravine Gnoll', 'Climb Gnoll', 'Summit Gnoll', 'Crags Gnoll', 'Glacier Gnoll', 'Pinnacle Gnoll', 'Ridge Gnoll', 'Horn Gnoll', 'Heights Gnoll', 'Mountain Yeti', 'Peaks Yeti', 'Volcano Yeti', 'Ravine Yeti', 'Climb Yeti', 'Summit Yeti', 'Crags Yeti', 'Glacier Yeti', 'Pinnacle Yeti', 'Ridge Yeti', 'Horn Yeti', 'Heights Yeti', 'Mountain Skeleton', 'Peaks Skeleton', 'Volcano Skeleton', 'Ravine Skeleton', 'Climb Skeleton', 'Summit Skeleton', 'Crags Skeleton', 'Glacier Skeleton', 'Pinnacle Skeleton', 'Ridge Skeleton', 'Horn Skeleton', 'Heights Skeleton', 'Mountain Demon', 'Peaks Demon', 'Volcano Demon', 'Ravine Demon', 'Climb Demon', 'Summit Demon', 'Crags Demon', 'Glacier Demon', 'Pinnacle Demon', 'Ridge Demon', 'Horn Demon', 'Heights Demon', 'Mountain Devil', 'Peaks Devil', 'Volcano Devil', 'Ravine Devil', 'Climb Devil', 'Summit Devil', 'Crags Devil', 'Glacier Devil', 'Pinnacle Devil', 'Ridge Devil', 'Horn Devil', 'Heights Devil', 'Mountain Kraken', 'Peaks Kraken', 'Volcano Kraken', 'Ravine Kraken', 'Climb Kraken', 'Summit Kraken', 'Crags Kraken', 'Glacier Kraken', 'Pinnacle Kraken', 'Ridge Kraken', 'Horn Kraken', 'Heights Kraken', 'Mountain Lich', 'Peaks Lich', 'Volcano Lich', 'Ravine Lich', 'Climb Lich', 'Summit Lich', 'Crags Lich', 'Glacier Lich', 'Pinnacle Lich', 'Ridge Lich', 'Horn Lich', 'Heights Lich', 'Mountain Balrog', 'Peaks Balrog', 'Volcano Balrog', 'Ravine Balrog', 'Climb Balrog', 'Summit Balrog', 'Crags Balrog', 'Glacier Balrog', 'Pinnacle Balrog', 'Ridge Balrog', 'Horn Balrog', 'Heights Balrog', 'Mountain Ent', 'Peaks Ent', 'Volcano Ent', 'Ravine Ent', 'Climb Ent', 'Summit Ent', 'Crags Ent', 'Glacier Ent', 'Pinnacle Ent', 'Ridge Ent', 'Horn Ent', 'Heights Ent', 'Mountain Dryad', 'Peaks Dryad', 'Volcano Dryad', 'Ravine Dryad', 'Climb Dryad', 'Summit Dryad', 'Crags Dryad', 'Glacier Dryad', 'Pinnacle Dryad', 'Ridge Dryad', 'Horn Dryad', 'Heights Dryad', 'Mountain Giant', 'Peaks Giant', 'Volcano Giant', 'Ravine Giant', 'Climb Giant', 'Summit Giant', 'Crags Giant', 'Glacier Giant', 'Pinnacle Giant', 'Ridge Giant', 'Horn Giant', 'Heights Giant', 'Mountain Ettin', 'Peaks Ettin', 'Volcano Ettin', 'Ravine Ettin', 'Climb Ettin', 'Summit Ettin', 'Crags Ettin', 'Glacier Ettin', 'Pinnacle Ettin', 'Ridge Ettin', 'Horn Ettin', 'Heights Ettin', 'Mountain Treant', 'Peaks Treant', 'Volcano Treant', 'Ravine Treant', 'Climb Treant', 'Summit Treant', 'Crags Treant', 'Glacier Treant', 'Pinnacle Treant', 'Ridge Treant', 'Horn Treant', 'Heights Treant', 'Mountain Ogre', 'Peaks Ogre', 'Volcano Ogre', 'Ravine Ogre', 'Climb Ogre', 'Summit Ogre', 'Crags Ogre', 'Glacier Ogre', 'Pinnacle Ogre', 'Ridge Ogre', 'Horn Ogre', 'Heights Ogre', 'Mountain Wraith', 'Peaks Wraith', 'Volcano Wraith', 'Ravine Wraith', 'Climb Wraith', 'Summit Wraith', 'Crags Wraith', 'Glacier Wraith', 'Pinnacle Wraith', 'Ridge Wraith', 'Horn Wraith', 'Heights Wraith', 'Mountain Banshee', 'Peaks Banshee', 'Volcano Banshee', 'Ravine Banshee', 'Climb Banshee', 'Summit Banshee', 'Crags Banshee', 'Glacier Banshee', 'Pinnacle Banshee', 'Ridge Banshee', 'Horn Banshee', 'Heights Banshee', 'Mountain Vampire', 'Peaks Vampire', 'Volcano Vampire', 'Ravine Vampire', 'Climb Vampire', 'Summit Vampire', 'Crags Vampire', 'Glacier Vampire', 'Pinnacle Vampire', 'Ridge Vampire', 'Horn Vampire', 'Heights Vampire', 'Mountain Mummy', 'Peaks Mummy', 'Volcano Mummy', 'Ravine Mummy', 'Climb Mummy', 'Summit Mummy', 'Crags Mummy', 'Glacier Mummy', 'Pinnacle Mummy', 'Ridge Mummy', 'Horn Mummy', 'Heights Mummy', 'Mountain Specter', 'Peaks Specter', 'Volcano Specter', 'Ravine Specter', 'Climb Specter', 'Summit Specter', 'Crags Specter', 'Glacier Specter', 'Pinnacle Specter', 'Ridge Specter', 'Horn Specter', 'Heights Specter', 'Mountain Kobold', 'Peaks Kobold', 'Volcano Kobold', 'Ravine Kobold', 'Climb Kobold', 'Summit Kobold', 'Crags Kobold', 'Glacier Kobold', 'Pinnacle Kobold', 'Ridge Kobold', 'Horn Kobold', 'Heights Kobold', 'Mountain Minotaur', 'Peaks Minotaur', 'Volcano Minotaur', 'Ravine Minotaur', 'Climb Minotaur', 'Summit Minotaur', 'Crags Minotaur', 'Glacier Minotaur', 'Pinnacle Minotaur', 'Ridge Minotaur', 'Horn Minotaur', 'Heights Minotaur', 'Mountain Harpy', 'Peaks Harpy', 'Volcano Harpy', 'Ravine Harpy', 'Climb Harpy', 'Summit Harpy', 'Crags Harpy', 'Glacier Harpy', 'Pinnacle Harpy', 'Ridge Harpy', 'Horn Harpy', 'Heights Harpy', 'Mountain Sphinx', 'Peaks Sphinx', 'Volcano Sphinx', 'Ravine Sphinx', 'Climb Sphinx', 'Summit Sphinx', 'Crags Sphinx', 'Glacier Sphinx', 'Pinnacle Sphinx', 'Ridge Sphinx', 'Horn Sphinx', 'Heights Sphinx', 'Mountain Serpent', 'Peaks Serpent', 'Volcano Serpent', 'Ravine Serpent', 'Climb Serpent', 'Summit Serpent', 'Crags Serpent', 'Glacier Serpent', 'Pinnacle Serpent', 'Ridge Serpent', 'Horn Serpent', 'Heights Serpent', 'Mountain Beast', 'Peaks Beast', 'Volcano Beast', 'Ravine Beast', 'Climb Beast', 'Summit Beast', 'Crags Beast', 'Glacier Beast', 'Pinnacle Beast', 'Ridge Beast', 'Horn Beast', 'Heights Beast', 'Crag Viper']
-        },
-        'S': {
-            'regions': ['Ghostly Swamp', 'Ghostly Wetlands', 'Ghostly Bayou', 'Ghostly Marsh', 'Ghostly Bog', 'Ghostly Quagmire', 'Ghostly Mire', 'Ghostly Morass', 'Ghostly Fen', 'Ghostly Swampland', 'Ghostly Sump', 'Blighted Swamp', 'Blighted Wetlands', 'Blighted Bayou', 'Blighted Marsh', 'Blighted Bog', 'Blighted Quagmire', 'Blighted Mire', 'Blighted Morass', 'Blighted Fen', 'Blighted Swampland', 'Blighted Sump', 'Drowned Swamp', 'Drowned Wetlands', 'Drowned Bayou', 'Drowned Marsh', 'Drowned Bog', 'Drowned Quagmire', 'Drowned Mire', 'Drowned Morass', 'Drowned Fen', 'Drowned Swampland', 'Drowned Sump', 'Muddy Swamp', 'Muddy Wetlands', 'Muddy Bayou', 'Muddy Marsh', 'Muddy Bog', 'Muddy Quagmire', 'Muddy Mire', 'Muddy Morass', 'Muddy Fen', 'Muddy Swampland', 'Muddy Sump', 'Brackish Swamp', 'Brackish Wetlands', 'Brackish Bayou', 'Brackish Marsh', 'Brackish Bog', 'Brackish Quagmire', 'Brackish Mire', 'Brackish Morass', 'Brackish Fen', 'Brackish Swampland', 'Brackish Sump', 'Sodden Swamp', 'Sodden Wetlands', 'Sodden Bayou', 'Sodden Marsh', 'Sodden Bog', 'Sodden Quagmire', 'Sodden Mire', 'Sodden Morass', 'Sodden Fen', 'Sodden Swampland', 'Sodden Sump', 'Miasmatic Swamp', 'Miasmatic Wetlands', 'Miasmatic Bayou', 'Miasmatic Marsh', 'Miasmatic Bog', 'Miasmatic Quagmire', 'Miasmatic Mire', 'Miasmatic Morass', 'Miasmatic Fen', 'Miasmatic Swampland', 'Miasmatic Sump', 'Poison Swamp', 'Poison Wetlands', 'Poison Bayou', 'Poison Marsh', 'Poison Bog', 'Poison Quagmire', 'Poison Mire', 'Poison Morass', 'Poison Fen', 'Poison Swampland', 'Poison Sump', 'Dark Swamp', 'Dark Wetlands', 'Dark Bayou', 'Dark Marsh', 'Dark Bog', 'Dark Quagmire', 'Dark Mire', 'Dark Morass', 'Dark Fen', 'Dark Swampland', 'Dark Sump', 'Pungent Swamp', 'Pungent Wetlands', 'Pungent Bayou', 'Pungent Marsh', 'Pungent Bog', 'Pungent Quagmire', 'Pungent Mire', 'Pungent Morass', 'Pungent Fen', 'Pungent Swampland', 'Pungent Sump', 'Shadowed Swamp', 'Shadowed Wetlands', 'Shadowed Bayou', 'Shadowed Marsh', 'Shadowed Bog', 'Shadowed Quagmire', 'Shadowed Mire', 'Shadowed Morass', 'Shadowed Fen', 'Shadowed Swampland', 'Shadowed Sump', 'Frog Swamp', 'Frog Wetlands', 'Frog Bayou', 'Frog Marsh', 'Frog Bog', 'Frog Quagmire', 'Frog Mire', 'Frog Morass', 'Frog Fen', 'Frog Swampland', 'Frog Sump', 'Gator Swamp', 'Gator Wetlands', 'Gator Bayou', 'Gator Marsh', 'Gator Bog', 'Gator Quagmire', 'Gator Mire', 'Gator Morass', 'Gator Fen', 'Gator Swampland', 'Gator Sump', 'Simmering Pools', 'Oppressive Muck'],
-            'enemies': ['Swamp Dragon', 'Wetlands Dragon', 'Bayou Dragon', 'Marsh Dragon', 'Bog Dragon', 'Quagmire Dragon', 'Mire Dragon', 'Morass Dragon', 'Fen Dragon', 'Swampland Dragon', 'Sump Dragon', 'Swamp Drake', 'Wetlands Drake', 'Bayou Drake', 'Marsh Drake', 'Bog Drake', 'Quagmire Drake', 'Mire Drake', 'Morass Drake', 'Fen Drake', 'Swampland Drake', 'Sump Drake', 'Swamp Ghost', 'Wetlands Ghost', 'Bayou Ghost', 'Marsh Ghost', 'Bog Ghost', 'Quagmire Ghost', 'Mire Ghost', 'Morass Ghost', 'Fen Ghost', 'Swampland Ghost', 'Sump Ghost', 'Swamp Ghoul', 'Wetlands Ghoul', 'Bayou Ghoul', 'Marsh Ghoul', 'Bog Ghoul', 'Quagmire Ghoul', 'Mire Ghoul', 'Morass Ghoul', 'Fen Ghoul', 'Swampland Ghoul', 'Sump Ghoul', 'Swamp Zombie', 'Wetlands Zombie', 'Bayou Zombie', 'Marsh Zombie', 'Bog Zombie', 'Quagmire Zombie', 'Mire Zombie', 'Morass Zombie', 'Fen Zombie', 'Swampland Zombie', 'Sump Zombie', 'Swamp Werewolf', 'Wetlands Werewolf', 'Bayou Werewolf', 'Marsh Werewolf', 'Bog Werewolf', 'Quagmire Werewolf', 'Mire Werewolf', 'Morass Werewolf', 'Fen Werewolf', 'Swampland Werewolf', 'Sump Werewolf', 'Swamp Warg', 'Wetlands Warg', 'Bayou Warg', 'Marsh Warg', 'Bog Warg', 'Quagmire Warg', 'Mire Warg', 'Morass Warg', 'Fen Warg', 'Swampland Warg', 'Sump Warg', 'Swamp Orc', 'Wetlands Orc', 'Bayou Orc', 'Marsh Orc', 'Bog Orc', 'Quagmire Orc', 'Mire Orc', 'Morass Orc', 'Fen Orc', 'Swampland Orc', 'Sump Orc', 'Swamp Troll', 'Wetlands Troll', 'Bayou Troll', 'Marsh Troll', 'Bog Troll', 'Quagmire Troll', 'Mire Troll', 'Morass Troll', 'Fen Troll', 'Swampland Troll', 'Sump Troll', 'Swamp Goblin', 'Wetlands Goblin', 'Bayou Goblin', 'Marsh Goblin', 'Bog Goblin', 'Quagmire Goblin', 'Mire Goblin', 'Morass Goblin', 'Fen Goblin', 'Swampland Goblin', 'Sump Goblin', 'Swamp Undead', 'Wetlands Undead', 'Bayou Undead', 'Marsh Undead', 'Bog Undead', 'Quagmire Undead', 'Mire Undead', 'Morass Undead', 'Fen Undead', 'Swampland Undead', 'Sump Undead', 'Swamp Mimic', 'Wetlands Mimic', 'Bayou Mimic', 'Marsh Mimic', 'Bog Mimic', 'Quagmire Mimic', 'Mire Mimic', 'Morass Mimic', 'Fen Mimic', 'Swampland Mimic', 'Sump Mimic', 'Swamp Chimera', 'Wetlands Chimera', 'Bayou Chimera', 'Marsh Chimera', 'Bog Chimera', 'Quagmire Chimera', 'Mire Chimera', 'Morass Chimera', 'Fen Chimera', 'Swampland Chimera', 'Sump Chimera', 'Swamp Unicorn', 'Wetlands Unicorn', 'Bayou Unicorn', 'Marsh Unicorn', 'Bog Unicorn', 'Quagmire Unicorn', 'Mire Unicorn', 'Morass Unicorn', 'Fen Unicorn', 'Swampland Unicorn', 'Sump Unicorn', 'Swamp Pegasus', 'Wetlands Pegasus', 'Bayou Pegasus', 'Marsh Pegasus', 'Bog Pegasus', 'Quagmire Pegasus', 'Mire Pegasus', 'Morass Pegasus', 'Fen Pegasus', 'Swampland Pegasus', 'Sump Pegasus', 'Swamp Griffon', 'Wetlands Griffon', 'Bayou Griffon', 'Marsh Griffon', 'Bog Griffon', 'Quagmire Griffon', 'Mire Griffon', 'Morass Griffon', 'Fen Griffon', 'Swampland Griffon', 'Sump Griffon', 'Swamp Slime', 'Wetlands Slime', 'Bayou Slime', 'Marsh Slime', 'Bog Slime', 'Quagmire Slime', 'Mire Slime', 'Morass Slime', 'Fen Slime', 'Swampland Slime', 'Sump Slime', 'Swamp Golem', 'Wetlands Golem', 'Bayou Golem', 'Marsh Golem', 'Bog Golem', 'Quagmire Golem', 'Mire Golem', 'Morass Golem', 'Fen Golem', 'Swampland Golem', 'Sump Golem', 'Swamp Lizardman', 'Wetlands Lizardman', 'Bayou Lizardman', 'Marsh Lizardman', 'Bog Lizardman', 'Quagmire Lizardman', 'Mire Lizardman', 'Morass Lizardman', 'Fen Lizardman', 'Swampland Lizardman', 'Sump Lizardman', 'Swamp Hydra', 'Wetlands Hydra', 'Bayou Hydra', 'Marsh Hydra', 'Bog Hydra', 'Quagmire Hydra', 'Mire Hydra', 'Morass Hydra', 'Fen Hydra', 'Swampland Hydra', 'Sump Hydra', 'Swamp Basilisk', 'Wetlands Basilisk', 'Bayou Basilisk', 'Marsh Basilisk', 'Bog Basilisk', 'Quagmire Basilisk', 'Mire Basilisk', 'Morass Basilisk', 'Fen Basilisk', 'Swampland Basilisk', 'Sump Basilisk', 'Swamp Cyclops', 'Wetlands Cyclops', 'Bayou Cyclops', 'Marsh Cyclops', 'Bog Cyclops', 'Quagmire Cyclops', 'Mire Cyclops', 'Morass Cyclops', 'Fen Cyclops', 'Swampland Cyclops', 'Sump Cyclops', 'Swamp Wyvern', 'Wetlands Wyvern', 'Bayou Wyvern', 'Marsh Wyvern', 'Bog Wyvern', 'Quagmire Wyvern', 'Mire Wyvern', 'Morass Wyvern', 'Fen Wyvern', 'Swampland Wyvern', 'Sump Wyvern', 'Swamp Centipede', 'Wetlands Centipede', 'Bayou Centipede', 'Marsh Centipede', 'Bog Centipede', 'Quagmire Centipede', 'Mire Centipede', 'Morass Centipede', 'Fen Centipede', 'Swampland Centipede', 'Sump Centipede', 'Swamp Spider', 'Wetlands Spider', 'Bayou Spider', 'Marsh Spider', 'Bog Spider', 'Quagmire Spider', 'Mire Spider', 'Morass Spider', 'Fen Spider', 'Swampland Spider', 'Sump Spider', 'Swamp Gnoll', 'Wetlands Gnoll', 'Bayou Gnoll', 'Marsh Gnoll', 'Bog Gnoll', 'Quagmire Gnoll', 'Mire Gnoll', 'Morass Gnoll', 'Fen Gnoll', 'Swampland Gnoll', 'Sump Gnoll', 'Swamp Yeti', 'Wetlands Yeti', 'Bayou Yeti', 'Marsh Yeti', 'Bog Yeti', 'Quagmire Yeti', 'Mire Yeti', 'Morass Yeti', 'Fen Yeti', 'Swampland Yeti', 'Sump Yeti', 'Swamp Skeleton', 'Wetlands Skeleton', 'Bayou Skeleton', 'Marsh Skeleton', 'Bog Skeleton', 'Quagmire Skeleton', 'Mire Skeleton', 'Morass Skeleton', 'Fen Skeleton', 'Swampland Skeleton', 'Sump Skeleton', 'Swamp Demon', 'Wetlands Demon', 'Bayou Demon', 'Marsh Demon', 'Bog Demon', 'Quagmire Demon', 'Mire Demon', 'Morass Demon', 'Fen Demon', 'Swampland Demon', 'Sump Demon', 'Swamp Devil', 'Wetlands Devil', 'Bayou Devil', 'Marsh Devil', 'Bog Devil', 'Quagmire Devil', 'Mire Devil', 'Morass Devil', 'Fen Devil', 'Swampland Devil', 'Sump Devil', 'Swamp Kraken', 'Wetlands Kraken', 'Bayou Kraken', 'Marsh Kraken', 'Bog Kraken', 'Quagmire Kraken', 'Mire Kraken', 'Morass Kraken', 'Fen Kraken', 'Swampland Kraken', 'Sump Kraken', 'Swamp Lich', 'Wetlands Lich', 'Bayou Lich', 'Marsh Lich', 'Bog Lich', 'Quagmire Lich', 'Mire Lich', 'Morass Lich', 'Fen Lich', 'Swampland Lich', 'Sump Lich', 'Swamp Balrog', 'Wetlands Balrog', 'Bayou Balrog', 'Marsh Balrog', 'Bog Balrog', 'Quagmire Balrog', 'Mire Balrog', 'Morass Balrog', 'Fen Balrog', 'Swampland Balrog', 'Sump Balrog', 'Swamp Ent', 'Wetlands Ent', 'Bayou Ent', 'Marsh Ent', 'Bog Ent', 'Quagmire Ent', 'Mire Ent', 'Morass Ent', 'Fen Ent', 'Swampland Ent', 'Sump Ent', 'Swamp Dryad', 'Wetlands Dryad', 'Bayou Dryad', 'Marsh Dryad', 'Bog Dryad', 'Quagmire Dryad', 'Mire Dryad', 'Morass Dryad', 'Fen Dryad', 'Swampland Dryad', 'Sump Dryad', 'Swamp Giant', 'Wetlands Giant', 'Bayou Giant', 'Marsh Giant', 'Bog Giant', 'Quagmire Giant', 'Mire Giant', 'Morass Giant', 'Fen Giant', 'Swampland Giant', 'Sump Giant', 'Swamp Ettin', 'Wetlands Ettin', 'Bayou Ettin', 'Marsh Ettin', 'Bog Ettin', 'Quagmire Ettin', 'Mire Ettin', 'Morass Ettin', 'Fen Ettin', 'Swampland Ettin', 'Sump Ettin', 'Swamp Treant', 'Wetlands Treant', 'Bayou Treant', 'Marsh Treant', 'Bog Treant', 'Quagmire Treant', 'Mire Treant', 'Morass Treant', 'Fen Treant', 'Swampland Treant', 'Sump Treant', 'Swamp Ogre', 'Wetlands Ogre', 'Bayou Ogre', 'Marsh Ogre', 'Bog Ogre', 'Quagmire Ogre', 'Mire Ogre', 'Morass Ogre', 'Fen Ogre', 'Swampland Ogre', 'Sump Ogre', 'Swamp Wraith', 'Wetlands Wraith', 'Bayou Wraith', 'Marsh Wraith', 'Bog Wraith', 'Quagmire Wraith', 'Mire Wraith', 'Morass Wraith', 'Fen Wraith', 'Swampland Wraith', 'Sump Wraith', 'Swamp Banshee', 'Wetlands Banshee', 'Bayou Banshee', 'Marsh Banshee', 'Bog Banshee', 'Quagmire Banshee', 'Mire Banshee', 'Morass Banshee', 'Fen Banshee', 'Swampland Banshee', 'Sump Banshee', 'Swamp Vampire', 'Wetlands Vampire', 'Bayou Vampire', 'Marsh Vampire', 'Bog Vampire', 'Quagmire Vampire', 'Mire Vampire', 'Morass Vampire', 'Fen Vampire', 'Swampland Vampire', 'Sump Vampire', 'Swamp Mummy', 'Wetlands Mummy', 'Bayou Mummy', 'Marsh Mummy', 'Bog Mummy', 'Quagmire Mummy', 'Mire Mummy', 'Morass Mummy', 'Fen Mummy', 'Swampland Mummy', 'Sump Mummy', 'Swamp Specter', 'Wetlands Specter', 'Bayou Specter', 'Marsh Specter', 'Bog Specter', 'Quagmire Specter', 'Mire Specter', 'Morass Specter', 'Fen Specter', 'Swampland Specter', 'Sump Specter', 'Swamp Kobold', 'Wetlands Kobold', 'Bayou Kobold', 'Marsh Kobold', 'Bog Kobold', 'Quagmire Kobold', 'Mire Kobold', 'Morass Kobold', 'Fen Kobold', 'Swampland Kobold', 'Sump Kobold', 'Swamp Minotaur', 'Wetlands Minotaur', 'Bayou Minotaur', 'Marsh Minotaur', 'Bog Minotaur', 'Quagmire Minotaur', 'Mire Minotaur', 'Morass Minotaur', 'Fen Minotaur', 'Swampland Minotaur', 'Sump Minotaur', 'Swamp Harpy', 'Wetlands Harpy', 'Bayou Harpy', 'Marsh Harpy', 'Bog Harpy', 'Quagmire Harpy', 'Mire Harpy', 'Morass Harpy', 'Fen Harpy', 'Swampland Harpy', 'Sump Harpy', 'Swamp Sphinx', 'Wetlands Sphinx', 'Bayou Sphinx', 'Marsh Sphinx', 'Bog Sphinx', 'Quagmire Sphinx', 'Mire Sphinx', 'Morass Sphinx', 'Fen Sphinx', 'Swampland Sphinx', 'Sump Sphinx', 'Swamp Serpent', 'Wetlands Serpent', 'Bayou Serpent', 'Marsh Serpent', 'Bog Serpent', 'Quagmire Serpent', 'Mire Serpent', 'Morass Serpent', 'Fen Serpent', 'Swampland Serpent', 'Sump Serpent', 'Swamp Beast', 'Wetlands Beast', 'Bayou Beast', 'Marsh Beast', 'Bog Beast', 'Quagmire Beast', 'Mire Beast', 'Morass Beast', 'Fen Beast', 'Swampland Beast', 'Sump Beast', 'Poisonous Sidewinder', 'Vampire Horse', 'Green Witch', 'Pustulant Vulture']
-        },
-        'T': {
-            'regions': ['Arctic Tundra', 'Arctic Permafrost', 'Arctic Glacier', 'Arctic Wastes', 'Arctic Expanse', 'Arctic Highlands', 'Arctic Desert', 'Arctic Barrens', 'Arctic Steppe', 'Arctic Moor', 'Snowy Tundra', 'Snowy Permafrost', 'Snowy Glacier', 'Snowy Wastes', 'Snowy Expanse', 'Snowy Highlands', 'Snowy Desert', 'Snowy Barrens', 'Snowy Steppe', 'Snowy Moor', 'White Tundra', 'White Permafrost', 'White Glacier', 'White Wastes', 'White Expanse', 'White Highlands', 'White Desert', 'White Barrens', 'White Steppe', 'White Moor', 'Frozen Tundra', 'Frozen Permafrost', 'Frozen Glacier', 'Frozen Wastes', 'Frozen Expanse', 'Frozen Highlands', 'Frozen Desert', 'Frozen Barrens', 'Frozen Steppe', 'Frozen Moor', 'Barren Tundra', 'Barren Permafrost', 'Barren Glacier', 'Barren Wastes', 'Barren Expanse', 'Barren Highlands', 'Barren Desert', 'Barren Barrens', 'Barren Steppe', 'Barren Moor', 'Frigid Tundra', 'Frigid Permafrost', 'Frigid Glacier', 'Frigid Wastes', 'Frigid Expanse', 'Frigid Highlands', 'Frigid Desert', 'Frigid Barrens', 'Frigid Steppe', 'Frigid Moor', 'Chilling Tundra', 'Chilling Permafrost', 'Chilling Glacier', 'Chilling Wastes', 'Chilling Expanse', 'Chilling Highlands', 'Chilling Desert', 'Chilling Barrens', 'Chilling Steppe', 'Chilling Moor', 'Ice Tundra', 'Ice Permafrost', 'Ice Glacier', 'Ice Wastes', 'Ice Expanse', 'Ice Highlands', 'Ice Desert', 'Ice Barrens', 'Ice Steppe', 'Ice Moor', 'Frost Tundra', 'Frost Permafrost', 'Frost Glacier', 'Frost Wastes', 'Frost Expanse', 'Frost Highlands', 'Frost Desert', 'Frost Barrens', 'Frost Steppe', 'Frost Moor', 'Peat Tundra', 'Peat Permafrost', 'Peat Glacier', 'Peat Wastes', 'Peat Expanse', 'Peat Highlands', 'Peat Desert', 'Peat Barrens', 'Peat Steppe', 'Peat Moor', 'Alpine Tundra', 'Alpine Permafrost', 'Alpine Glacier', 'Alpine Wastes', 'Alpine Expanse', 'Alpine Highlands', 'Alpine Desert', 'Alpine Barrens', 'Alpine Steppe', 'Alpine Moor', 'Mossy Tundra', 'Mossy Permafrost', 'Mossy Glacier', 'Mossy Wastes', 'Mossy Expanse', 'Mossy Highlands', 'Mossy Desert', 'Mossy Barrens', 'Mossy Steppe', 'Mossy Moor', 'Barren Frost'],
-            'enemies': ['Tundra Dragon', 'Permafrost Dragon', 'Glacier Dragon', 'Wastes Dragon', 'Expanse Dragon', 'Highlands Dragon', 'Desert Dragon', 'Barrens Dragon', 'Steppe Dragon', 'Moor Dragon', 'Tundra Drake', 'Permafrost Drake', 'Glacier Drake', 'Wastes Drake', 'Expanse Drake', 'Highlands Drake', 'Desert Drake', 'Barrens Drake', 'Steppe Drake', 'Moor Drake', 'Tundra Ghost', 'Permafrost Ghost', 'Glacier Ghost', 'Wastes Ghost', 'Expanse Ghost', 'Highlands Ghost', 'Desert Ghost', 'Barrens Ghost', 'Steppe Ghost', 'Moor Ghost', 'Tundra Ghoul', 'Permafrost Ghoul', 'Glacier Ghoul', 'Wastes Ghoul', 'Expanse Ghoul', 'Highlands Ghoul', 'Desert Ghoul', 'Barrens Ghoul', 'Steppe Ghoul', 'Moor Ghoul', 'Tundra Zombie', 'Permafrost Zombie', 'Glacier Zombie', 'Wastes Zombie', 'Expanse Zombie', 'Highlands Zombie', 'Desert Zombie', 'Barrens Zombie', 'Steppe Zombie', 'Moor Zombie', 'Tundra Werewolf', 'Permafrost Werewolf', 'Glacier Werewolf', 'Wastes Werewolf', 'Expanse Werewolf', 'Highlands Werewolf', 'Desert Werewolf', 'Barrens Werewolf', 'Steppe Werewolf', 'Moor Werewolf', 'Tundra Warg', 'Permafrost Warg', 'Glacier Warg', 'Wastes Warg', 'Expanse Warg', 'Highlands Warg', 'Desert Warg', 'Barrens Warg', 'Steppe Warg', 'Moor Warg', 'Tundra Orc', 'Permafrost Orc', 'Glacier Orc', 'Wastes Orc', 'Expanse Orc', 'Highlands Orc', 'Desert Orc', 'Barrens Orc', 'Steppe Orc', 'Moor Orc', 'Tundra Troll', 'Permafrost Troll', 'Glacier Troll', 'Wastes Troll', 'Expanse Troll', 'Highlands Troll', 'Desert Troll', 'Barrens Troll', 'Steppe Troll', 'Moor Troll', 'Tundra Goblin', 'Permafrost Goblin', 'Glacier Goblin', 'Wastes Goblin', 'Expanse Goblin', 'Highlands Goblin', 'Desert Goblin', 'Barrens Goblin', 'Steppe Goblin', 'Moor Goblin', 'Tundra Undead', 'Permafrost Undead', 'Glacier Undead', 'Wastes Undead', 'Expanse Undead', 'Highlands Undead', 'Desert Undead', 'Barrens Undead', 'Steppe Undead', 'Moor Undead', 'Tundra Mimic', 'Permafrost Mimic', 'Glacier Mimic', 'Wastes Mimic', 'Expanse Mimic', 'Highlands Mimic', 'Desert Mimic', 'Barrens Mimic', 'Steppe Mimic', 'Moor Mimic', 'Tundra Chimera', 'Permafrost Chimera', 'Glacier Chimera', 'Wastes Chimera', 'Expanse Chimera', 'Highlands Chimera', 'Desert Chimera', 'Barrens Chimera', 'Steppe Chimera', 'Moor Chimera', 'Tundra Unicorn', 'Permafrost Unicorn', 'Glacier Unicorn', 'Wastes Unicorn', 'Expanse Unicorn', 'Highlands Unicorn', 'Desert Unicorn', 'Barrens Unicorn', 'Steppe Unicorn', 'Moor Unicorn', 'Tundra Pegasus', 'Permafrost Pegasus', 'Glacier Pegasus', 'Wastes Pegasus', 'Expanse Pegasus', 'Highlands Pegasus', 'Desert Pegasus', 'Barrens Pegasus', 'Steppe Pegasus', 'Moor Pegasus', 'Tundra Griffon', 'Permafrost Griffon', 'Glacier Griffon', 'Wastes Griffon', 'Expanse Griffon', 'Highlands Griffon', 'Desert Griffon', 'Barrens Griffon', 'Steppe Griffon', 'Moor Griffon', 'Tundra Slime', 'Permafrost Slime', 'Glacier Slime', 'Wastes Slime', 'Expanse Slime', 'Highlands Slime', 'Desert Slime', 'Barrens Slime', 'Steppe Slime', 'Moor Slime', 'Tundra Golem', 'Permafrost Golem', 'Glacier Golem', 'Wastes Golem', 'Expanse Golem', 'Highlands Golem', 'Desert Golem', 'Barrens Golem', 'Steppe Golem', 'Moor Golem', 'Tundra Lizardman', 'Permafrost Lizardman', 'Glacier Lizardman', 'Wastes Lizardman', 'Expanse Lizardman', 'Highlands Lizardman', 'Desert Lizardman', 'Barrens Lizardman', 'Steppe Lizardman', 'Moor Lizardman', 'Tundra Hydra', 'Permafrost Hydra', 'Glacier Hydra', 'Wastes Hydra', 'Expanse Hydra', 'Highlands Hydra', 'Desert Hydra', 'Barrens Hydra', 'Steppe Hydra', 'Moor Hydra', 'Tundra Basilisk', 'Permafrost Basilisk', 'Glacier Basilisk', 'Wastes Basilisk', 'Expanse Basilisk', 'Highlands Basilisk', 'Desert Basilisk', 'Barrens Basilisk', 'Steppe Basilisk', 'Moor Basilisk', 'Tundra Cyclops', 'Permafrost Cyclops', 'Glacier Cyclops', 'Wastes Cyclops', 'Expanse Cyclops', 'Highlands Cyclops', 'Desert Cyclops', 'Barrens Cyclops', 'Steppe Cyclops', 'Moor Cyclops', 'Tundra Wyvern', 'Permafrost Wyvern', 'Glacier Wyvern', 'Wastes Wyvern', 'Expanse Wyvern', 'Highlands Wyvern', 'Desert Wyvern', 'Barrens Wyvern', 'Steppe Wyvern', 'Moor Wyvern', 'Tundra Centipede', 'Permafrost Centipede', 'Glacier Centipede', 'Wastes Centipede', 'Expanse Centipede', 'Highlands Centipede', 'Desert Centipede', 'Barrens Centipede', 'Steppe Centipede', 'Moor Centipede', 'Tundra Spider', 'Permafrost Spider', 'Glacier Spider', 'Wastes Spider', 'Expanse Spider', 'Highlands Spider', 'Desert Spider', 'Barrens Spider', 'Steppe Spider', 'Moor Spider', 'Tundra Gnoll', 'Permafrost Gnoll', 'Glacier Gnoll', 'Wastes Gnoll', 'Expanse Gnoll', 'Highlands Gnoll', 'Desert Gnoll', 'Barrens Gnoll', 'Steppe Gnoll', 'Moor Gnoll', 'Tundra Yeti', 'Permafrost Yeti', 'Glacier Yeti', 'Wastes Yeti', 'Expanse Yeti', 'Highlands Yeti', 'Desert Yeti', 'Barrens Yeti', 'Steppe Yeti', 'Moor Yeti', 'Tundra Skeleton', 'Permafrost Skeleton', 'Glacier Skeleton', 'Wastes Skeleton', 'Expanse Skeleton', 'Highlands Skeleton', 'Desert Skeleton', 'Barrens Skeleton', 'Steppe Skeleton', 'Moor Skeleton', 'Tundra Demon', 'Permafrost Demon', 'Glacier Demon', 'Wastes Demon', 'Expanse Demon', 'Highlands Demon', 'Desert Demon', 'Barrens Demon', 'Steppe Demon', 'Moor Demon', 'Tundra Devil', 'Permafrost Devil', 'Glacier Devil', 'Wastes Devil', 'Expanse Devil', 'Highlands Devil', 'Desert Devil', 'Barrens Devil', 'Steppe Devil', 'Moor Devil', 'Tundra Kraken', 'Permafrost Kraken', 'Glacier Kraken', 'Wastes Kraken', 'Expanse Kraken', 'Highlands Kraken', 'Desert Kraken', 'Barrens Kraken', 'Steppe Kraken', 'Moor Kraken', 'Tundra Lich', 'Permafrost Lich', 'Glacier Lich', 'Wastes Lich', 'Expanse Lich', 'Highlands Lich', 'Desert Lich', 'Barrens Lich', 'Steppe Lich', 'Moor Lich', 'Tundra Balrog', 'Permafrost Balrog', 'Glacier Balrog', 'Wastes Balrog', 'Expanse Balrog', 'Highlands Balrog', 'Desert Balrog', 'Barrens Balrog', 'Steppe Balrog', 'Moor Balrog', 'Tundra Ent', 'Permafrost Ent', 'Glacier Ent', 'Wastes Ent', 'Expanse Ent', 'Highlands Ent', 'Desert Ent', 'Barrens Ent', 'Steppe Ent', 'Moor Ent', 'Tundra Dryad', 'Permafrost Dryad', 'Glacier Dryad', 'Wastes Dryad', 'Expanse Dryad', 'Highlands Dryad', 'Desert Dryad', 'Barrens Dryad', 'Steppe Dryad', 'Moor Dryad', 'Tundra Giant', 'Permafrost Giant', 'Glacier Giant', 'Wastes Giant', 'Expanse Giant', 'Highlands Giant', 'Desert Giant', 'Barrens Giant', 'Steppe Giant', 'Moor Giant', 'Tundra Ettin', 'Permafrost Ettin', 'Glacier Ettin', 'Wastes Ettin', 'Expanse Ettin', 'Highlands Ettin', 'Desert Ettin', 'Barrens Ettin', 'Steppe Ettin', 'Moor Ettin', 'Tundra Treant', 'Permafrost Treant', 'Glacier Treant', 'Wastes Treant', 'Expanse Treant', 'Highlands Treant', 'Desert Treant', 'Barrens Treant', 'Steppe Treant', 'Moor Treant', 'Tundra Ogre', 'Permafrost Ogre', 'Glacier Ogre', 'Wastes Ogre', 'Expanse Ogre', 'Highlands Ogre', 'Desert Ogre', 'Barrens Ogre', 'Steppe Ogre', 'Moor Ogre', 'Tundra Wraith', 'Permafrost Wraith', 'Glacier Wraith', 'Wastes Wraith', 'Expanse Wraith', 'Highlands Wraith', 'Desert Wraith', 'Barrens Wraith', 'Steppe Wraith', 'Moor Wraith', 'Tundra Banshee', 'Permafrost Banshee', 'Glacier Banshee', 'Wastes Banshee', 'Expanse Banshee', 'Highlands Banshee', 'Desert Banshee', 'Barrens Banshee', 'Steppe Banshee', 'Moor Banshee', 'Tundra Vampire', 'Permafrost Vampire', 'Glacier Vampire', 'Wastes Vampire', 'Expanse Vampire', 'Highlands Vampire', 'Desert Vampire', 'Barrens Vampire', 'Steppe Vampire', 'Moor Vampire', 'Tundra Mummy', 'Permafrost Mummy', 'Glacier Mummy', 'Wastes Mummy', 'Expanse Mummy', 'Highlands Mummy', 'Desert Mummy', 'Barrens Mummy', 'Steppe Mummy', 'Moor Mummy', 'Tundra Specter', 'Permafrost Specter', 'Glacier Specter', 'Wastes Specter', 'Expanse Specter', 'Highlands Specter', 'Desert Specter', 'Barrens Specter', 'Steppe Specter', 'Moor Specter', 'Tundra Kobold', 'Permafrost Kobold', 'Glacier Kobold', 'Wastes Kobold', 'Expanse Kobold', 'Highlands Kobold', 'Desert Kobold', 'Barrens Kobold', 'Steppe Kobold', 'Moor Kobold', 'Tundra Minotaur', 'Permafrost Minotaur', 'Glacier Minotaur', 'Wastes Minotaur', 'Expanse Minotaur', 'Highlands Minotaur', 'Desert Minotaur', 'Barrens Minotaur', 'Steppe Minotaur', 'Moor Minotaur', 'Tundra Harpy', 'Permafrost Harpy', 'Glacier Harpy', 'Wastes Harpy', 'Expanse Harpy', 'Highlands Harpy', 'Desert Harpy', 'Barrens Harpy', 'Steppe Harpy', 'Moor Harpy', 'Tundra Sphinx', 'Permafrost Sphinx', 'Glacier Sphinx', 'Wastes Sphinx', 'Expanse Sphinx', 'Highlands Sphinx', 'Desert Sphinx', 'Barrens Sphinx', 'Steppe Sphinx', 'Moor Sphinx', 'Tundra Serpent', 'Permafrost Serpent', 'Glacier Serpent', 'Wastes Serpent', 'Expanse Serpent', 'Highlands Serpent', 'Desert Serpent', 'Barrens Serpent', 'Steppe Serpent', 'Moor Serpent', 'Tundra Beast', 'Permafrost Beast', 'Glacier Beast', 'Wastes Beast', 'Expanse Beast', 'Highlands Beast', 'Desert Beast', 'Barrens Beast', 'Steppe Beast', 'Moor Beast', 'Rabid Ogre', 'Frost Imp', 'Strange Light', 'Acrid Ooze', 'Fanged Caprid', 'Ancient Wendigo', 'Undead Dromad']
-        }
-    },
-    'towns': ['London','Birmingham','Leeds','Glasgow','Sheffield','Bradford','Liverpool','Edinburgh','Manchester','Bristol','Kirklees','Fife','Wirral','North Lanarkshire','Wakefield','Cardiff','Dudley','Wigan','East Riding','South Lanarkshire','Coventry','Belfast','Leicester','Sunderland','Sandwell','Doncaster','Stockport','Sefton','Nottingham','Newcastle-upon-Tyne','Kingston-upon-Hull','Bolton','Walsall','Plymouth','Rotherham','Stoke-on-Trent','Wolverhampton','Rhondda, Cynon, Taff','South Gloucestershire','Derby','Swansea','Salford','Aberdeenshire','Barnsley','Tameside','Oldham','Trafford','Aberdeen','Southampton','Highland','Rochdale','Solihull','Gateshead','Milton Keynes','North Tyneside','Calderdale','Northampton','Portsmouth','Warrington','North Somerset','Bury','Luton','St Helens','Stockton-on-Tees','Renfrewshire','York','Thamesdown','Southend-on-Sea','New Forest','Caerphilly','Carmarthenshire','Bath & North East Somerset','Wycombe','Basildon','Bournemouth','Peterborough','North East Lincolnshire','Chelmsford','Brighton','South Tyneside','Charnwood','Aylesbury Vale','Colchester','Knowsley','North Lincolnshire','Huntingdonshire','Macclesfield','Blackpool','West Lothian','South Somerset','Dundee','Basingstoke & Deane','Harrogate','Dumfries & Galloway','Middlesbrough','Flintshire','Rochester-upon-Medway','The Wrekin','Newbury','Falkirk','Reading','Wokingham','Windsor & Maidenhead','Maidstone','Redcar & Cleveland','North Ayrshire','Blackburn','Neath Port Talbot','Poole','Wealden','Arun','Bedford','Oxford','Lancaster','Newport','Canterbury','Preston','Dacorum','Cherwell','Perth & Kinross','Thurrock','Tendring','Kings Lynn & West Norfolk','St Albans','Bridgend','South Cambridgeshire','Braintree','Norwich','Thanet','Isle of Wight','Mid Sussex','South Oxfordshire','Guildford','Elmbridge','Stafford','Powys','East Hertfordshire','Torbay','Wrexham Maelor','East Devon','East Lindsey','Halton','Warwick','East Ayrshire','Newcastle-under-Lyme','North Wiltshire','South Kesteven','Epping Forest','Vale of Glamorgan','Reigate & Banstead','Chester','Mid Bedfordshire','Suffolk Coastal','Horsham','Nuneaton & Bedworth','Gwynedd','Swale','Havant & Waterloo','Teignbridge','Cambridge','Vale Royal','Amber Valley','North Hertfordshire','South Ayrshire','Waverley','Broadland','Crewe & Nantwich','Breckland','Ipswich','Pembrokeshire','Vale of White Horse','Salisbury','Gedling','Eastleigh','Broxtowe','Stratford-on-Avon','South Bedfordshire','Angus','East Hampshire','East Dunbartonshire','Conway','Sevenoaks','Slough','Bracknell Forest','West Lancashire','West Wiltshire','Ashfield','Lisburn','Scarborough','Stroud','Wychavon','Waveney','Exeter','Dover','Test Valley','Gloucester','Erewash','Cheltenham','Bassetlaw','Scottish Borders'],
-    'dungeons': ['Widows Mine', 'Drake Mouth Cavern', 'Ancient Shipwreck', 'Cyclops Den', 'Ruins of Orvo', 'Whispering Crypt', 'Blighted Grotto', 'Shattered Sanctum', 'Ironfang Keep', 'Dreadmarrow Catacombs', 'Shadowed Sepulcher', 'Howling Pit', 'Sunken Temple of Aethel', 'Gilded Necropolis', 'Wraith Haunted Burrow', 'Obsidian Vault', 'Crimson Oubliette', 'Frozen Bastion', 'Cursed Ossuary', 'Weeping Mines', 'Spider Silk Hollow', 'Forsaken Citadel', 'Maw of Despair', 'Emerald Labyrinth', 'Ancient Archives', 'Bone Orchard', 'Scourge Fire Peak', 'Ghost Light Caverns', 'Lost Aqueducts of Orix', 'Ashen Laboratory', 'Sunless Grove', 'Twisted Spire', 'Blackwood Thicket', 'Iron Grave', 'Sirens Cove', 'Underhall', 'Bleakwood Manor', 'Rune Scarred Halls', 'Vile Ichor Basin', 'Silent Bastille', 'Wyrm Hide Den', 'Misty Chasm', 'Shattered Spire', 'Deadmans Reach', 'Cinder Stone Cellars', 'Hidden Reliquary', 'Fallen Star Crater', 'Marrow Pick Mine', 'Glaring Eye Outpost', 'Serpents Coil Tunnel', 'Void Touched Rift', 'Desolate Foundry', 'Wailing Woodshed', 'Marble Mausoleum', 'Grim Water Lock', 'Salt Crusted Tomb', 'Eldritch Excavation', 'Gloom Weavers Nest', 'Blood Drenched Pit', 'Scaled Bastion', 'Forgotten Armory', 'Lunar Shrine', 'Brimstone Crevasse', 'Hollowed Mountain', 'Verdant Overgrowth', 'Ruined Cloister', 'Sulfur Stained Caves', 'Clockwork Maze', 'Drowned Treasury', 'Shifting Sands', 'Obsidian Obelisk', 'Frost Bitten Hold', 'Amber Web Hive', 'Petrified Forest', 'Sun Scorched Ruins', 'Shadow Step Alley', 'Basalt Fortress', 'Murmuring Abyss', 'Lich Fire Spire', 'Broken Gatehouse', 'Withered Heart Grove', 'Stone Singers Vault', 'Cobalt Quarry', 'Plague Ridden Sewers', 'Thunder Clap Gorge', 'Eternal Prison', 'Vanguard Outpost', 'Mossy Warren', 'Raven Flight Tower', 'Deep Core Sinkhole', 'Spectral Citadel', 'Jagged Crest', 'Whispering Willow Glen', 'Molten Forge', 'Sable Stone Hold', 'Dragon Tail Bend', 'Mirror Glass Palace', 'Ancient Aviary', 'Rotting Root Catacombs', 'Final Resting Place', 'Coal Cough Mine', 'Dark Pit', 'Ominous Ruin', 'Aviary', 'Drowned Temple', 'Wicked Cathedral', 'Ruins', 'Mines', 'Sinkhole', 'Cave', 'Pit']
-}
\ No newline at end of file
+"""
+Word lists used to train the name generators.
+
+The lists live in corpus.txt as `[key]` section headers followed by one word per line, e.g. `[towns]` or
+`[biomes.D.enemies]`. The file is memory-mapped on first use, so its pages are shared by every worker process
+through the OS page cache, and a section is only decoded into a Python list when it is asked for.
+"""
+import mmap
+import os
+import threading
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus.txt')
+
+_lock = threading.Lock()
+_data: mmap.mmap | None = None
+_index: dict[str, tuple[int, int]] = {}
+_words: dict[str, list[str]] = {}
+
+
+def _load_index() -> dict[str, tuple[int, int]]:
+    """
+    Maps the corpus file and records the byte range of every section, without decoding any words.
+    """
+    global _data
+
+    if _data is not None:
+        return _index
+
+    with _lock:
+        if _data is None:
+            with open(CORPUS_PATH, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            index = {}
+            pos = 0
+            key = None
+            start = 0
+
+            while pos < len(data):
+                end = data.find(b'\n', pos)
+                end = len(data) if end == -1 else end
+
+                if data[pos:pos + 1] == b'[':
+                    if key is not None:
+                        index[key] = (start, pos)
+
+                    key = data[pos + 1:end].rstrip(b']').decode('utf-8')
+                    start = end + 1
+
+                pos = end + 1
+
+            if key is not None:
+                index[key] = (start, len(data))
+
+            _index.update(index)
+            _data = data
+
+    return _index
+
+
+def keys() -> list[str]:
+    """
+    Every section key, in file order.
+    """
+    return list(_load_index())
+
+
+def biomes() -> list[str]:
+    """
+    Biome codes in file order, e.g. ['D', 'F', ...].
+    """
+    seen = []
+
+    for key in keys():
+        if key.startswith('biomes.'):
+            biome = key.split('.')[1]
+
+            if biome not in seen:
+                seen.append(biome)
+
+    return seen
+
+
+def words(key: str) -> list[str]:
+    """
+    Word list for a section key, decoded on first access and cached.
+    """
+    cached = _words.get(key)
+
+    if cached is not None:
+        return cached
+
+    start, end = _load_index()[key]
+    decoded = _data[start:end].decode('utf-8').splitlines()
+
+    with _lock:
+        return _words.setdefault(key, decoded)
@@ -1,13 +1,78 @@
+import gzip
+import json
 import random
+import threading
 
-from .markov import MarkovNameGenerator
-from .procgen_svg import generate_abstract_entity
-from .corpus import CORPUS
+from .markov import MarkovNameGenerator, TrainedModel
+from .procgen_svg import generate_abstract_entities
+from . import corpus
+
+MARKOV_ORDER = 3
+MODELS_FORMAT = 1
+
+# Trained models keyed by (corpus key, order), shared by every generator in the process
+_models: dict[tuple[str, int], TrainedModel] = {}
+_models_lock = threading.Lock()
+
+
+def get_model(key: str, order: int = MARKOV_ORDER) -> TrainedModel:
+    """
+    Returns the trained model for a corpus key, training it once per process on first use.
+    """
+    model = _models.get((key, order))
+
+    if model is None:
+        with _models_lock:
+            model = _models.get((key, order))
+
+            if model is None:
+                model = MarkovNameGenerator.train(corpus.words(key), order=order, normalize_case=True)
+                _models[(key, order)] = model
+
+    return model
+
+
+def name_generator(key: str, seed: str, order: int = MARKOV_ORDER) -> MarkovNameGenerator:
+    return MarkovNameGenerator.from_trained(get_model(key, order), seed=seed)
+
+
+def save_models(path: str, order: int = MARKOV_ORDER) -> int:
+    """
+    Trains every corpus model and writes them to a gzipped JSON artifact, returns the number of models.
+    """
+    data = {'format': MODELS_FORMAT,
+            'models': [{'key': key, **get_model(key, order).to_dict()} for key in corpus.keys()]}
+
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+    return len(data['models'])
+
+
+def load_models(path: str) -> int:
+    """
+    Loads a models artifact written by save_models into the process cache, returns the number of models.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if data.get('format') != MODELS_FORMAT:
+        return 0
+
+    loaded = {}
+
+    for entry in data['models']:
+        model = TrainedModel.from_dict(entry)
+        loaded[(entry['key'], model.order)] = model
+
+    with _models_lock:
+        _models.update(loaded)
+
+    return len(loaded)
 
 
 def generate_town(seed: str, level: int) -> dict:
-    gen = MarkovNameGenerator(order=3, seed=seed, normalize_case=True)
-    gen.fit(CORPUS['towns'])
+    gen = name_generator('towns', seed=seed)
     name = gen.generate(max_len=24, min_len=6, avoid_training=True)
     words = name.split()
 
@@ -22,12 +87,11 @@ def generate_town(seed: str, level: int) -> dict:
 
 def generate_dungeons(seed: str, level: int, count: int) -> list[dict]:
     dungeons = []
-    random.seed(seed)
+    rng = random.Random(seed)
 
-    levels = random.choices(range(level, level+4), k=count)
+    levels = rng.choices(range(level, level+4), k=count)
 
-    gen = MarkovNameGenerator(order=3, seed=seed, normalize_case=True)
-    gen.fit(CORPUS['dungeons'])
+    gen = name_generator('dungeons', seed=seed)
     names = gen.generate_many(k=count, max_len=24, min_len=6, avoid_training=True)
 
     for name in names:
@@ -42,11 +106,9 @@ def generate_dungeons(seed: str, level: int, count: int) -> list[dict]:
 
 
 def generate_region(seed: str, level: int) -> dict:
-    random.seed(seed)
-    biome = random.choice(list(CORPUS['biomes'].keys()))
+    biome = random.Random(seed).choice(corpus.biomes())
 
-    gen = MarkovNameGenerator(order=3, seed=seed, normalize_case=True)
-    gen.fit(CORPUS['biomes'][biome]['regions'])
+    gen = name_generator(f'biomes.{biome}.regions', seed=seed)
     name = gen.generate(max_len=24, min_len=6, avoid_training=True)
     words = name.split()
 
@@ -67,23 +129,17 @@ def generate_region(seed: str, level: int) -> dict:
 
 
 def procgen_enemies(seed: str, biome: str, count: int) -> list[dict]:
-    enemies = []
-    random.seed(seed)
+    gen = name_generator(f'biomes.{biome}.enemies', seed=seed)
+    names = []
 
-    gen = MarkovNameGenerator(order=3, seed=seed, normalize_case=True)
-    gen.fit(CORPUS['biomes'][biome]['enemies'])
-    names = gen.generate_many(k=count, max_len=24, min_len=6, avoid_training=True)
-
-    for name in names:
+    for name in gen.generate_many(k=count, max_len=24, min_len=6, avoid_training=True):
         words = name.split()
 
         if len(words) > 1 and len(words[-1]) < 4:
             words.pop()
 
-        name = " ".join(words).title()
-        svg = generate_abstract_entity(seed_string=name)
+        names.append(" ".join(words).title())
 
-        enemy_dict = {'name': name, 'svg': svg}
-        enemies.append(enemy_dict)
+    svgs = generate_abstract_entities(names, optimize=True)
 
-    return enemies
\ No newline at end of file
+    return [{'name': name, 'svg': svg} for name, svg in zip(names, svgs)]
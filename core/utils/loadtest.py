@@ -0,0 +1,282 @@
+"""
+Scripted virtual players for load testing a running server, used by the `load_test` management command.
+
+Every virtual player goes through the same steps as a real one: register, create a character, select it, join a
+world (waiting on its generation job if needed) and load the map. It then polls map updates every poll interval,
+travels between the region's town and dungeons and posts to region chat now and then, until the run ends.
+
+Each player is a thread with its own keep-alive connection and cookies. Every request is recorded under an endpoint
+name with its latency, status and, when the server runs with QUMUD_QUERY_COUNT_HEADER, the number of database
+queries it made.
+"""
+import re
+import time
+import uuid
+import random
+import threading
+import http.client
+from http.cookies import SimpleCookie
+from urllib.parse import urlsplit, urlencode
+
+UUID = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+CLASS_RE = re.compile(r'name="character_class" value="(\d+)"')
+CHARACTER_RE = re.compile(rf'name="selected_id"\s+value="({UUID})"')
+JOB_RE = re.compile(rf'hx-get="(/world/jobs/{UUID})"')
+TRAVEL_RE = re.compile(rf'hx-vals=\'{{"public_id": "({UUID})"}}\'')
+
+# Polls of a world generation job before a player gives up joining
+JOB_POLLS = 300
+
+
+class LoadTestError(Exception):
+    pass
+
+
+class Stats:
+    """
+    Thread-safe per endpoint request records.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records: dict[str, list[tuple[float, int | None, int | None]]] = {}
+
+    def record(self, endpoint: str, seconds: float, status: int | None, queries: int | None) -> None:
+        with self._lock:
+            self._records.setdefault(endpoint, []).append((seconds, status, queries))
+
+    def summary(self, elapsed: float) -> dict[str, dict]:
+        """
+        Per endpoint: requests, requests per second over `elapsed`, error rate (exceptions and 4xx/5xx), latency
+        percentiles in seconds and mean queries per request (None when the server sent no counts).
+        """
+        with self._lock:
+            records = {endpoint: list(rows) for endpoint, rows in self._records.items()}
+
+        records['all'] = [row for rows in records.values() for row in rows]
+        summary = {}
+
+        for endpoint, rows in records.items():
+            if not rows:
+                continue
+
+            latencies = sorted(seconds for seconds, _, _ in rows)
+            errors = sum(1 for _, status, _ in rows if status is None or status >= 400)
+            queries = [count for _, _, count in rows if count is not None]
+
+            summary[endpoint] = {
+                'requests': len(rows),
+                'rps': len(rows) / elapsed if elapsed else 0,
+                'error_rate': errors / len(rows),
+                'p50': percentile(latencies, 50),
+                'p95': percentile(latencies, 95),
+                'p99': percentile(latencies, 99),
+                'max': latencies[-1],
+                'queries': sum(queries) / len(queries) if queries else None,
+            }
+
+        return summary
+
+
+def percentile(ordered: list[float], p: int) -> float:
+    # Nearest rank
+    index = max(0, -(-len(ordered) * p // 100) - 1)
+
+    return ordered[index]
+
+
+class Session:
+    """
+    Minimal HTTP client for one virtual player: a keep-alive connection, cookies and Django's CSRF header.
+
+    A plain http:// target is treated as sitting behind the TLS proxy the settings expect: requests carry
+    X-Forwarded-Proto and a same-origin Referer, so secure redirects and CSRF checks pass.
+    """
+
+    def __init__(self, base_url: str, stats: Stats, timeout: float = 30):
+        url = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+
+        self.host = url.netloc
+        self.stats = stats
+        self.cookies: dict[str, str] = {}
+        self.connection = connection_class(self.host, timeout=timeout)
+
+    def request(self, endpoint: str, method: str, path: str, data: dict | None = None,
+                htmx: bool = False) -> tuple[int, http.client.HTTPResponse, str]:
+        headers = {'X-Forwarded-Proto': 'https', 'Referer': f'https://{self.host}/'}
+
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f'{k}={v}' for k, v in self.cookies.items())
+
+        if htmx:
+            headers['HX-Request'] = 'true'
+
+        body = None
+
+        if data is not None:
+            body = urlencode(data)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+            headers['X-CSRFToken'] = self.cookies.get('csrftoken', '')
+
+        start = time.perf_counter()
+
+        try:
+            self.connection.request(method, path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            text = response.read().decode('utf-8', 'replace')
+        except (OSError, http.client.HTTPException) as e:
+            self.stats.record(endpoint, time.perf_counter() - start, None, None)
+            self.connection.close()
+            raise LoadTestError(f'{endpoint}: {e}') from e
+
+        seconds = time.perf_counter() - start
+        queries = response.getheader('X-Query-Count')
+        self.stats.record(endpoint, seconds, response.status, int(queries) if queries else None)
+
+        for header in response.msg.get_all('Set-Cookie') or []:
+            for key, morsel in SimpleCookie(header).items():
+                self.cookies[key] = morsel.value
+
+        if response.status >= 400:
+            raise LoadTestError(f'{endpoint}: HTTP {response.status}')
+
+        return response.status, response, text
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class VirtualPlayer:
+    def __init__(self, session: Session, name: str, world: str, poll_interval: float = 1.0,
+                 travel_every: int = 30, chat_every: int = 60, rng: random.Random | None = None):
+        self.session = session
+        self.name = name
+        self.world = world
+        self.poll_interval = poll_interval
+        self.travel_every = travel_every
+        self.chat_every = chat_every
+        self.rng = rng or random.Random(name)
+        self.destinations: list[str] = []
+
+    def setup(self) -> None:
+        s = self.session
+        password = uuid.uuid4().hex
+
+        s.request('register_form', 'GET', '/auth/register')
+        s.request('register', 'POST', '/auth/register', {'username': self.name, 'alias': self.name,
+                                                        'password1': password, 'password2': password})
+
+        _, _, page = s.request('create_character_form', 'GET', '/create_character')
+        classes = CLASS_RE.findall(page)
+
+        if not classes:
+            raise LoadTestError('create_character: no character classes')
+
+        s.request('create_character', 'POST', '/create_character',
+                  {'character_name': self.name, 'character_class': self.rng.choice(classes)}, htmx=True)
+
+        _, _, page = s.request('characters', 'GET', '/characters')
+        characters = CHARACTER_RE.findall(page)
+
+        if not characters:
+            raise LoadTestError('characters: character was not created')
+
+        s.request('select_character', 'POST', '/select_character', {'selected_id': characters[0]}, htmx=True)
+        status, _, page = s.request('select_world', 'POST', '/world', {'name': self.world}, htmx=True)
+
+        # A new world renders its generation job, which is polled until it answers with the redirect
+        polls = 0
+
+        while status == 200 and (job := JOB_RE.search(page)):
+            if polls == JOB_POLLS:
+                raise LoadTestError('world_job: generation did not finish')
+
+            time.sleep(1)
+            status, _, page = s.request('world_job', 'GET', job.group(1), htmx=True)
+            polls += 1
+
+        self.load_map()
+
+    def load_map(self) -> None:
+        _, _, page = self.session.request('map', 'GET', '/')
+        self.destinations = TRAVEL_RE.findall(page)
+
+    def poll(self) -> None:
+        self.session.request('poll', 'GET', '/?trigger=update', htmx=True)
+
+    def travel(self) -> None:
+        if not self.destinations:
+            return self.load_map()
+
+        _, _, page = self.session.request('travel', 'POST', '/travel',
+                                          {'public_id': self.rng.choice(self.destinations)}, htmx=True)
+        self.destinations = TRAVEL_RE.findall(page) or self.destinations
+
+    def chat(self) -> None:
+        self.session.request('chat', 'POST', '/region_chat',
+                             {'region-chat-msg': f'{self.name} says hi'}, htmx=True)
+
+    def run(self, until: float) -> None:
+        """
+        Polls on a fixed schedule until `until`, so slow responses do not lower the request rate they cause.
+        """
+        next_poll = time.monotonic()
+
+        while next_poll < until:
+            try:
+                self.poll()
+
+                if self.travel_every and self.rng.randrange(self.travel_every) == 0:
+                    self.travel()
+
+                if self.chat_every and self.rng.randrange(self.chat_every) == 0:
+                    self.chat()
+
+            except LoadTestError:
+                # Already counted as an error, keep playing
+                pass
+
+            next_poll += self.poll_interval
+            time.sleep(max(0.0, next_poll - time.monotonic()))
+
+
+def run_load_test(base_url: str, players: int = 100, duration: float = 60, ramp_up: float = 10, worlds: int = 1,
+                  poll_interval: float = 1.0, travel_every: int = 30, chat_every: int = 60) -> dict:
+    """
+    Starts `players` virtual players spread over `ramp_up` seconds, lets each play until `duration` seconds after
+    the start, and returns the per endpoint summary with the number of players that failed to set up.
+    Players are shared round robin between `worlds` world names unique to the run.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    stats = Stats()
+    failed = []
+    start = time.monotonic()
+    until = start + duration
+
+    def play(index: int) -> None:
+        time.sleep(ramp_up * index / players)
+        session = Session(base_url, stats)
+        player = VirtualPlayer(session, name=f'lt{run_id}{index}', world=f'loadtest-{run_id}-{index % worlds}',
+                               poll_interval=poll_interval, travel_every=travel_every, chat_every=chat_every)
+
+        try:
+            player.setup()
+            player.run(until)
+        except LoadTestError as e:
+            failed.append(str(e))
+        finally:
+            session.close()
+
+    # Thousands of mostly sleeping threads, keep their stacks small
+    threading.stack_size(256 * 1024)
+    threads = [threading.Thread(target=play, args=(i,), daemon=True) for i in range(players)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return {'run_id': run_id, 'players': players, 'failed_players': len(failed), 'failures': failed[:20],
+            'elapsed': time.monotonic() - start, 'endpoints': stats.summary(time.monotonic() - start)}
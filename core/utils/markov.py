@@ -1,5 +1,7 @@
+from bisect import bisect
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import accumulate
 import hashlib
 import random
 from typing import Dict, List, Tuple, Iterable, Optional, Set
@@ -16,6 +18,96 @@ class ModelEntry:
     total: int               # Total weight for quick checks
 
 
+@dataclass
+class CompiledModel:
+    """
+    Integer-encoded sampling engine for a trained model.
+
+    Prefixes become state ids, every state keeps cumulative weights for bisect
+    sampling and a precomputed transition to the next state per symbol, so the
+    generation loop never builds tuples or re-accumulates weights. Sampling
+    consumes the RNG exactly like random.choices, so outputs are unchanged.
+    """
+    symbols: List[List[str]]       # Per state: possible next chars
+    cum_weights: List[List[int]]   # Per state: cumulative counts
+    totals: List[float]            # Per state: total weight as float
+    transitions: List[List[int]]   # Per state and symbol: next state id, -1 if unseen
+    start: int                     # State id of the all-start prefix
+    state_ids: Dict[Tuple[str, ...], int]  # Prefix -> state id
+    normalized_training: Set[str]  # Training words in comparison form
+
+
+@dataclass
+class TrainedModel:
+    """
+    Result of training on a corpus, independent of any RNG so it can be shared by
+    many generators and cached or serialized.
+    """
+    order: int
+    normalize_case: bool
+    table: Dict[Tuple[str, ...], ModelEntry]
+    training_words: Set[str]
+    _compiled: Optional[CompiledModel] = field(default=None, init=False, repr=False, compare=False)
+
+    def compile(self) -> CompiledModel:
+        """
+        Build (once) the integer-encoded sampling tables for this model.
+        """
+        if self._compiled is not None:
+            return self._compiled
+
+        prefixes = list(self.table)
+        state_ids = {prefix: i for i, prefix in enumerate(prefixes)}
+        symbols, cum_weights, totals, transitions = [], [], [], []
+
+        for prefix in prefixes:
+            entry = self.table[prefix]
+            symbols.append(entry.symbols)
+            cum = list(accumulate(entry.weights))
+            cum_weights.append(cum)
+            totals.append(cum[-1] + 0.0)
+            transitions.append([
+                -1 if s == _END else state_ids.get((*prefix[1:], s), -1)
+                for s in entry.symbols
+            ])
+
+        start_prefix = tuple(_START for _ in range(self.order - 1))
+        normalized = {
+            MarkovNameGenerator._prepare_word(w, self.normalize_case) for w in self.training_words
+        }
+        self._compiled = CompiledModel(
+            symbols, cum_weights, totals, transitions, state_ids[start_prefix], state_ids, normalized
+        )
+        return self._compiled
+
+    def to_dict(self) -> dict:
+        """
+        Compact JSON-friendly form: prefixes and symbol lists are single-char tokens,
+        so both are stored joined into strings.
+        """
+        return {
+            "order": self.order,
+            "normalize_case": self.normalize_case,
+            "training_words": sorted(self.training_words),
+            "table": [
+                ["".join(prefix), "".join(entry.symbols), entry.weights]
+                for prefix, entry in self.table.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TrainedModel":
+        table: Dict[Tuple[str, ...], ModelEntry] = {}
+        for prefix, symbols, weights in data["table"]:
+            table[tuple(prefix)] = ModelEntry(list(symbols), list(weights), sum(weights))
+        return cls(
+            order=data["order"],
+            normalize_case=data["normalize_case"],
+            table=table,
+            training_words=set(data["training_words"]),
+        )
+
+
 class MarkovNameGenerator:
     """
     Character-level Markov chain generator for names/words.
@@ -45,6 +137,9 @@ class MarkovNameGenerator:
         # Keep the training set for de-duplication under avoid_training=True
         self._training_words: Set[str] = set()
 
+        # Trained model backing the tables above, compiled on first sampling
+        self._trained: Optional[TrainedModel] = None
+
     @staticmethod
     def _mix_seed(seed: Optional[object]) -> Optional[int]:
         """
@@ -62,89 +157,130 @@ class MarkovNameGenerator:
         """Apply case normalization if requested."""
         return word.lower() if normalize_case else word
 
-    def fit(self, words: Iterable[str]) -> None:
+    @classmethod
+    def from_trained(
+        cls,
+        trained: TrainedModel,
+        seed: Optional[object] = None,
+    ) -> "MarkovNameGenerator":
         """
-        Train the model from a list/iterable of discrete words.
+        Build a generator around an already trained model. The tables are shared,
+        not copied, so this only costs the RNG setup.
+        """
+        gen = cls(order=trained.order, seed=seed, normalize_case=trained.normalize_case)
+        gen.load(trained)
+        return gen
+
+    @staticmethod
+    def train(words: Iterable[str], order: int, normalize_case: bool = True) -> TrainedModel:
+        """
+        Train a model from a list/iterable of discrete words without touching any generator state.
         """
         counts: Dict[Tuple[str, ...], Counter] = defaultdict(Counter)
-        self._training_words.clear()
+        training_words: Set[str] = set()
 
         for raw in words:
             if not raw:
                 continue
-            self._training_words.add(raw)
-            w = self._prepare_word(raw, self.normalize_case)
+            training_words.add(raw)
+            w = MarkovNameGenerator._prepare_word(raw, normalize_case)
 
             # Pad with start tokens and end token: e.g., for order=3: ^ ^ w $
-            padded = (_START * (self.order - 1)) + w + _END
+            padded = (_START * (order - 1)) + w + _END
 
             # Build counts of next-char given prefix of length order-1
-            for i in range(0, len(padded) - (self.order - 1)):
-                prefix = tuple(padded[i : i + (self.order - 1)])
-                next_char_idx = i + (self.order - 1)
+            for i in range(0, len(padded) - (order - 1)):
+                prefix = tuple(padded[i : i + (order - 1)])
+                next_char_idx = i + (order - 1)
                 next_char = padded[next_char_idx]
                 counts[prefix][next_char] += 1
 
         # Precompute sampling tables for efficiency and determinism
-        self._model.clear()
+        table: Dict[Tuple[str, ...], ModelEntry] = {}
         for prefix, counter in counts.items():
             # Sort symbols for reproducibility across Python runs
             symbols = sorted(counter.keys())
             weights = [counter[s] for s in symbols]
             total = sum(weights)
-            self._model[prefix] = ModelEntry(symbols, weights, total)
+            table[prefix] = ModelEntry(symbols, weights, total)
 
         # Basic sanity: ensure we can start generation
-        start_prefix = tuple(_START for _ in range(self.order - 1))
-        if start_prefix not in self._model:
+        start_prefix = tuple(_START for _ in range(order - 1))
+        if start_prefix not in table:
             raise RuntimeError(
                 "Model training failed: missing start prefix. "
                 "Ensure the input contains at least one non-empty word."
             )
 
+        return TrainedModel(order, normalize_case, table, training_words)
+
+    def fit(self, words: Iterable[str]) -> None:
+        """
+        Train the model from a list/iterable of discrete words.
+        """
+        self.load(self.train(words, self.order, self.normalize_case))
+
+    def load(self, trained: TrainedModel) -> None:
+        """
+        Use an already trained model for sampling.
+        """
+        if trained.order != self.order or trained.normalize_case != self.normalize_case:
+            raise ValueError("Trained model order/normalize_case does not match this generator")
+        self._model = trained.table
+        self._training_words = trained.training_words
+        self._trained = trained
+
     def _sample_next(self, prefix: Tuple[str, ...]) -> Optional[str]:
         """
         Sample the next character given a prefix using the model.
         Returns None if the prefix is unseen (should be rare).
         """
-        entry = self._model.get(prefix)
-        if not entry or entry.total == 0:
+        engine = self._engine()
+        state = engine.state_ids.get(prefix)
+        if state is None:
             return None
-        # Deterministic RNG thanks to self.rng
-        return self.rng.choices(entry.symbols, weights=entry.weights, k=1)[0]
+        # Same draw as rng.choices(symbols, weights), without rebuilding cumulative weights
+        cum = engine.cum_weights[state]
+        return engine.symbols[state][bisect(cum, self.rng.random() * engine.totals[state], 0, len(cum) - 1)]
 
-    def generate(
+    def _engine(self) -> CompiledModel:
+        if self._trained is None:
+            raise RuntimeError("Model is not trained: call fit() or load() first")
+        return self._trained.compile()
+
+    def _generate_one(
         self,
-        max_len: int = 30,
-        min_len: int = 1,
-        avoid_training: bool = True,
-        max_attempts: int = 100,
+        engine: CompiledModel,
+        max_len: int,
+        min_len: int,
+        avoid_training: bool,
+        max_attempts: int,
     ) -> Optional[str]:
         """
-        Generate a single name/word.
-
-        - max_len: hard cap on characters (excluding start/end markers).
-        - min_len: minimum characters required (excluding markers).
-        - avoid_training: avoid returning any exact training word.
-        - max_attempts: attempts before giving up if avoid_training is True.
+        Core sampling loop over the integer-encoded tables, see `generate`.
         """
-        start_prefix = tuple(_START for _ in range(self.order - 1))
+        random_ = self.rng.random
+        symbols = engine.symbols
+        cum_weights = engine.cum_weights
+        totals = engine.totals
+        transitions = engine.transitions
+        normalized_training = engine.normalized_training
+        normalize_case = self.normalize_case
 
         for _ in range(max_attempts):
-            prefix = start_prefix
+            state = engine.start
             out_chars: List[str] = []
 
-            # Sample until end token or max_len reached
-            while len(out_chars) < max_len:
-                nxt = self._sample_next(prefix)
-                if nxt is None:
-                    # Fallback: terminate early if model lacks this prefix
-                    break
+            # Sample until end token, unseen prefix or max_len reached
+            while len(out_chars) < max_len and state >= 0:
+                cum = cum_weights[state]
+                i = bisect(cum, random_() * totals[state], 0, len(cum) - 1)
+                nxt = symbols[state][i]
                 if nxt == _END:
                     break
                 out_chars.append(nxt)
                 # Slide the prefix window forward
-                prefix = (*prefix[1:], nxt)
+                state = transitions[state][i]
 
             # Enforce length constraints and avoid training words if requested
             candidate = "".join(out_chars)
@@ -152,41 +288,66 @@ class MarkovNameGenerator:
                 continue
             if avoid_training:
                 # Compare with normalized training words if normalize_case=True
-                comp = candidate if not self.normalize_case else candidate.lower()
-                # If training words were not normalized, compare raw data
-                # but we trained on normalized, so check case-insensitive match
-                if any(self._prepare_word(w, self.normalize_case) == comp for w in self._training_words):
+                comp = candidate if not normalize_case else candidate.lower()
+                if comp in normalized_training:
                     continue
 
             # Capitalize nicely if we normalized case during training
-            if self.normalize_case and candidate:
+            if normalize_case and candidate:
                 candidate = candidate[0].upper() + candidate[1:]
 
             return candidate
 
         return None  # Could not produce a valid candidate under constraints
 
+    def generate(
+        self,
+        max_len: int = 30,
+        min_len: int = 1,
+        avoid_training: bool = True,
+        max_attempts: int = 100,
+    ) -> Optional[str]:
+        """
+        Generate a single name/word.
+
+        - max_len: hard cap on characters (excluding start/end markers).
+        - min_len: minimum characters required (excluding markers).
+        - avoid_training: avoid returning any exact training word.
+        - max_attempts: attempts before giving up if avoid_training is True.
+        """
+        return self._generate_one(self._engine(), max_len, min_len, avoid_training, max_attempts)
+
     def generate_many(
         self,
         k: int,
         unique: bool = True,
-        **kwargs,
+        max_len: int = 30,
+        min_len: int = 1,
+        avoid_training: bool = True,
+        max_attempts: int = 100,
+        max_tries_per_item: int = 50,
     ) -> List[str]:
         """
         Generate multiple names/words.
 
+        Shares one compiled engine across the whole batch, so producing
+        thousands of names per call only pays for sampling.
+
         - k: number of items to produce.
         - unique: if True, deduplicate generated outputs.
-        - kwargs: forwarded to `generate` (e.g., max_len, min_len, avoid_training).
+        - max_tries_per_item: give up after k * max_tries_per_item calls.
+        - other arguments as in `generate`.
         """
+        engine = self._engine()
+        generate_one = self._generate_one
         results: List[str] = []
         seen: Set[str] = set()
         attempts = 0
-        target = k
+        limit = k * max_tries_per_item
 
-        while len(results) < target and attempts < k * 50:
+        while len(results) < k and attempts < limit:
             attempts += 1
-            item = self.generate(**kwargs)
+            item = generate_one(engine, max_len, min_len, avoid_training, max_attempts)
             if item is None:
                 continue
             if unique:
@@ -198,10 +359,10 @@ class MarkovNameGenerator:
 
 
 if __name__ == "__main__":
-    from corpus import CORPUS
+    import corpus
 
-    corp = CORPUS['biomes']['M']['regions']
-    corp = CORPUS['towns']
+    corp = corpus.words('biomes.M.regions')
+    corp = corpus.words('towns')
     seed = 'aefaefa'
     count = 10
 
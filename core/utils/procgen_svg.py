@@ -1,11 +1,18 @@
+import re
+import gzip
 import math
 import hashlib
 import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Iterable
 
 
-def generate_abstract_entity(seed_string: str) -> str:
+def render_abstract_entity(seed_string: str) -> str:
     """
     Generates a unique abstract SVG creature based on a seed string.
+    Draws only from its own Random instance, so concurrent calls never disturb each other or the global RNG.
 
     Args:
         seed_string (str): Unique ID (e.g. "monster-1", "player-name")
@@ -18,7 +25,7 @@ def generate_abstract_entity(seed_string: str) -> str:
     # Convert string to a stable integer seed
     hash_obj = hashlib.md5(seed_string.encode())
     seed_int = int(hash_obj.hexdigest(), 16)
-    random.seed(seed_int)
+    rng = random.Random(seed_int)
 
     # PARAMETERS
     # Viewbox center
@@ -26,22 +33,22 @@ def generate_abstract_entity(seed_string: str) -> str:
 
     # Determine Archetype
     # 0 = Organic (Curves), 1 = Crystalline (Sharp), 2 = Construct (90-degree steps)
-    archetype = random.choice(['organic', 'crystalline', 'construct'])
+    archetype = rng.choice(['organic', 'crystalline', 'construct'])
 
     # Determine Symmetry (makes it look more like a "creature")
-    has_symmetry = random.choice([True, True, False])  # 66% chance of symmetry
+    has_symmetry = rng.choice([True, True, False])  # 66% chance of symmetry
 
     # GENERATE VERTICES (Polar Coordinates)
     # We generate points around a circle, varying the radius
     points = []
 
     # Number of vertices
-    num_points = random.randint(6, 16)
+    num_points = rng.randint(6, 16)
     angle_step = (2 * math.pi) / num_points
 
     # Base radius settings
-    base_radius = random.randint(15, 30)
-    variance = random.randint(10, 25)  # How wild the shape gets
+    base_radius = rng.randint(15, 30)
+    variance = rng.randint(10, 25)  # How wild the shape gets
 
     for i in range(num_points):
         # Calculate angle
@@ -49,7 +56,7 @@ def generate_abstract_entity(seed_string: str) -> str:
 
         # Calculate Radius with procedural noise
         # We use a secondary random call to simulate "noise" for the radius
-        r_change = random.randint(-variance, variance)
+        r_change = rng.randint(-variance, variance)
         r = max(5, base_radius + r_change)  # Ensure radius is at least 5
 
         # If symmetry is on, we mirror the geometry
@@ -90,7 +97,7 @@ def generate_abstract_entity(seed_string: str) -> str:
             if next_idx == 0: mid_a += math.pi  # Handle wrap-around angle logic
 
             # Control radius is average of both + some extra blobbiness
-            ctrl_r = (r_curr + r_next) / 2 + random.randint(0, 10)
+            ctrl_r = (r_curr + r_next) / 2 + rng.randint(0, 10)
             cx_pt, cy_pt = get_xy(ctrl_r, mid_a)
             path_d += f"Q {cx_pt:.1f} {cy_pt:.1f}, {x_next:.1f} {y_next:.1f} "
 
@@ -101,7 +108,7 @@ def generate_abstract_entity(seed_string: str) -> str:
         elif archetype == 'construct':
             # Use Horizontal/Vertical steps (Manhattan geometry)
             # Move Horizontal then Vertical to the next point
-            if random.choice([True, False]):
+            if rng.choice([True, False]):
                 path_d += f"L {x_next:.1f} {y_curr:.1f} L {x_next:.1f} {y_next:.1f} "
             else:
                 path_d += f"L {x_curr:.1f} {y_next:.1f} L {x_next:.1f} {y_next:.1f} "
@@ -110,25 +117,25 @@ def generate_abstract_entity(seed_string: str) -> str:
 
     # GENERATE "CORE" (Eye/Center)
     core_svg = ""
-    if random.random() >= 0.2:
-        core_type = random.choice(['eyes', 'void', 'slits'])
+    if rng.random() >= 0.2:
+        core_type = rng.choice(['eyes', 'void', 'slits'])
 
         if core_type == 'eyes':
             # Round eyes near the center
-            eye_r = random.randint(3, 5)
-            eye_d = random.randint(5, 10)
+            eye_r = rng.randint(3, 5)
+            eye_d = rng.randint(5, 10)
             core_svg = (f'<circle cx="{50 - eye_d}" cy="50" r="{eye_r}" fill="black" stroke="white" stroke-width="2"/>'
                         f'<circle cx="{50 + eye_d}" cy="50" r="{eye_r}" fill="black" stroke="white" stroke-width="2"/>')
 
         elif core_type == 'void':
             # A hollow ring cut out (White stroke, black fill)
-            r_void = random.randint(5, 8)
+            r_void = rng.randint(5, 8)
             core_svg = f'<circle cx="50" cy="50" r="{r_void}" fill="black" stroke="white" stroke-width="2" />'
 
         elif core_type == 'slits':
             # Narrow slits
-            h = random.randint(3, 5)
-            w = random.randint(5, 10)
+            h = rng.randint(3, 5)
+            w = rng.randint(5, 10)
             core_svg = (f'<rect x="{45 - w / 2}" y="{50 - h / 2}" width="{w}" height="{h}" fill="black" stroke="white"'
                         f' stroke-width="2" rx="2" />'
                         f'<rect x="{55 - w / 2}" y="{50 - h / 2}" width="{w}" height="{h}" fill="black" stroke="white"'
@@ -137,17 +144,17 @@ def generate_abstract_entity(seed_string: str) -> str:
     # GENERATE ANIMATION
     anim_wrapper_open = "<g>"
     anim_wrapper_close = "</g>"
-    anim_type = random.choice(['breathing', 'vibrating', 'hopping', 'floating'])
+    anim_type = rng.choice(['breathing', 'vibrating', 'hopping', 'floating'])
 
     # Calculate random duration (speed)
     # Higher duration = Slower animation
-    speed_factor = random.uniform(0.5, 3.0)
+    speed_factor = rng.uniform(0.5, 3.0)
 
     if anim_type == 'breathing':
         # Scale transform centered on 50,50
         dur = f"{2 * speed_factor:.1f}s"
         # Random intensity (1.05 to 1.15 scale)
-        scale_max = round(random.uniform(1.05, 1.15), 2)
+        scale_max = round(rng.uniform(1.05, 1.15), 2)
 
         anim_wrapper_open = (
             f'<g transform-origin="50 50">'
@@ -160,8 +167,8 @@ def generate_abstract_entity(seed_string: str) -> str:
         dur = f"{0.1 * speed_factor:.2f}s"
         offsets = []
         for _ in range(3):
-            ox = random.randint(-2, 2)
-            oy = random.randint(-2, 2)
+            ox = rng.randint(-2, 2)
+            oy = rng.randint(-2, 2)
             offsets.append(f"{ox},{oy}")
 
         val_string = f"0,0; {offsets[0]}; {offsets[1]}; {offsets[2]}; 0,0"
@@ -174,7 +181,7 @@ def generate_abstract_entity(seed_string: str) -> str:
     elif anim_type == 'hopping':
         # Up and down translation with a "ground" pause
         dur = f"{1.0 * speed_factor:.1f}s"
-        height = random.randint(5, 15)
+        height = rng.randint(5, 15)
 
         # values: 0 (ground) -> -height (peak) -> 0 (ground) -> 0 (pause)
         anim_wrapper_open = (
@@ -188,7 +195,7 @@ def generate_abstract_entity(seed_string: str) -> str:
     elif anim_type == 'floating':
         # Smooth Sine-wave bobbing
         dur = f"{3.0 * speed_factor:.1f}s"
-        range_y = random.randint(3, 8)
+        range_y = rng.randint(3, 8)
 
         anim_wrapper_open = (
             f'<g>'
@@ -211,4 +218,272 @@ def generate_abstract_entity(seed_string: str) -> str:
     </svg>
     """
 
-    return " ".join(svg_template.split())
\ No newline at end of file
+    return " ".join(svg_template.split())
+
+
+# Output optimization
+# Sprites are rewritten into a viewBox SPRITE_SCALE times larger, which turns the one-decimal coordinates into
+# integers without losing precision, with relative path commands and shared classes instead of presentation
+# attributes. SPRITE_CSS must stay in sync with the sprite rules in static/css/style.css; the sprite sheet
+# embeds it because page styles do not reach into externally referenced <use> content.
+SPRITE_SCALE = 10
+
+SPRITE_CLASSES = {
+    ('white', 'black', None): 'sw',
+    ('white', 'black', '2'): 'sw2',
+    ('black', 'white', '2'): 'sk2',
+    ('black', None, None): 'sk',
+}
+
+SPRITE_CSS = (f'.sw{{fill:#fff;stroke:#000;stroke-width:{SPRITE_SCALE}}}'
+              f'.sw2{{fill:#fff;stroke:#000;stroke-width:{2 * SPRITE_SCALE}}}'
+              f'.sk2{{fill:#000;stroke:#fff;stroke-width:{2 * SPRITE_SCALE}}}'
+              f'.sk{{fill:#000}}')
+
+_TAG_RE = re.compile(r'<(/?)([\w:-]+)((?:\s*[\w:-]+="[^"]*")*)\s*(/?)>')
+_ATTR_RE = re.compile(r'([\w:-]+)="([^"]*)"')
+_PATH_RE = re.compile(r'[MQLZ]|-?\d+(?:\.\d+)?')
+_NUM_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+_SCALED_ATTRS = {'x', 'y', 'width', 'height', 'r', 'cx', 'cy', 'rx', 'ry', 'stroke-width', 'transform-origin'}
+_PAINT_ATTRS = ('fill', 'stroke', 'stroke-width')
+
+
+def _scale(value: str) -> str:
+    return _NUM_RE.sub(lambda m: str(round(float(m.group()) * SPRITE_SCALE)), value)
+
+
+def _minify_path(d: str) -> str:
+    """
+    Rewrites an absolute M/Q/L/Z path as integer relative commands, dropping repeated command letters and
+    zero-length segments and using h/v for axis-aligned lines. Deltas are taken between quantized points so
+    rounding never accumulates.
+    """
+    tokens = _PATH_RE.findall(d)
+    out = []
+    last = None
+    x = y = 0
+    i = 0
+
+    def emit(cmd, *nums):
+        nonlocal last
+
+        if cmd != last:
+            out.append(cmd)
+        elif nums[0] >= 0:
+            out.append(' ')
+
+        out.append(' '.join(str(n) for n in nums).replace(' -', '-'))
+        last = cmd
+
+    def point(j):
+        return round(float(tokens[j]) * SPRITE_SCALE), round(float(tokens[j + 1]) * SPRITE_SCALE)
+
+    while i < len(tokens):
+        cmd = tokens[i]
+
+        if cmd == 'M':
+            x, y = point(i + 1)
+            emit('M', x, y)
+            i += 3
+
+        elif cmd == 'L':
+            nx, ny = point(i + 1)
+            dx, dy = nx - x, ny - y
+
+            if dx and dy:
+                emit('l', dx, dy)
+            elif dx:
+                emit('h', dx)
+            elif dy:
+                emit('v', dy)
+
+            x, y = nx, ny
+            i += 3
+
+        elif cmd == 'Q':
+            qx, qy = point(i + 1)
+            nx, ny = point(i + 3)
+            emit('q', qx - x, qy - y, nx - x, ny - y)
+            x, y = nx, ny
+            i += 5
+
+        else:
+            emit('z')
+            i += 1
+
+    return ''.join(out).replace('z ', 'z')
+
+
+def optimize_svg(svg: str) -> str:
+    """
+    Compacts a sprite generated by this module (or the player sprite) for the wire, see SPRITE_SCALE.
+    The {public_id}/{top}/{left} placeholders of the outer element are kept.
+    """
+    out = []
+
+    for closing, tag, attr_str, self_closing in _TAG_RE.findall(svg):
+        if closing:
+            out.append(f'</{tag}>')
+            continue
+
+        attrs = dict(_ATTR_RE.findall(attr_str))
+
+        if tag == 'svg':
+            box = [int(n) * SPRITE_SCALE for n in attrs.get('viewBox', '0 0 100 100').split()]
+            style = ';'.join(part.replace(' ', '') for part in attrs.get('style', '').split(';')
+                             if part.strip().startswith(('top', 'left')))
+            attrs = {'id': attrs.get('id'),
+                     'class': f"{attrs.get('class', '')} entity".strip(),
+                     'style': style or None,
+                     'viewBox': ' '.join(map(str, box))}
+
+        else:
+            paint = tuple(attrs.get(name) for name in _PAINT_ATTRS)
+            css_class = SPRITE_CLASSES.get(paint)
+
+            if css_class:
+                for name in _PAINT_ATTRS:
+                    attrs.pop(name, None)
+
+                attrs = {'class': css_class, **attrs}
+
+            for name, value in attrs.items():
+                if name in _SCALED_ATTRS:
+                    attrs[name] = _scale(value)
+
+            if tag == 'path':
+                attrs['d'] = _minify_path(attrs['d'])
+
+            elif tag == 'animateTransform':
+                if attrs.get('type') == 'translate':
+                    attrs['values'] = _scale(attrs['values'])
+
+                for name in ('values', 'keyTimes', 'keySplines'):
+                    if name in attrs:
+                        attrs[name] = re.sub(r'\s*([;,])\s*', r'\1', attrs[name])
+
+        attr_out = ''.join(f' {name}="{value}"' for name, value in attrs.items() if value is not None)
+        out.append(f'<{tag}{attr_out}{"/" if self_closing else ""}>')
+
+    return ''.join(out)
+
+
+def render_compact_entity(seed_string: str) -> str:
+    """
+    render_abstract_entity passed through optimize_svg.
+    """
+    return optimize_svg(render_abstract_entity(seed_string))
+
+
+def size_report(seed_strings: Iterable[str]) -> dict:
+    """
+    Byte totals of raw and optimized sprites over a set of seeds, plain and gzipped.
+    """
+    raw = [render_abstract_entity(seed) for seed in seed_strings]
+    compact = [optimize_svg(svg) for svg in raw]
+
+    def sizes(svgs):
+        data = [svg.encode() for svg in svgs]
+        return sum(map(len, data)), sum(len(gzip.compress(item)) for item in data)
+
+    raw_bytes, raw_gzip = sizes(raw)
+    compact_bytes, compact_gzip = sizes(compact)
+
+    return {'sprites': len(raw),
+            'raw_bytes': raw_bytes, 'compact_bytes': compact_bytes,
+            'raw_gzip': raw_gzip, 'compact_gzip': compact_gzip}
+
+
+class EntitySpriteGenerator:
+    """
+    Memoizing front end for render_abstract_entity.
+
+    Sprites are a pure function of their seed, so they are kept in an LRU of `cache_size` entries keyed by seed.
+    The cache is guarded by a lock and rendering happens outside it, so one instance can serve every thread of a
+    worker. Each process in a pool simply builds its own. With `optimize` the sprites go through optimize_svg.
+    """
+
+    def __init__(self, cache_size: int = 2048, optimize: bool = False):
+        self.cache_size = cache_size
+        self._renderer = render_compact_entity if optimize else render_abstract_entity
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, seed_string: str) -> str | None:
+        with self._lock:
+            svg = self._cache.get(seed_string)
+
+            if svg is not None:
+                self._cache.move_to_end(seed_string)
+
+            return svg
+
+    def _put(self, seed_string: str, svg: str) -> None:
+        with self._lock:
+            self._cache[seed_string] = svg
+            self._cache.move_to_end(seed_string)
+
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def generate(self, seed_string: str) -> str:
+        svg = self._get(seed_string)
+
+        if svg is None:
+            svg = self._renderer(seed_string)
+            self._put(seed_string, svg)
+
+        return svg
+
+    def generate_many(self, seeds: Iterable[str], executor: Executor | None = None) -> list[str]:
+        """
+        Renders a sprite per seed, in input order, rendering each distinct uncached seed once.
+
+        Misses are rendered in this thread unless an `executor` is given, in which case they are mapped over it.
+        The renderers are top-level functions, so a ProcessPoolExecutor can spread them across cores.
+        """
+        seeds = list(seeds)
+        rendered = {}
+        misses = []
+
+        for seed in dict.fromkeys(seeds):
+            svg = self._get(seed)
+
+            if svg is None:
+                misses.append(seed)
+            else:
+                rendered[seed] = svg
+
+        results = map(self._renderer, misses) if executor is None else executor.map(self._renderer, misses)
+
+        for seed, svg in zip(misses, results):
+            rendered[seed] = svg
+            self._put(seed, svg)
+
+        return [rendered[seed] for seed in seeds]
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_default = EntitySpriteGenerator()
+_compact = EntitySpriteGenerator(optimize=True)
+
+
+def generate_abstract_entity(seed_string: str) -> str:
+    """
+    Cached sprite for a seed string, see render_abstract_entity.
+    """
+    return _default.generate(seed_string)
+
+
+def generate_abstract_entities(seed_strings: Iterable[str], executor: Executor | None = None,
+                               optimize: bool = False) -> list[str]:
+    """
+    Batch form of generate_abstract_entity, optionally returning optimized sprites.
+    """
+    generator = _compact if optimize else _default
+
+    return generator.generate_many(seed_strings, executor=executor)
@@ -61,10 +61,13 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.QueryCountMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.replicas.ReadYourWritesMiddleware',
+    'core.identity.IdentityMapMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -106,6 +109,40 @@ DATABASES = {
     }
 }
 
+# The primary key type the migrations were created with
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Read replicas: every host in PG_REPLICA_HOSTS becomes a `replica_<n>` alias of the default database on that host.
+# Selected pure reads (polled chat, player lists and logs, travel data, character and admin lists) are sent there
+# and a user's own writes pin them to the primary for READ_YOUR_WRITES_WINDOW seconds, see core/replicas.py
+DATABASE_READ_ALIASES = []
+
+for i, host in enumerate(filter(None, os.environ.get('PG_REPLICA_HOSTS', '').split(',')), start=1):
+    DATABASES[f'replica_{i}'] = {**DATABASES['default'], 'HOST': host.strip(), 'TEST': {'MIRROR': 'default'}}
+    DATABASE_READ_ALIASES.append(f'replica_{i}')
+
+DATABASE_ROUTERS = ['core.replicas.ReplicaRouter']
+READ_YOUR_WRITES_WINDOW = int(os.environ.get('QUMUD_READ_YOUR_WRITES', 5))
+
+# Opt-in: report the database queries of every request in an X-Query-Count header, read by `manage.py load_test`
+QUERY_COUNT_HEADER = os.environ.get('QUMUD_QUERY_COUNT_HEADER', 'False').lower() in ('1', 'true')
+
+# Map update polls of a user arriving within this many seconds of the last completed one get an empty response,
+# 0 turns throttling off. Concurrent duplicates are always coalesced, see world/polling.py
+POLL_MIN_INTERVAL = float(os.environ.get('QUMUD_POLL_MIN_INTERVAL', 0.5))
+
+# Opt-in: a dungeon poll that finds its event locked by another poller returns the last committed state
+# instead of waiting to simulate, see world/event.py
+EVENT_SKIP_LOCKED = os.environ.get('QUMUD_EVENT_SKIP_LOCKED', 'False').lower() in ('1', 'true')
+
+# Opt-in: dungeon polls simulate without a row lock and commit only if the event's version is unchanged,
+# takes precedence over EVENT_SKIP_LOCKED, see world/event.py
+EVENT_OPTIMISTIC = os.environ.get('QUMUD_EVENT_OPTIMISTIC', 'False').lower() in ('1', 'true')
+
+# Opt-in: keep transient combat tables (enemies, event logs) UNLOGGED on Postgres to cut WAL writes.
+# Applied after every migrate, their contents are lost on crash recovery, see world/storage.py
+UNLOGGED_COMBAT_TABLES = os.environ.get('QUMUD_UNLOGGED_COMBAT', 'False').lower() in ('1', 'true')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -183,6 +220,26 @@ REST_FRAMEWORK = {
     ]
 }
 
+# Serve event sprites as a cached per-location <symbol> sheet referenced by <use>, instead of inline svg per entity
+SPRITE_SHEETS = os.environ.get('QUMUD_SPRITE_SHEETS', 'False').lower() in ('1', 'true')
+SPRITE_SHEET_MAX_AGE = int(os.environ.get('QUMUD_SPRITE_SHEET_MAX_AGE', 60 * 60 * 24 * 365))
+
+# Cache of static game data (classes, archetypes, enemy templates, region locations), see world/gamedata.py.
+# 'local' keeps it in each worker process, 'shared' in the default Django cache so invalidations reach every worker
+GAME_DATA_CACHE = os.environ.get('QUMUD_GAME_DATA_CACHE', 'local')
+GAME_DATA_TIMEOUT = int(os.environ.get('QUMUD_GAME_DATA_TIMEOUT', 300))
+
+# Pre-trained Markov name models, built with `manage.py build_markov_models` and loaded at startup when present
+MARKOV_MODELS_PATH = os.environ.get('QUMUD_MARKOV_MODELS', os.path.join(BASE_DIR, 'core', 'utils', 'markov_models.json.gz'))
+
+# Background threads per process that generate new worlds, see world/worldgen.py
+WORLDGEN_WORKERS = int(os.environ.get('QUMUD_WORLDGEN_WORKERS', 1))
+# Regions per new world, and processes used to plan them in parallel for larger worlds
+WORLD_REGIONS = int(os.environ.get('QUMUD_WORLD_REGIONS', 1))
+WORLDGEN_PROCESSES = int(os.environ.get('QUMUD_WORLDGEN_PROCESSES', os.cpu_count() or 1))
+# Pre-generated regions kept ready for new worlds, 0 disables the pool and worlds are generated from their name
+WORLD_POOL_SIZE = int(os.environ.get('QUMUD_WORLD_POOL_SIZE', 0))
+
 # URL Redirects
 LOGIN_URL = 'login'
 LOGOUT_REDIRECT_URL = 'login'
@@ -1,10 +1,14 @@
 from django.contrib import admin
 from datetime import datetime
+
+from core.admin import ReplicaReadAdmin
 from .models import (
-    World, Region, Location,
-    Event, EnemyTemplate, Entity, Player, Enemy,
-    RegionChatMessage, EventLog, PlayerLog, EnemyArchetype
+    World, WorldJob, Region, Location,
+    Event, EnemyTemplate, Entity, Player, PlayerState, Enemy,
+    RegionChatMessage, EventLog, PlayerLog, EnemyArchetype, PlayerClass
 )
+from .gamedata import invalidate_instance
+from .spawns import invalidate_spawn_table
 
 
 # ==========================================
@@ -15,17 +19,26 @@ class LocationInline(admin.TabularInline):
     model = Location
     extra = 0
     fields = ('name', 'type', 'level', 'max_players')
-    readonly_fields = ('last_event',)
+    readonly_fields = ('last_event', 'event_claimed')
     show_change_link = True
 
 
-class PlayerInline(admin.TabularInline):
-    model = Player
+class PlayerStateInline(admin.TabularInline):
+    model = PlayerState
     extra = 0
-    fields = ('name', 'health', 'level')
-    readonly_fields = ('name', 'health', 'level')
+    fields = ('player', 'health', 'position')
+    readonly_fields = ('player', 'health', 'position')
     verbose_name = "Players in Event"
-    show_change_link = True
+    show_change_link = False
+
+
+class PlayerRuntimeInline(admin.StackedInline):
+    model = PlayerState
+    extra = 0
+    fields = ('event', 'health', 'position', 'left', 'top', 'event_joined')
+    raw_id_fields = ('event',)
+    verbose_name = "Runtime state"
+    can_delete = False
 
 
 class EnemyInline(admin.TabularInline):
@@ -55,45 +68,71 @@ class PlayerLogInline(admin.TabularInline):
     show_change_link = True
 
 
+# ==========================================
+# Actions
+# ==========================================
+
+@admin.action(description='Refresh cached game data of selected')
+def refresh_game_data(modeladmin, request, queryset):
+    # Saves and deletes refresh the cache on their own, this is for changes made with bulk updates or raw SQL
+    for obj in queryset:
+        invalidate_instance(type(obj), obj)
+
+        if isinstance(obj, EnemyTemplate):
+            invalidate_spawn_table(EnemyTemplate, obj)
+
+    modeladmin.message_user(request, f'Refreshed cached game data of {len(queryset)} objects.')
+
+
 # ==========================================
 # Model Admins
 # ==========================================
 
 @admin.register(World)
-class WorldAdmin(admin.ModelAdmin):
+class WorldAdmin(ReplicaReadAdmin):
     list_display = ('name', 'public_id', 'start_location')
     readonly_fields = ('public_id',)
     raw_id_fields = ('start_location',)
     search_fields = ('name', 'public_id')
 
 
+@admin.register(WorldJob)
+class WorldJobAdmin(ReplicaReadAdmin):
+    list_display = ('name', 'status', 'progress', 'world')
+    list_filter = ('status',)
+    raw_id_fields = ('world',)
+    readonly_fields = ('public_id',)
+    search_fields = ('name', 'public_id')
+
+
 @admin.register(Region)
-class RegionAdmin(admin.ModelAdmin):
+class RegionAdmin(ReplicaReadAdmin):
     list_display = ('name', 'biome', 'level', 'world')
     list_filter = ('world', 'biome')
-    raw_id_fields = ('world',)
+    raw_id_fields = ('world', 'connections')
     readonly_fields = ('public_id',)
     search_fields = ('name', 'public_id')
     inlines = [LocationInline]
 
 
 @admin.register(Location)
-class LocationAdmin(admin.ModelAdmin):
+class LocationAdmin(ReplicaReadAdmin):
     list_display = ('name', 'type', 'level', 'region', 'max_players')
     list_filter = ('type', 'level', 'region__world')
     raw_id_fields = ('region',)
     readonly_fields = ('public_id',)
     search_fields = ('name', 'public_id')
+    actions = [refresh_game_data]
 
 
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
-    list_display = ('__str__', 'active', 'ended_fmt', 'last_update_fmt')
+class EventAdmin(ReplicaReadAdmin):
+    list_display = ('__str__', 'active', 'slots_taken', 'version', 'ended_fmt', 'last_update_fmt')
     list_filter = ('active', 'location__region')
     raw_id_fields = ('location',)
     readonly_fields = ('public_id', 'last_update')
 
-    inlines = [PlayerInline, EnemyInline, EventLogInline]
+    inlines = [PlayerStateInline, EnemyInline, EventLogInline]
 
     def last_update_fmt(self, obj):
         return datetime.fromtimestamp(obj.last_update).strftime('%H:%M:%S') if obj.last_update else "-"
@@ -106,23 +145,32 @@ class EventAdmin(admin.ModelAdmin):
 
 
 @admin.register(EnemyArchetype)
-class EnemyArchetypeAdmin(admin.ModelAdmin):
+class EnemyArchetypeAdmin(ReplicaReadAdmin):
     list_display = ('name',)
     list_filter = ('name',)
     search_fields = ('name',)
+    actions = [refresh_game_data]
+
+
+@admin.register(PlayerClass)
+class PlayerClassAdmin(ReplicaReadAdmin):
+    list_display = ('name', 'str', 'dex', 'int', 'vit', 'mnd')
+    search_fields = ('name',)
+    actions = [refresh_game_data]
 
 
 @admin.register(EnemyTemplate)
-class EnemyTemplateAdmin(admin.ModelAdmin):
-    list_display = ('name', 'level', 'location')
+class EnemyTemplateAdmin(ReplicaReadAdmin):
+    list_display = ('name', 'level', 'spawn_weight', 'location')
     list_filter = ('level', 'location__region')
     raw_id_fields = ('location',)
     search_fields = ('name',)
+    actions = [refresh_game_data]
 
 
 @admin.register(Entity)
-class EntityAdmin(admin.ModelAdmin):
-    list_display = ('name', 'type', 'level', 'health')
+class EntityAdmin(ReplicaReadAdmin):
+    list_display = ('name', 'type', 'level', 'max_health')
     list_filter = ('type', 'level')
     raw_id_fields = ('target',)
     readonly_fields = ('public_id',)
@@ -130,20 +178,20 @@ class EntityAdmin(admin.ModelAdmin):
 
 
 @admin.register(Player)
-class PlayerAdmin(admin.ModelAdmin):
-    list_display = ('name', 'owner', 'level', 'location', 'event', 'last_stat_update_fmt')
+class PlayerAdmin(ReplicaReadAdmin):
+    list_display = ('name', 'owner', 'level', 'location', 'last_stat_update_fmt')
     list_filter = ('level',)
-    raw_id_fields = ('owner', 'active', 'location', 'event', 'target')
+    raw_id_fields = ('owner', 'active', 'location', 'target')
     readonly_fields = ('public_id',)
     search_fields = ('name', 'public_id', 'owner__username')
 
-    inlines = [PlayerLogInline]
+    inlines = [PlayerRuntimeInline, PlayerLogInline]
 
     fieldsets = (
         ('Identity', {'fields': ('public_id', 'name', 'owner', 'active')}),
-        ('State', {'fields': ('location', 'event', 'target', 'position', 'svg' )}),
+        ('State', {'fields': ('location', 'target', 'svg' )}),
         ('Stats', {'fields': (('level', 'xp', 'xp_next_lvl'),
-                              ('health', 'max_health', 'mana', 'max_mana'),
+                              ('max_health', 'mana', 'max_mana'),
                               ('str', 'dex', 'int', 'vit', 'mnd'),
                               ('min_damage', 'max_damage', 'attack_range', 'speed', 'stat_points'))}),
     )
@@ -153,16 +201,16 @@ class PlayerAdmin(admin.ModelAdmin):
 
 
 @admin.register(Enemy)
-class EnemyAdmin(admin.ModelAdmin):
+class EnemyAdmin(ReplicaReadAdmin):
     list_display = ('name', 'level', 'event')
     list_filter = ('level',)
-    raw_id_fields = ('event', 'target')
+    raw_id_fields = ('event', 'template')
     readonly_fields = ('public_id',)
     search_fields = ('name', 'public_id')
 
 
 @admin.register(RegionChatMessage)
-class RegionChatMessageAdmin(admin.ModelAdmin):
+class RegionChatMessageAdmin(ReplicaReadAdmin):
     list_display = ('user', 'region', 'message_preview', 'created_at_fmt')
     raw_id_fields = ('user', 'region')
     readonly_fields = ('created_at',)
@@ -176,7 +224,7 @@ class RegionChatMessageAdmin(admin.ModelAdmin):
 
 
 @admin.register(PlayerLog)
-class PlayerLogAdmin(admin.ModelAdmin):
+class PlayerLogAdmin(ReplicaReadAdmin):
     list_display = ('player', 'log', 'created_at')
     list_filter = ('player', 'log', 'created_at')
     raw_id_fields = ('player',)
@@ -0,0 +1,227 @@
+"""
+Token authenticated JSON game state for bots and third-party clients.
+
+`GET /api/state?since=<cursor>` advances the active character's event like a Map poll and returns only what changed
+after the cursor, along with the cursor to send next. Start with `since=0` (or no cursor) for a full snapshot.
+Rows are arrays rather than objects to keep polls small:
+
+    player    {id, name, lvl, hp: [cur, max], mp: [cur, max], xp: [cur, next], loc}
+    travel    {loc: [id, name, type], towns: [[id, name, lvl]], dungeons: [[id, name, lvl]]}, only after moving
+    event     {id, entities: [[id, hp, left, top]], new: [[id, type, name, max_hp]], log: [[t, text]]} or null
+    logs      [[t, text]]           player logs
+    chat      [[t, alias, text]]    region chat
+    players   [alias]               region players online
+
+`GET /api/batch?characters=<id>,<id>&since=<cursor>` does the same for several owned characters at once, whether
+or not they are the active one, and returns {cursor, characters: {id: state}, unavailable: [id]}. Characters in the
+same event share one simulation.
+
+Timestamps are the server's created_at. Rows written by other requests while a poll runs can show up again in the
+next one, so clients should drop rows they have already seen. Logs and chat are selected by the cursor and always
+read from the primary, only the online players may come from a read replica.
+"""
+import time
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import DEFAULT_DB_ALIAS
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from authentication.models import User
+from core import identity
+from core.replicas import read_db
+from .models import Player, PlayerLog, RegionChatMessage
+from .event import event_queryset, event_snapshot, process_town_event
+from .views import BaseView
+
+# Rows per list in one response
+API_ROW_LIMIT = 50
+
+# Chat older than this is never returned, matching the chat window of the site
+CHAT_WINDOW = 600
+
+# Characters per batch call
+BATCH_LIMIT = 20
+
+PLAYER_RELATED = ['location__region__world', 'state__event', 'owner']
+
+
+def parse_cursor(value: str | None) -> float:
+    try:
+        return max(0.0, float(value or 0))
+    except ValueError:
+        raise ValidationError({'since': 'Expected a timestamp returned as `cursor`.'})
+
+
+def player_status(player: Player) -> dict:
+    return {
+        'id': str(player.public_id),
+        'name': player.name,
+        'lvl': player.level,
+        'hp': [player.state.health, player.max_health],
+        'mp': [player.mana, player.max_mana],
+        'xp': [player.xp, player.xp_next_lvl],
+        'loc': str(player.location.public_id) if player.location else None,
+    }
+
+
+def travel_status(player: Player) -> dict:
+    travel = BaseView.get_travel_data(player=player)
+    location = travel['current_location']
+
+    return {
+        'loc': [str(location.public_id), location.name, location.type],
+        'towns': [[str(t.public_id), t.name, t.level] for t in travel['towns']],
+        'dungeons': [[str(d.public_id), d.name, d.level] for d in travel['dungeons']],
+    }
+
+
+def event_status(event_data: dict | None, since: float, full: bool) -> dict | None:
+    if not event_data or event_data.get('entities') is None:
+        return None
+
+    entities = event_data['entities']
+
+    return {
+        'entities': [[str(e.public_id), e.health, int(e.left), int(e.top)] for e in entities],
+        'new': [[str(e.public_id), e.type, e.name, e.max_health]
+                for e in entities if full or e.event_joined >= since],
+        # Placeholder lines of the site (dicts without a timestamp) are left out
+        'log': [[log.created_at, log.log]
+                for log in reversed(list(event_data['log'])) if hasattr(log, 'created_at')],
+    }
+
+
+def observe_event(player: Player, full: bool) -> dict | None:
+    """
+    Event data of a player's current event as last committed, without simulating or joining.
+    """
+    event = player.state.event
+
+    if player.location.type == 'D':
+        return event_snapshot(player, event_queryset(event.id, full))
+
+    return process_town_event(player, event, full, joined=False)
+
+
+def game_state(player: Player, since: float, db: str = DEFAULT_DB_ALIAS, simulate: bool = True) -> dict:
+    """
+    Advances the player's event and returns the compact state changed since `since`, see the module docstring.
+    `player` must be loaded with PLAYER_RELATED. `db` is used for the online players, which may come from a replica,
+    rows selected by the cursor are read from the primary so rows a replica has not received yet are not skipped.
+    Without `simulate` the player must be in an event, which is only read, for events another character of the
+    same request has just advanced.
+    """
+    full = since == 0
+
+    # The event code selects logs and new entities by the owner's last refresh, here the client's cursor stands in
+    player.owner.last_refresh = since
+
+    if simulate:
+        event_data, joined = BaseView.get_event_data(player=player, full=full)
+    else:
+        event_data, joined = observe_event(player, full), False
+
+    cursor = time.time()
+    player = Player.objects.select_related(*PLAYER_RELATED).get(id=player.id)
+    region = player.location.region
+
+    event = event_status(event_data, since, full or joined)
+
+    if event is not None:
+        event['id'] = str(player.state.event.public_id) if player.state.event else None
+
+    logs = (PlayerLog.objects
+            .filter(player_id=player.id, created_at__gte=since)
+            .order_by('-created_at')
+            .values_list('created_at', 'log')[:API_ROW_LIMIT])
+
+    chat = (RegionChatMessage.objects
+            .filter(region=region, created_at__gte=max(since, cursor - CHAT_WINDOW))
+            .order_by('-created_at')
+            .values_list('created_at', 'user__alias', 'message')[:API_ROW_LIMIT])
+
+    state = {
+        'cursor': cursor,
+        'player': player_status(player),
+        'travel': travel_status(player) if full or player.last_travel >= since else None,
+        'event': event,
+        'logs': [list(row) for row in reversed(list(logs))],
+        'chat': [list(row) for row in reversed(list(chat))],
+        'players': list(BaseView.get_region_players(region=region, db=db).values_list('alias', flat=True)),
+    }
+
+    return state
+
+
+def mark_online(user_id: int) -> None:
+    # Polling the API keeps the owner in the region's online list
+    User.objects.filter(id=user_id).update(last_refresh=time.time())
+
+
+class GameState(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        since = parse_cursor(request.query_params.get('since'))
+        player = Player.objects.select_related(*PLAYER_RELATED).filter(active=request.user).first()
+
+        if player is None:
+            return Response({'detail': 'No active character.'}, status=404)
+
+        if player.location is None:
+            return Response({'detail': 'The active character has not joined a world.'}, status=409)
+
+        state = game_state(player, since, db=read_db(request))
+        mark_online(request.user.id)
+
+        return Response(state)
+
+
+class BatchGameState(APIView):
+    """
+    State of several owned characters in one call. The first character of an event advances it, the others in the
+    same event only read the result, so a party polled together is simulated once per call.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        since = parse_cursor(request.query_params.get('since'))
+        requested = [c for c in request.query_params.get('characters', '').split(',') if c]
+
+        if not requested or len(requested) > BATCH_LIMIT:
+            raise ValidationError({'characters': f'Expected 1 to {BATCH_LIMIT} comma separated character ids.'})
+
+        try:
+            players = list(Player.objects.select_related(*PLAYER_RELATED)
+                           .filter(owner=request.user, public_id__in=requested, location__isnull=False)
+                           .order_by('id'))
+        except DjangoValidationError:
+            raise ValidationError({'characters': 'Expected character ids.'})
+
+        # Joins and leaves during the polls are then reflected on these instances
+        identity.track(*players)
+
+        db = read_db(request)
+        states = {}
+        advanced = set()
+
+        for player in players:
+            simulate = player.state.event_id not in advanced
+            states[str(player.public_id)] = game_state(player, since, db=db, simulate=simulate)
+
+            # The event the character is in after the poll, it may just have joined one or left it, see core/identity
+            if player.state.event_id is not None:
+                advanced.add(player.state.event_id)
+
+        mark_online(request.user.id)
+
+        # Each state was read at its own time, the earliest is the one that misses nothing for any of them
+        cursor = min((state.pop('cursor') for state in states.values()), default=time.time())
+
+        return Response({'cursor': cursor,
+                         'characters': states,
+                         'unavailable': [c for c in requested if c not in states]})
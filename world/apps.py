@@ -1,5 +1,22 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, post_save, post_delete
 
 
 class WorldConfig(AppConfig):
     name = 'world'
+
+    def ready(self):
+        from .storage import sync_transient_tables_handler
+        from .spawns import invalidate_spawn_table
+        from .sprites import invalidate_sprite_sheet
+        from .gamedata import SOURCES, invalidate_instance
+
+        post_migrate.connect(sync_transient_tables_handler, sender=self)
+        post_save.connect(invalidate_spawn_table, sender='world.EnemyTemplate')
+        post_delete.connect(invalidate_spawn_table, sender='world.EnemyTemplate')
+        post_save.connect(invalidate_sprite_sheet, sender='world.EnemyTemplate')
+        post_delete.connect(invalidate_sprite_sheet, sender='world.EnemyTemplate')
+
+        for label in SOURCES:
+            post_save.connect(invalidate_instance, sender=label)
+            post_delete.connect(invalidate_instance, sender=label)
@@ -2,36 +2,40 @@ import math, random
 
 from core.utils.generators import procgen_enemies
 from .models import Location, EnemyTemplate, EnemyArchetype
+from .gamedata import enemy_archetypes
 
 
-def generate_enemy_templates(loc: Location, biome: str, count: int) -> None:
-    seed = loc.name
-    random.seed(seed)
+def plan_enemy_templates(seed: str, level: int, biome: str, count: int,
+                         archetypes: list[EnemyArchetype]) -> list[dict]:
+    """
+    Field values for the enemy templates of a location, without touching the database.
+    `archetypes` is the full archetype list ordered by id, loaded once by the caller.
+    """
+    procgen_data = procgen_enemies(seed=seed, biome=biome, count=count)
+    chosen = random.Random(seed).choices(archetypes, k=count)
     templates = []
 
-    procgen_data = procgen_enemies(seed=seed, biome=biome, count=count)
-    archetypes = random.choices(EnemyArchetype.objects.all().order_by('id'),  k=count)
-
-    i = 0
-    for data in procgen_data:
-        archetype = archetypes[i]
-        templates.append(
-            EnemyTemplate(
-                name=data['name'],
-                svg=data['svg'],
-                max_health = loc.level * 2 * archetype.hp_multi + 10,
-                attack_range = archetype.attack_range,
-                min_damage = math.floor(loc.level*(1 - archetype.dmg_dev/2) + 1),
-                max_damage= math.floor(loc.level*(1 + archetype.dmg_dev/2) + 1),
-                speed = archetype.speed,
-                initiative = loc.level * archetype.init_multi,
-                max_targets = 1,
-                level = loc.level,
-                award_xp = math.floor(((loc.level**2) / 5) + loc.level),
-                location = loc,
-                archetype = archetype
-            )
-        )
-        i += 1
-
-    EnemyTemplate.objects.bulk_create(templates)
\ No newline at end of file
+    for data, archetype in zip(procgen_data, chosen):
+        templates.append({
+            'name': data['name'],
+            'svg': data['svg'],
+            'max_health': level * 2 * archetype.hp_multi + 10,
+            'attack_range': archetype.attack_range,
+            'min_damage': math.floor(level*(1 - archetype.dmg_dev/2) + 1),
+            'max_damage': math.floor(level*(1 + archetype.dmg_dev/2) + 1),
+            'speed': archetype.speed,
+            'initiative': level * archetype.init_multi,
+            'max_targets': 1,
+            'level': level,
+            'award_xp': math.floor(((level**2) / 5) + level),
+            'archetype_id': archetype.id,
+        })
+
+    return templates
+
+
+def generate_enemy_templates(loc: Location, biome: str, count: int) -> None:
+    archetypes = list(enemy_archetypes())
+    templates = plan_enemy_templates(seed=loc.name, level=loc.level, biome=biome, count=count, archetypes=archetypes)
+
+    EnemyTemplate.objects.bulk_create([EnemyTemplate(location=loc, **fields) for fields in templates])
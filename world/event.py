@@ -3,109 +3,20 @@ import time
 import math
 from typing import Any
 
+from django.conf import settings
 from django.db import transaction
-from django.db.models import Prefetch, Count, Q
+from django.db.models import Prefetch, F
 
-from world.models import Event, Player, Enemy, EventLog, PlayerLog, Location, Entity
+from world.models import Event, Player, PlayerState, Enemy, EventLog, PlayerLog, Location
+from world.gamedata import location_templates
+from core import identity
 from core.utils import utils
-
-
-def get_or_create_event(location: Location) -> Event | None:
-    # We want to overflow players into the same events vs race-creating individual events
-    # select_for_update() on the location row as a transaction to ensure only one event created
-    # at a time
-
-    with transaction.atomic():
-        # Find existing events with less than player_limit number of players
-        prefetch_list = []
-
-        player_count = Count("entity", filter=Q(entity__type='P', active__isnull=False))
-        event_prefetch = Prefetch('event_set',
-                                  queryset=Event.objects.all()
-                                  .annotate(player_count=player_count)
-                                  .filter(player_count__lt=location.max_players, ended__isnull=True))
-        prefetch_list.append(event_prefetch)
-
-        if location.type == 'D':
-            prefetch_list.append(Prefetch('enemytemplate_set'))
-
-        location_locked = (Location.objects.select_for_update()
-                           .prefetch_related(*prefetch_list)
-                           .get(id=location.id))
-
-        events = location_locked.event_set.all()
-
-        if events:
-            # Just picking first available here
-            # Consider ordering or some other rank
-            event = events[0]
-
-        else:
-            if location_locked.type == 'T':
-                event = Event.objects.create(location=location, last_update=time.time())
-
-            elif location_locked.type == 'D':
-                delta = time.time() - location_locked.last_event
-                ticks = math.floor(delta)
-
-                if ticks < location_locked.spawn_rate:
-                    return None
-
-                eventlogs = []
-                event = Event.objects.create(location=location, last_update=time.time())
-
-                e_temps = location.enemytemplate_set.all()
-                e_positions = []
-
-                # Spawn 2-5 enemies of any combination from the template set
-                num_enemy = random.choice(range(2, 6))
-                templates = random.choices(e_temps, k=num_enemy)
-
-                for enemy in templates:
-                    position = 55 + enemy.initiative
-                    left = utils.clamp(((position / event.size) * 100), 5, 95)
-                    pos_round = 5 * round(left / 5)
-                    e_positions.append(pos_round)
-                    pos_count = e_positions.count(pos_round)
-
-                    # Alternate vertical position of close enemies above and below
-                    flip = 1
-                    if pos_count % 2 == 0:
-                        flip = -1
-
-                    top = utils.clamp(50 + (math.floor(pos_count / 2) * 10 * flip), 5, 95)
-
-                    e = Enemy.objects.create(event=event,
-                                             event_joined=time.time(),
-                                             position=position,
-                                             left=left,
-                                             top=top,
-                                             svg=enemy.svg,
-                                             name=enemy.name,
-                                             health=enemy.max_health,
-                                             max_health=enemy.max_health,
-                                             attack_range=enemy.attack_range,
-                                             min_damage=enemy.min_damage,
-                                             max_damage=enemy.max_damage,
-                                             speed=enemy.speed,
-                                             initiative=enemy.initiative,
-                                             max_targets=enemy.max_targets,
-                                             level=enemy.level,
-                                             award_xp=enemy.award_xp)
-
-                    eventlogs.append(
-                        EventLog(event=event,
-                                 htclass='text-warning log-entry',
-                                 log=f'Encountered lvl {e.level} {e.name}!')
-                    )
-
-                EventLog.objects.bulk_create(eventlogs)
-
-    return event
+from world.matchmaking import leave_event
 
 
 def process_ticks(enemy_count: int, event_lock: Event, killed_entities: list[Any], newlogs: list[Any], player: Player,
-                  player_count: int, player_logs: list[Any], ticks: int | Any):
+                  player_count: int, player_logs: list[Any], ticks: int | Any, deaths: list[Any], kills: list[Any]):
+    # Only simulates in memory, deaths and kills are collected for apply_outcomes to write once the results commit
 
     # DEBUG
     player_logs.append(
@@ -164,19 +75,13 @@ def process_ticks(enemy_count: int, event_lock: Event, killed_entities: list[Any
                     # Send player to town and heal them
                     # this is where death penalties would be processed
                     entity.health = entity.max_health
-                    town = Location.objects.filter(region=event_lock.location.region, type='T').first()
-                    Player.objects.filter(id=entity.id).update(last_travel=time.time(),
-                                                               location=town,
-                                                               health=entity.max_health,
-                                                               event=None)
+                    deaths.append(entity)
 
                 elif entity.type == 'E':
                     enemy_count -= 1
                     entity.dead = time.time()
-                    players = Player.objects.filter(event=event_lock, active__isnull=False)
-
-                    for player in players:
-                        player.add_xp(entity.enemy.award_xp)
+                    kills.append((entity.award_xp,
+                                  [e.player_id for e in event_lock.entities if e.type == 'P' and e.health > 0]))
 
                 killed_entities.append(entity)
                 event_lock.entities.remove(entity)
@@ -224,12 +129,14 @@ def process_ticks(enemy_count: int, event_lock: Event, killed_entities: list[Any
 
 
 def process_town_event(player: Player, event: Event, full: bool, joined: bool) -> dict | None:
-    players = Player.objects.all().filter(event=event, active__isnull=False, owner__last_refresh__gte=time.time() - 600)
+    players = (PlayerState.objects.all()
+               .select_related('player')
+               .filter(event=event, player__owner__last_refresh__gte=time.time() - 600))
     player_positions = []
 
     if joined:
         for p in players:
-            if p.id == player.id:
+            if p.player_id == player.id:
                 position = 50 + random.choice(range(-10, 10))
                 p.position = position
             else:
@@ -246,95 +153,255 @@ def process_town_event(player: Player, event: Event, full: bool, joined: bool) -
             p.top = utils.clamp(50 + (math.floor(pos_count / 2) * 10 * flip), 5, 95)
             p.left = pos_round
 
-        Player.objects.bulk_update(players, ['position', 'left', 'top'])
+        PlayerState.objects.bulk_update(players, ['position', 'left', 'top'])
+        identity.record_update(players, ['position', 'left', 'top'])
 
     return {'log': [], 'entities': players}
 
 
-def process_dungeon_event(player: Player, event: Event, full: bool, debug: bool = False) -> dict | None:
-    delta = time.time() - event.last_update
+def apply_outcomes(event: Event, deaths: list[PlayerState], kills: list[tuple[int, list[int]]]) -> None:
+    """
+    Writes what process_ticks collected: dead players respawn in the region's town and leave the event, and every
+    player still standing at a kill gets its XP. Deselecting a character takes it out of its event, so everyone in
+    one is being played, from the site or through the API.
+    """
+    if deaths:
+        town = Location.objects.select_related('region__world').filter(region=event.location.region, type='T').first()
+
+        for state in deaths:
+            now = time.time()
+            Player.objects.filter(id=state.player_id).update(last_travel=now, location=town)
+            identity.record(Player, state.player_id, last_travel=now, location=town)
+            leave_event(state.player_id, event_id=event.pk, health=state.max_health)
+
+    if kills:
+        player_ids = {player_id for _, ids in kills for player_id in ids}
+        players = Player.objects.in_bulk(player_ids)
+
+        for award_xp, ids in kills:
+            for player_id in ids:
+                if player_id in players:
+                    players[player_id].add_xp(award_xp)
+
+
+def event_queryset(event_id: int, full: bool):
+    """
+    The event with its players and living enemies prefetched, as simulated and rendered by a dungeon poll.
+    Players and enemies live in separate narrow tables and are merged into one initiative ordered list.
+    Evaluate it with load_event, which attaches the enemy templates.
+    """
+    # Only the handful of cold player columns the simulation needs are read alongside the state rows
+    player_fields = ['player__name', 'player__public_id', 'player__initiative', 'player__max_health']
+
+    if full:
+        player_fields.append('player__svg')
+
+    player_prefetch = Prefetch('playerstate_set',
+                               PlayerState.objects.all()
+                               .select_related('player')
+                               .only('health', 'position', 'left', 'top', 'event_joined', 'event',
+                                     *player_fields), to_attr='players')
+
+    enemy_prefetch = Prefetch('enemy_set', Enemy.objects.all().filter(dead=None), to_attr='enemies')
+
+    return (Event.objects.all()
+            .prefetch_related(player_prefetch, enemy_prefetch)
+            .select_related('location__region')
+            .filter(pk=event_id))
+
+
+def load_event(events) -> Event | None:
+    """
+    The event of an event_queryset (possibly locked), with the enemy templates the sprites are rendered from taken
+    from the game data cache rather than queried.
+    """
+    event = events.first()
+
+    if event is not None and event.enemies:
+        templates = location_templates(event.location_id)
+
+        for enemy in event.enemies:
+            if enemy.template_id in templates:
+                enemy.template = templates[enemy.template_id]
+
+    return event
+
+
+def event_snapshot(player: Player, events) -> dict | None:
+    """
+    Event state and logs as last committed, read without locking or simulating.
+    `events` is a queryset from event_queryset.
+    """
+    event_snap = load_event(events)
+
+    if event_snap is None:
+        return None
+
+    event_logs = (EventLog.objects.all()
+                  .filter(created_at__gte=player.owner.last_refresh, event=event_snap)
+                  .order_by('-created_at'))
+
+    return {'log': event_logs,
+            'entities': sorted(event_snap.players + event_snap.enemies, key=lambda e: -e.initiative)}
+
+
+def simulate_event(player: Player, event: Event, delta: float, debug: bool = False) -> dict:
+    """
+    Advances a loaded event in memory by the ticks elapsed since its last update, without writing anything.
+    Returns the outcome for commit_event, whose 'result' is what the poll renders.
+    """
     ticks = math.floor(delta)
     offset = delta - ticks
 
     if debug:
         ticks = 1
 
-    with transaction.atomic():
-        entity_prefetch = Prefetch('entity_set',
-                                   Entity.objects.all()
-                                   .filter(dead=None)
-                                   .order_by('-initiative'), to_attr='entities')
-
-        try:
-            event_lock = (Event.objects.select_for_update()
-                          .prefetch_related(entity_prefetch)
-                          .select_related('location__region')
-                          .get(pk=event.id))
-
-        except Event.DoesNotExist:
-            return None
+    event.entities = sorted(event.players + event.enemies, key=lambda e: -e.initiative)
+
+    # fetch backlog regardless of update timing
+    event_logs = (EventLog.objects.all()
+                  .filter(created_at__gte=player.owner.last_refresh, event=event)
+                  .order_by('-created_at'))
 
-        # fetch backlog regardless of update timing
-        event_logs = (EventLog.objects.all()
-                      .filter(created_at__gte=player.owner.last_refresh, event=event_lock)
-                      .order_by('-created_at'))
-        player_logs = []
+    outcome = {'event_fields': {}, 'ended': False, 'newlogs': [], 'player_logs': [], 'updated': [],
+               'deaths': [], 'kills': [], 'result': {'log': event_logs, 'entities': event.entities}}
+    player_logs = outcome['player_logs']
 
-        # DEBUG
-        player_logs.append(
-            PlayerLog(player=player,
-                      htclass='text-white',
-                      log=f'Event last update delta: {delta}')
-        )
+    # DEBUG
+    player_logs.append(
+        PlayerLog(player=player,
+                  htclass='text-white',
+                  log=f'Event last update delta: {delta}')
+    )
 
-        player_count = 0
-        enemy_count = 0
+    player_count = 0
+    enemy_count = 0
 
-        for entity in event_lock.entities:
-            if entity.type == 'P':
-                player_count += 1
-            elif entity.type == 'E':
-                enemy_count += 1
+    for entity in event.entities:
+        if entity.type == 'P':
+            player_count += 1
+        elif entity.type == 'E':
+            enemy_count += 1
 
-        # Consider event paused while inactive (due to no players present)
-        # Resume with fresh update time when a player joins again
-        if not event_lock.active:
-            event_lock.active = True
-            event_lock.last_update = time.time()
-            ticks = 0
-            event_lock.save(update_fields=['last_update', 'active'])
+    # Consider event paused while inactive (due to no players present)
+    # Resume with fresh update time when a player joins again
+    if not event.active:
+        event.active = True
+        event.last_update = time.time()
+        ticks = 0
+        outcome['event_fields'].update(active=True, last_update=event.last_update)
 
-        # If no enemies are left then event is over, update location last_event and set ended
-        if enemy_count == 0:
-            Location.objects.filter(pk=event_lock.location_id).update(last_event=time.time())
-            Event.objects.filter(pk=event_lock.pk).update(ended=time.time())
-            Player.objects.filter(pk=player.pk).update(event=None, event_joined=0)
+    # If no enemies are left then event is over, update location last_event and set ended
+    if enemy_count == 0:
+        outcome['event_fields']['ended'] = time.time()
+        outcome['ended'] = True
+        outcome['result'] = {'log': event_logs, 'entities': []}
+
+        return outcome
+
+    if ticks > 0:
+        killed_entities = []
+
+        process_ticks(enemy_count, event, killed_entities, outcome['newlogs'], player, player_count, player_logs,
+                      ticks, outcome['deaths'], outcome['kills'])
+
+        event.last_update = time.time() - offset
+
+        if debug:
+            event.last_update = time.time()
+
+        outcome['updated'] = killed_entities + event.entities
+        outcome['event_fields'].update(last_update=event.last_update, active=event.active)
+
+    return outcome
+
+
+def commit_event(player: Player, event: Event, outcome: dict) -> bool:
+    """
+    Writes a simulated outcome. The event row is only updated if its version is still the one that was simulated,
+    so a stale outcome is rejected (returns False) before anything is written. Ended outcomes are always written.
+    Must run inside a transaction.
+    """
+    if outcome['ended']:
+        # Enemies never come back, so an ended outcome is never stale: whoever wrote in between either ended the
+        # event too or only joined or left it, and the player still has to leave
+        ended = (Event.objects
+                 .filter(pk=event.pk, ended__isnull=True)
+                 .update(version=F('version') + 1, **outcome['event_fields']))
+
+        if ended:
+            Location.objects.filter(pk=event.location_id).update(last_event=time.time())
 
-            return {'log': event_logs, 'entities': []}
+        leave_event(player.pk, event_id=event.pk)
 
-        if ticks > 0:
-            newlogs = []
-            killed_entities = []
+        return True
 
-            process_ticks(enemy_count, event_lock, killed_entities, newlogs, player, player_count, player_logs, ticks)
+    if outcome['event_fields']:
+        committed = (Event.objects
+                     .filter(pk=event.pk, version=event.version)
+                     .update(version=F('version') + 1, **outcome['event_fields']))
 
-            # Process event logs
-            if newlogs:
-                EventLog.objects.bulk_create(newlogs)
-                event_logs = (EventLog.objects.all()
-                              .filter(created_at__gte=player.owner.last_refresh, event=event)
-                              .order_by('-created_at'))
+        if not committed:
+            return False
 
-            event_lock.last_update = time.time() - offset
+        event.version += 1
 
-            if debug:
-                event_lock.last_update = time.time()
+    if outcome['newlogs']:
+        EventLog.objects.bulk_create(outcome['newlogs'])
 
-            Entity.objects.bulk_update(killed_entities + event_lock.entities,
-                                       ['health', 'dead', 'position', 'left', 'top'])
-            event_lock.save(update_fields=['last_update', 'active'])
+    if outcome['updated']:
+        updated = outcome['updated']
+        states = [e for e in updated if e.type == 'P']
+        PlayerState.objects.bulk_update(states, ['health', 'position', 'left', 'top'])
+        identity.record_update(states, ['health', 'position', 'left', 'top'])
+        Enemy.objects.bulk_update([e for e in updated if e.type == 'E'], ['health', 'dead', 'position', 'left', 'top'])
+
+    apply_outcomes(event, outcome['deaths'], outcome['kills'])
+
+    if outcome['player_logs']:
+        PlayerLog.objects.bulk_create(outcome['player_logs'])
+
+    return True
+
+
+def process_dungeon_event(player: Player, event: Event, full: bool, debug: bool = False) -> dict | None:
+    # Elapsed time is measured from the row that is simulated, `event` was read before it and may be out of date
+    events = event_queryset(event.id, full)
+
+    if settings.EVENT_OPTIMISTIC:
+        # Simulate an unlocked snapshot outside any transaction, only the versioned write at the end is one
+        snapshot = load_event(events)
+
+        if snapshot is None:
+            return None
+
+        outcome = simulate_event(player, snapshot, time.time() - snapshot.last_update, debug)
+
+        with transaction.atomic():
+            committed = commit_event(player, snapshot, outcome)
+
+        if not committed:
+            # Another poller advanced the event first, show its result rather than retrying the same ticks
+            return event_snapshot(player, events)
+
+        return outcome['result']
+
+    with transaction.atomic():
+        # Only the event row is locked, so pollers of other events at the same location never queue behind it
+        if settings.EVENT_SKIP_LOCKED:
+            event_lock = load_event(events.select_for_update(skip_locked=True, of=('self',)))
+
+            if event_lock is None:
+                # Another poller is advancing this event, show the last committed state instead of waiting for it
+                return event_snapshot(player, events)
+
+        else:
+            event_lock = load_event(events.select_for_update(of=('self',)))
+
+        if event_lock is None:
+            return None
 
-        if player_logs:
-            PlayerLog.objects.bulk_create(player_logs)
+        outcome = simulate_event(player, event_lock, time.time() - event_lock.last_update, debug)
+        commit_event(player, event_lock, outcome)
 
-    return {'log': event_logs, 'entities': event_lock.entities}
\ No newline at end of file
+    return outcome['result']
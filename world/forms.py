@@ -1,10 +1,16 @@
 from django import forms
-from .models import Player, World, PlayerClass
+from .models import Player, World
+from .gamedata import player_classes, get_player_class
+
+
+def player_class_choices():
+    return [(c.id, c.name) for c in player_classes()]
 
 
 class CharacterCreateForm(forms.Form):
     character_name = forms.CharField(max_length=32, min_length=2)
-    character_class = forms.ModelChoiceField(queryset=PlayerClass.objects.all())
+    # Choices come from the game data cache instead of a queryset, cleaned to the PlayerClass
+    character_class = forms.TypedChoiceField(choices=player_class_choices, coerce=int)
 
     def clean_character_name(self):
         name = self.cleaned_data['character_name']
@@ -14,6 +20,14 @@ class CharacterCreateForm(forms.Form):
 
         return name
 
+    def clean_character_class(self):
+        player_class = get_player_class(self.cleaned_data['character_class'])
+
+        if player_class is None:
+            raise forms.ValidationError("Select a valid class.")
+
+        return player_class
+
 
 class WorldCreationForm(forms.ModelForm):
     name = forms.CharField(max_length=64, label='',
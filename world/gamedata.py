@@ -0,0 +1,152 @@
+"""
+Cache of static game data: player classes, enemy archetypes, the enemy templates of a location and the locations of
+a region. These are read on every character creation, world generation, event render and travel but only change
+when worlds are generated or edited in the admin.
+
+Each dataset has a name and a version, bump the version when the cached shape changes so entries of the old shape
+are never read. Saves and deletes of the source models drop the affected entry (see SOURCES, connected in
+WorldConfig.ready), the admin can refresh entries of selected objects for changes made around the ORM.
+
+settings.GAME_DATA_CACHE selects the backend:
+    local     a dict per worker process, invalidations only reach the process that saved the change and other
+              processes pick it up when their entry expires after settings.GAME_DATA_TIMEOUT
+    shared    the default Django cache, invalidations reach every process sharing it
+
+Cached instances are shared between requests and must be treated as read-only.
+"""
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model
+
+from .models import PlayerClass, EnemyArchetype, EnemyTemplate, Location
+
+T = TypeVar('T')
+
+
+class LocalBackend:
+    def __init__(self):
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] < time.monotonic():
+            return None
+
+        return entry[1]
+
+    def set(self, key: str, value: Any, timeout: float) -> None:
+        self._entries[key] = (time.monotonic() + timeout, value)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class SharedBackend:
+    def get(self, key: str) -> Any:
+        return cache.get(key)
+
+    def set(self, key: str, value: Any, timeout: float) -> None:
+        cache.set(key, value, timeout)
+
+    def delete(self, key: str) -> None:
+        cache.delete(key)
+
+
+BACKENDS = {'local': LocalBackend(), 'shared': SharedBackend()}
+
+
+def get_backend() -> LocalBackend | SharedBackend:
+    return BACKENDS[settings.GAME_DATA_CACHE]
+
+
+@dataclass(frozen=True)
+class Dataset(Generic[T]):
+    """
+    A kind of cached data, loaded by `loader` with the entry's key arguments on a miss.
+    """
+    name: str
+    version: int
+    loader: Callable[..., T]
+
+    def key(self, *args) -> str:
+        return ':'.join(['game-data', self.name, f'v{self.version}', *map(str, args)])
+
+    def get(self, *args) -> T:
+        backend = get_backend()
+        key = self.key(*args)
+        value = backend.get(key)
+
+        if value is None:
+            value = self.loader(*args)
+            backend.set(key, value, settings.GAME_DATA_TIMEOUT)
+
+        return value
+
+    def invalidate(self, *args) -> None:
+        get_backend().delete(self.key(*args))
+
+
+PLAYER_CLASSES: Dataset[tuple[PlayerClass, ...]] = Dataset(
+    'player-classes', 1, lambda: tuple(PlayerClass.objects.order_by('id')))
+
+ENEMY_ARCHETYPES: Dataset[tuple[EnemyArchetype, ...]] = Dataset(
+    'enemy-archetypes', 1, lambda: tuple(EnemyArchetype.objects.order_by('id')))
+
+LOCATION_TEMPLATES: Dataset[dict[int, EnemyTemplate]] = Dataset(
+    'location-templates', 1,
+    lambda location_id: {t.id: t for t in EnemyTemplate.objects.filter(location_id=location_id).order_by('id')})
+
+# last_event and event_claimed change with every event ended or started there, so they are left out and read from
+# the database if ever needed
+REGION_LOCATIONS: Dataset[tuple[Location, ...]] = Dataset(
+    'region-locations', 1,
+    lambda region_id: tuple(Location.objects.filter(region_id=region_id)
+                            .defer('last_event', 'event_claimed')
+                            .order_by('level', 'id')))
+
+# Dataset of each cached model and the key arguments of the entry holding an instance
+SOURCES: dict[str, tuple[Dataset, Callable[[Model], tuple]]] = {
+    'world.PlayerClass': (PLAYER_CLASSES, lambda obj: ()),
+    'world.EnemyArchetype': (ENEMY_ARCHETYPES, lambda obj: ()),
+    'world.EnemyTemplate': (LOCATION_TEMPLATES, lambda obj: (obj.location_id,)),
+    'world.Location': (REGION_LOCATIONS, lambda obj: (obj.region_id,)),
+}
+
+
+def player_classes() -> tuple[PlayerClass, ...]:
+    return PLAYER_CLASSES.get()
+
+
+def get_player_class(class_id: int) -> PlayerClass | None:
+    return next((c for c in player_classes() if c.id == class_id), None)
+
+
+def enemy_archetypes() -> tuple[EnemyArchetype, ...]:
+    return ENEMY_ARCHETYPES.get()
+
+
+def location_templates(location_id: int) -> dict[int, EnemyTemplate]:
+    """
+    Enemy templates of a location by id, in id order.
+    """
+    return LOCATION_TEMPLATES.get(location_id)
+
+
+def region_locations(region_id: int) -> tuple[Location, ...]:
+    """
+    Locations of a region ordered by level.
+    """
+    return REGION_LOCATIONS.get(region_id)
+
+
+def invalidate_instance(sender, instance, **kwargs) -> None:
+    """
+    post_save and post_delete receiver for the models in SOURCES.
+    """
+    dataset, key_args = SOURCES[sender._meta.label]
+    dataset.invalidate(*key_args(instance))
@@ -0,0 +1,22 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from world.worldgen import fill_region_pool
+
+
+class Command(BaseCommand):
+    help = 'Generates regions into the pool used for instant world creation until it holds the target size.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', type=int, default=settings.WORLD_POOL_SIZE,
+                            help='Pooled regions to keep ready (default: settings.WORLD_POOL_SIZE)')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        added = fill_region_pool(size=options['size'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Added {added} regions to the pool in {time.perf_counter() - start:.2f}s"
+        ))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from world.matchmaking import reconcile_event_slots
+from world.reaper import reap_ended_events
+
+
+class Command(BaseCommand):
+    help = ('Deletes ended events older than a threshold, together with their enemies and event logs, in batches, '
+            'then recounts the player slots of open events. Events every player left without them ending are '
+            'reaped once they have not been updated for the same threshold.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than', type=float, default=3600,
+                            help='Only reap events that ended, or were abandoned, more than this many seconds ago '
+                                 '(default 3600)')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Events deleted per transaction (default 500)')
+        parser.add_argument('--max-batches', type=int, default=None,
+                            help='Stop after this many batches (default: run until nothing is left)')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to sleep between batches (default 0)')
+
+    def handle(self, *args, **options):
+        verbosity = options['verbosity']
+
+        def report(totals):
+            if verbosity > 1:
+                self.stdout.write(f"batch {totals['batches']}: {totals['events']} events, "
+                                  f"{totals['enemies']} enemies, {totals['logs']} logs")
+
+        totals = reap_ended_events(older_than=options['older_than'],
+                                   batch_size=options['batch_size'],
+                                   max_batches=options['max_batches'],
+                                   pause=options['pause'],
+                                   report=report)
+
+        seconds = max(totals['seconds'], 1e-9)
+        self.stdout.write(self.style.SUCCESS(
+            f"Reaped {totals['events']} events, {totals['enemies']} enemies and {totals['logs']} logs "
+            f"in {totals['batches']} batches over {totals['seconds']:.2f}s "
+            f"({totals['abandoned']} abandoned events closed, "
+            f"{totals['events'] / seconds:.0f} events/s, {totals['enemies'] / seconds:.0f} enemies/s)"
+        ))
+
+        corrected = reconcile_event_slots()
+
+        if corrected:
+            self.stdout.write(f"Corrected the player slot count of {corrected} open events")
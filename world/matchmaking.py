@@ -0,0 +1,170 @@
+"""
+Event matchmaking without locking the location row.
+
+Every open event counts its players in `Event.slots_taken`. A player takes a slot with a single conditional
+UPDATE that only succeeds while the count is below the location's max_players, so concurrent joins can never
+overfill an event and never wait on each other beyond that one row write. Starting a new event is claimed the same
+way, by moving the location's event_claimed forward, so exactly one poller creates it and everyone else simply
+tries again on their next poll. Dungeons keep their spawn cooldown, counted from when the last event there ended
+(Location.last_event).
+
+Every path that takes a player out of an event goes through leave_event, which gives the slot back.
+
+Taking and giving back a slot also moves Event.version forward, so a simulation of the event started before a
+player joined or left is rejected when it commits instead of writing over the state of a player no longer in it.
+"""
+import time
+
+from django.db import transaction
+from django.db.models import F, Q, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from core import identity
+from world.models import Event, Location, PlayerState
+from world.spawns import get_spawn_table, spawn_enemies
+
+# Seconds one poller holds the right to start the next event at a location, so concurrent pollers don't each start
+# one. Pollers arriving later find it among the open events. Unrelated to the dungeon spawn cooldown.
+EVENT_CLAIM_WINDOW = 1
+
+# Open events tried per join before falling back to creating one
+JOIN_CANDIDATES = 5
+
+
+def _take_slot(event_id: int, max_players: int) -> bool:
+    return bool(Event.objects
+                .filter(id=event_id, ended__isnull=True, slots_taken__lt=max_players)
+                .update(slots_taken=F('slots_taken') + 1, version=F('version') + 1))
+
+
+def _release_slot(event_id: int) -> None:
+    Event.objects.filter(id=event_id, slots_taken__gt=0).update(slots_taken=F('slots_taken') - 1,
+                                                                version=F('version') + 1)
+
+
+def _claim_new_event(location: Location) -> bool:
+    """
+    Wins the right to start the next event at a location, at most once per claim window across all pollers.
+    Dungeons are only claimed once their spawn rate has passed since the last event there ended.
+    """
+    now = time.time()
+    claim = Q(id=location.id, event_claimed__lte=now - EVENT_CLAIM_WINDOW)
+
+    if location.type == 'D':
+        claim &= Q(last_event__isnull=True) | Q(last_event__lte=now - (location.spawn_rate or 0))
+
+    return bool(Location.objects.filter(claim).update(event_claimed=now))
+
+
+def find_or_create_event(location: Location) -> Event | None:
+    """
+    Takes a slot in an open event at the location, starting a new one if none has room and the spawn cooldown
+    allows it. Returns None when the player has to wait.
+    """
+    candidates = (Event.objects
+                  .filter(location_id=location.id, ended__isnull=True, slots_taken__lt=location.max_players)
+                  .order_by('id')
+                  .values_list('id', flat=True)[:JOIN_CANDIDATES])
+
+    for event_id in candidates:
+        if _take_slot(event_id, location.max_players):
+            return Event.objects.get(id=event_id)
+
+    if location.type == 'D':
+        # Resolved before claiming, usually from cache, so a spawn is just the inserts
+        spawn_table = get_spawn_table(location.id)
+
+        if not spawn_table:
+            return None
+
+    if not _claim_new_event(location):
+        return None
+
+    with transaction.atomic():
+        event = Event.objects.create(location=location, last_update=time.time(), slots_taken=1)
+
+        if location.type == 'D':
+            spawn_enemies(event, spawn_table)
+
+    return event
+
+
+def join_event(state: PlayerState, location: Location) -> Event | None:
+    """
+    Puts a player who is not in an event into one at their location and updates their state to match.
+    """
+    event = find_or_create_event(location)
+
+    if event is None:
+        return None
+
+    now = time.time()
+    joined = (PlayerState.objects
+              .filter(player_id=state.player_id, event__isnull=True)
+              .update(event=event, position=40, event_joined=now))
+
+    if not joined:
+        # The same player joined an event from another request in the meantime
+        _release_slot(event.id)
+        return None
+
+    state.event = event
+    state.position = 40
+    state.event_joined = now
+
+    return event
+
+
+def leave_event(player_id: int, event_id: int | None = None, **state_fields) -> int | None:
+    """
+    Takes a player out of their event and frees the slot. Extra keyword arguments are written to the state in the
+    same update. Callers that know the event pass `event_id`, the player is then only taken out of that one.
+    Returns the event id that was left, or None if the player was not in one.
+    """
+    if event_id is None:
+        event_id = (PlayerState.objects
+                    .filter(player_id=player_id)
+                    .values_list('event_id', flat=True)
+                    .first())
+
+        if event_id is None:
+            if state_fields:
+                PlayerState.objects.filter(player_id=player_id).update(**state_fields)
+                identity.record(PlayerState, player_id, **state_fields)
+
+            return None
+
+    with transaction.atomic():
+        # The event row is written first, the order commit_event locks rows in, so a commit that simulated this
+        # player either finishes before the leave or sees the new version
+        _release_slot(event_id)
+        left = (PlayerState.objects
+                .filter(player_id=player_id, event_id=event_id)
+                .update(event=None, event_joined=0, **state_fields))
+
+        if not left:
+            transaction.set_rollback(True)
+
+    if left:
+        identity.record(PlayerState, player_id, event=None, event_joined=0, **state_fields)
+
+    return event_id if left else None
+
+
+def reconcile_event_slots() -> int:
+    """
+    Recounts the slots of open events from the player states, repairing counts left behind by anything that removed
+    a state without leave_event. Returns the number of events corrected.
+    """
+    counts = (PlayerState.objects
+              .filter(event_id=OuterRef('pk'))
+              .values('event_id')
+              .annotate(n=Count('pk'))
+              .values('n'))
+    actual = Coalesce(Subquery(counts), 0)
+
+    return (Event.objects
+            .filter(ended__isnull=True)
+            .annotate(actual=actual)
+            .exclude(slots_taken=F('actual'))
+            .update(slots_taken=actual))
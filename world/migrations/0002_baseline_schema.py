@@ -0,0 +1,287 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:37
+
+import django.db.models.deletion
+import time
+from django.db import migrations, models
+
+
+def assign_archetypes(apps, schema_editor):
+    # Templates from before archetypes existed get a plain one, so the column can become required
+    EnemyArchetype = apps.get_model('world', 'EnemyArchetype')
+    EnemyTemplate = apps.get_model('world', 'EnemyTemplate')
+    templates = EnemyTemplate.objects.filter(archetype__isnull=True)
+
+    if templates.exists():
+        archetype = EnemyArchetype.objects.create(name='Brute')
+        templates.update(archetype=archetype)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('world', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EnemyArchetype',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64)),
+                ('dmg_dev', models.FloatField(default=1, verbose_name='Percent deviation from center for damage range')),
+                ('dmg_multi', models.FloatField(default=1, verbose_name='Damage multiplier for stronger vs weaker attacks')),
+                ('attack_range', models.IntegerField(default=1)),
+                ('speed', models.IntegerField(default=1)),
+                ('attack_rate', models.IntegerField(default=1, verbose_name='Attacks per round')),
+                ('hp_multi', models.FloatField(default=1, verbose_name='HP multiplier')),
+                ('init_multi', models.FloatField(default=1, verbose_name='Initiative multiplier')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PlayerClass',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(verbose_name='Class name')),
+                ('str', models.IntegerField(default=1)),
+                ('dex', models.IntegerField(default=1)),
+                ('int', models.IntegerField(default=1)),
+                ('vit', models.IntegerField(default=1)),
+                ('mnd', models.IntegerField(default=1)),
+            ],
+        ),
+        migrations.RemoveField(
+            model_name='enemy',
+            name='event',
+        ),
+        migrations.RemoveField(
+            model_name='enemy',
+            name='template',
+        ),
+        migrations.RemoveField(
+            model_name='enemytemplate',
+            name='attack_damage',
+        ),
+        migrations.RemoveField(
+            model_name='entity',
+            name='attack_damage',
+        ),
+        migrations.RemoveField(
+            model_name='player',
+            name='event',
+        ),
+        migrations.RemoveField(
+            model_name='player',
+            name='new_location',
+        ),
+        migrations.RemoveField(
+            model_name='player',
+            name='new_status',
+        ),
+        migrations.RemoveField(
+            model_name='regionchatmessage',
+            name='sent_at',
+        ),
+        migrations.AddField(
+            model_name='enemy',
+            name='award_xp',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='enemytemplate',
+            name='award_xp',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='enemytemplate',
+            name='created_at',
+            field=models.FloatField(db_index=True, default=time.time),
+        ),
+        migrations.AddField(
+            model_name='enemytemplate',
+            name='max_damage',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='enemytemplate',
+            name='min_damage',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='created_at',
+            field=models.FloatField(db_index=True, default=time.time),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='dead',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='event',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='world.event'),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='event_joined',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='left',
+            field=models.IntegerField(default=50),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='mana',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='max_damage',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='max_mana',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='min_damage',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='svg',
+            field=models.TextField(default=''),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='entity',
+            name='top',
+            field=models.IntegerField(default=50),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='created_at',
+            field=models.FloatField(db_index=True, default=time.time),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='ended',
+            field=models.FloatField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='created_at',
+            field=models.FloatField(db_index=True, default=time.time),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='dex',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='int',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='last_stat_update',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='last_travel',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='mnd',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='stat_points',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='str',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='vit',
+            field=models.IntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='xp',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='player',
+            name='xp_next_lvl',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='region',
+            name='created_at',
+            field=models.FloatField(db_index=True, default=time.time),
+        ),
+        migrations.AddField(
+            model_name='regionchatmessage',
+            name='created_at',
+            field=models.FloatField(db_index=True, default=time.time),
+        ),
+        migrations.AddField(
+            model_name='world',
+            name='created_at',
+            field=models.FloatField(db_index=True, default=time.time),
+        ),
+        migrations.AlterField(
+            model_name='location',
+            name='max_players',
+            field=models.IntegerField(default=3),
+        ),
+        migrations.AddField(
+            model_name='enemytemplate',
+            name='archetype',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='world.enemyarchetype'),
+        ),
+        migrations.RunPython(assign_archetypes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='enemytemplate',
+            name='archetype',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='world.enemyarchetype'),
+        ),
+        migrations.CreateModel(
+            name='EventLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.FloatField(db_index=True, default=time.time)),
+                ('htclass', models.CharField(blank=True, max_length=64, null=True)),
+                ('log', models.TextField()),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='world.event')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PlayerLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.FloatField(db_index=True, default=time.time)),
+                ('htclass', models.CharField(blank=True, max_length=64, null=True)),
+                ('log', models.TextField()),
+                ('player', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='world.player')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
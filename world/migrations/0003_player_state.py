@@ -0,0 +1,160 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:38
+
+import django.db.models.deletion
+import time
+import uuid
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def create_player_states(apps, schema_editor):
+    """
+    Moves the combat state of existing players from their entity row to a PlayerState row, and counts the players
+    of every open event into its slots.
+    """
+    Player = apps.get_model('world', 'Player')
+    PlayerState = apps.get_model('world', 'PlayerState')
+    Event = apps.get_model('world', 'Event')
+    fields = ['id', 'health', 'top', 'left', 'position', 'event_id', 'event_joined']
+
+    PlayerState.objects.bulk_create(
+        (PlayerState(player_id=row['id'], **{f: row[f] for f in fields[1:]})
+         for row in Player.objects.values(*fields).iterator()),
+        batch_size=1000)
+
+    for event in Event.objects.filter(ended__isnull=True).annotate(players=Count('playerstate')):
+        Event.objects.filter(id=event.id).update(slots_taken=event.players)
+
+
+def delete_enemies(apps, schema_editor):
+    # Enemies move to a table of their own, the ones of running events are dropped and those events end on their
+    # next poll
+    apps.get_model('world', 'Entity').objects.filter(type='E').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('world', '0002_baseline_schema'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='slots_taken',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='version',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='PlayerState',
+            fields=[
+                ('player', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='state', serialize=False, to='world.player')),
+                ('health', models.IntegerField(default=1)),
+                ('top', models.IntegerField(default=50)),
+                ('left', models.IntegerField(default=50)),
+                ('position', models.IntegerField(default=None, null=True)),
+                ('event_joined', models.FloatField(default=0)),
+                ('event', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='world.event')),
+            ],
+        ),
+        migrations.RunPython(create_player_states, migrations.RunPython.noop),
+        migrations.RunPython(delete_enemies, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='Enemy',
+        ),
+        migrations.CreateModel(
+            name='Enemy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.FloatField(db_index=True, default=time.time)),
+                ('public_id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('name', models.CharField(max_length=32, verbose_name='Name')),
+                ('level', models.IntegerField(default=1)),
+                ('attack_range', models.IntegerField(default=1)),
+                ('min_damage', models.IntegerField(default=1)),
+                ('max_damage', models.IntegerField(default=1)),
+                ('speed', models.IntegerField(default=1)),
+                ('initiative', models.IntegerField(default=0)),
+                ('max_health', models.IntegerField(default=1)),
+                ('health', models.IntegerField(default=1)),
+                ('award_xp', models.IntegerField(default=1)),
+                ('top', models.IntegerField(default=50)),
+                ('left', models.IntegerField(default=50)),
+                ('position', models.IntegerField(default=None, null=True)),
+                ('dead', models.FloatField(blank=True, null=True)),
+                ('event_joined', models.FloatField(default=0)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='world.event')),
+                ('template', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='world.enemytemplate')),
+            ],
+        ),
+        migrations.RemoveField(
+            model_name='entity',
+            name='dead',
+        ),
+        migrations.RemoveField(
+            model_name='entity',
+            name='event',
+        ),
+        migrations.RemoveField(
+            model_name='entity',
+            name='event_joined',
+        ),
+        migrations.RemoveField(
+            model_name='entity',
+            name='health',
+        ),
+        migrations.RemoveField(
+            model_name='entity',
+            name='left',
+        ),
+        migrations.RemoveField(
+            model_name='entity',
+            name='position',
+        ),
+        migrations.RemoveField(
+            model_name='entity',
+            name='top',
+        ),
+        migrations.AddField(
+            model_name='enemytemplate',
+            name='spawn_weight',
+            field=models.IntegerField(default=1, verbose_name='Relative spawn chance'),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='event_claimed',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='region',
+            name='connections',
+            field=models.ManyToManyField(blank=True, to='world.region'),
+        ),
+        migrations.AlterField(
+            model_name='region',
+            name='world',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='world.world'),
+        ),
+        migrations.CreateModel(
+            name='WorldJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.FloatField(db_index=True, default=time.time)),
+                ('public_id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True)),
+                ('name', models.CharField(max_length=64, unique=True, verbose_name='world name')),
+                ('status', models.CharField(choices=[('P', 'Pending'), ('R', 'Running'), ('D', 'Done'), ('F', 'Failed')], db_index=True, default='P', max_length=1)),
+                ('progress', models.IntegerField(default=0)),
+                ('error', models.TextField(blank=True, default='')),
+                ('updated_at', models.FloatField(default=time.time)),
+                ('run_id', models.UUIDField(blank=True, editable=False, null=True)),
+                ('world', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='world.world')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -4,6 +4,36 @@ import math
 
 from django.db import models
 from authentication.models import User
+from core.utils.procgen_svg import optimize_svg
+
+
+PLAYER_SVG = optimize_svg("""
+            <svg id="svg-{public_id}"
+             class="position-absolute sprite"
+             style="top: {top}%; left: {left}%; transform: translate(-50%, -50%); width: 3rem; height: 3rem; z-index: 1;"
+            viewBox="0 0 100 100" width="100" height="100" xmlns="http://www.w3.org/2000/svg">
+              <rect x="35" y="45" width="30" height="30" fill="white" stroke="black" stroke-width="2" rx="2" />            
+              <rect x="30" y="15" width="40" height="35" fill="white" stroke="black" stroke-width="2" rx="5" />            
+              <rect x="35" y="28" width="30" height="8" fill="black" />            
+              <rect x="25" y="50" width="10" height="20" fill="white" stroke="black" stroke-width="2" rx="2" />            
+              <rect x="65" y="50" width="10" height="20" fill="white" stroke="black" stroke-width="2" rx="2" />            
+              <rect x="38" y="75" width="10" height="15" fill="white" stroke="black" stroke-width="2" />
+              <rect x="52" y="75" width="10" height="15" fill="white" stroke="black" stroke-width="2" />
+            </svg>
+            """)
+
+
+# Drawn for enemies whose template has been deleted while they are still in an event
+ENEMY_SVG = optimize_svg("""
+            <svg id="svg-{public_id}"
+             class="position-absolute sprite"
+             style="top: {top}%; left: {left}%; transform: translate(-50%, -50%); width: 3rem; height: 3rem; z-index: 1;"
+            viewBox="0 0 100 100" width="100" height="100" xmlns="http://www.w3.org/2000/svg">
+              <circle cx="50" cy="55" r="30" fill="white" stroke="black" stroke-width="2" />
+              <rect x="35" y="45" width="10" height="8" fill="black" />
+              <rect x="55" y="45" width="10" height="8" fill="black" />
+            </svg>
+            """)
 
 
 class BaseModel(models.Model):
@@ -23,6 +53,32 @@ class World(BaseModel):
         return self.name
 
 
+class WorldJob(BaseModel):
+    """
+    Background generation of a new world, one row per world name so concurrent requests share a job.
+    """
+    JOB_STATUSES = (
+        ('P', 'Pending'),
+        ('R', 'Running'),
+        ('D', 'Done'),
+        ('F', 'Failed'),
+    )
+
+    public_id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True, db_index=True)
+    name = models.CharField('world name', max_length=64, unique=True)
+    status = models.CharField(max_length=1, choices=JOB_STATUSES, default='P', db_index=True)
+    progress = models.IntegerField(default=0)
+    error = models.TextField(blank=True, default='')
+    updated_at = models.FloatField(default=time.time)
+    # Set by each run that claims the job, a run whose job was claimed again after it went stale stops writing
+    run_id = models.UUIDField(null=True, blank=True, editable=False)
+
+    world = models.ForeignKey(World, on_delete=models.SET_NULL, null=True, blank=True)
+
+    def __str__(self):
+        return f'{self.name} ({self.get_status_display()})'
+
+
 class Region(BaseModel):
     REGION_BIOMES = (
         ('D', 'Desert'),
@@ -38,7 +94,9 @@ class Region(BaseModel):
     biome = models.CharField('biome', max_length=1, choices=REGION_BIOMES)
     level = models.IntegerField('level', default=1)
 
-    world = models.ForeignKey(World, on_delete=models.CASCADE)
+    # Null while the region waits in the pre-generated pool, see world/worldgen.py
+    world = models.ForeignKey(World, on_delete=models.CASCADE, null=True, blank=True)
+    connections = models.ManyToManyField('self', blank=True)
 
     def __str__(self):
         return self.name
@@ -54,6 +112,7 @@ class Location(BaseModel):
     name = models.CharField('Location name', max_length=64)
     level = models.IntegerField('level', default=1)
     last_event = models.FloatField(null=True, blank=True, default=0)
+    event_claimed = models.FloatField(default=0)
     type = models.CharField('Location type', max_length=1, choices=LOCATION_TYPES)
     max_players = models.IntegerField(default=3)
     spawn_rate = models.IntegerField(null=True, default=5)
@@ -70,6 +129,10 @@ class Event(BaseModel):
     active = models.BooleanField(default=True, db_index=True)
     ended = models.FloatField(default=None, null=True, blank=True)
     last_update = models.FloatField(default=0)
+    # Players currently in the event, maintained by world/matchmaking.py
+    slots_taken = models.IntegerField(default=0)
+    # Bumped by every simulation commit, optimistic commits only apply to the version they simulated
+    version = models.IntegerField(default=0)
 
     location = models.ForeignKey(Location, on_delete=models.CASCADE)
 
@@ -83,10 +146,6 @@ class Event(BaseModel):
     def __str__(self):
         return f'{self.location.name} Event {str(self.pk)}'
 
-    def delete(self, *args, **kwargs):
-        Enemy.objects.filter(event=self).delete()
-        super().delete(*args, **kwargs)
-
 
 class EventLog(BaseModel):
     htclass = models.CharField(max_length=64, blank=True, null=True)
@@ -112,35 +171,20 @@ class Entity(BaseModel):
     initiative = models.IntegerField(default=0)
     max_targets = models.IntegerField(default=1)
     max_health = models.IntegerField(default=1)
-    health = models.IntegerField(default=1)
     max_mana = models.IntegerField(default=1)
     mana = models.IntegerField(default=1)
 
     level = models.IntegerField(default=1)
 
     svg = models.TextField()
-    top = models.IntegerField(default=50)
-    left = models.IntegerField(default=50)
-    position = models.IntegerField(default=None, null=True, db_index=True)
-    dead = models.FloatField(null=True, blank=True)
-    event_joined = models.FloatField(default=0)
 
     # References
     target = models.ForeignKey('Entity', null=True, blank=True, on_delete=models.SET_NULL)
-    event = models.ForeignKey(Event, null=True, blank=True, on_delete=models.SET_NULL)
-
-    @property
-    def health_perc(self):
-        return math.floor((self.health / self.max_health) * 100)
 
     @property
     def mana_perc(self):
         return math.floor((self.mana / self.max_mana) * 100)
 
-    @property
-    def render_svg(self):
-        return self.svg.format(public_id=self.public_id, top=self.top, left=self.left)
-
     def __str__(self):
         return self.name
 
@@ -170,6 +214,10 @@ class Player(Entity):
     vit = models.IntegerField(default=1)
     mnd = models.IntegerField(default=1)
 
+    @property
+    def health_perc(self):
+        return math.floor((self.state.health / self.max_health) * 100)
+
     @property
     def xp_perc(self):
         return math.floor((self.xp / self.xp_next_lvl) * 100)
@@ -178,26 +226,18 @@ class Player(Entity):
         return self.name
 
     def save(self, *args, **kwargs):
-        if not self.id:
+        created = not self.id
+
+        if created:
             self.xp_next_lvl = self.level**3 + 9*self.level**2
             self.type = 'P'
-            self.svg = """
-            <svg id="svg-{public_id}"
-             class="position-absolute sprite"
-             style="top: {top}%; left: {left}%; transform: translate(-50%, -50%); width: 3rem; height: 3rem; z-index: 1;"
-            viewBox="0 0 100 100" width="100" height="100" xmlns="http://www.w3.org/2000/svg">
-              <rect x="35" y="45" width="30" height="30" fill="white" stroke="black" stroke-width="2" rx="2" />            
-              <rect x="30" y="15" width="40" height="35" fill="white" stroke="black" stroke-width="2" rx="5" />            
-              <rect x="35" y="28" width="30" height="8" fill="black" />            
-              <rect x="25" y="50" width="10" height="20" fill="white" stroke="black" stroke-width="2" rx="2" />            
-              <rect x="65" y="50" width="10" height="20" fill="white" stroke="black" stroke-width="2" rx="2" />            
-              <rect x="38" y="75" width="10" height="15" fill="white" stroke="black" stroke-width="2" />
-              <rect x="52" y="75" width="10" height="15" fill="white" stroke="black" stroke-width="2" />
-            </svg>
-            """
+            self.svg = PLAYER_SVG
 
         super().save(*args, **kwargs)
 
+        if created:
+            self.state = PlayerState.objects.create(player=self, health=self.max_health)
+
     def add_xp(self, add):
         self.xp += add
 
@@ -209,7 +249,7 @@ class Player(Entity):
             self.xp_next_lvl = self.level**3 + 9*self.level**2
             self.last_stat_update = time.time()
 
-        self.save()
+        self.save(update_fields=['xp', 'level', 'stat_points', 'xp_next_lvl', 'last_stat_update'])
 
         return self
     
@@ -221,7 +261,7 @@ class Player(Entity):
         self.int = player_class.int
         self.vit = player_class.vit
         self.mnd = player_class.mnd
-        self.max_health = self.health = math.floor(10 + player_class.vit + (player_class.str * 0.5))
+        self.max_health = math.floor(10 + player_class.vit + (player_class.str * 0.5))
         self.max_mana = self.mana = math.floor(10 + player_class.mnd + (player_class.int * 0.5))
         self.initiative = player_class.dex
         self.speed = 1 + math.floor(0.025 * player_class.dex + 0.005 * player_class.str)
@@ -258,9 +298,9 @@ class Player(Entity):
             self.mnd += stat_capped
             self.stat_points -= stat_capped
 
-        hp_ratio = self.health / self.max_health
+        hp_ratio = self.state.health / self.max_health
         self.max_health = math.floor(10 + self.vit + (self.str * 0.5))
-        self.health = self.max_health * hp_ratio
+        self.state.health = self.max_health * hp_ratio
 
         mp_ratio = self.mana / self.max_mana
         self.max_mana = self.mana = math.floor(10 + self.mnd + (self.int * 0.5))
@@ -270,10 +310,57 @@ class Player(Entity):
 
         self.last_stat_update = time.time()
         self.save()
+        self.state.save(update_fields=['health'])
 
         return self
 
 
+class PlayerState(models.Model):
+    # Fast changing runtime state, split from the wide Player/Entity rows so per-poll writes only rewrite this
+    # narrow row. Stats, identity and appearance stay on Player.
+    type = 'P'
+
+    player = models.OneToOneField(Player, primary_key=True, on_delete=models.CASCADE, related_name='state')
+    health = models.IntegerField(default=1)
+    top = models.IntegerField(default=50)
+    left = models.IntegerField(default=50)
+    position = models.IntegerField(default=None, null=True)
+    event_joined = models.FloatField(default=0)
+
+    event = models.ForeignKey(Event, null=True, blank=True, on_delete=models.SET_NULL)
+
+    @property
+    def name(self):
+        return self.player.name
+
+    @property
+    def public_id(self):
+        return self.player.public_id
+
+    @property
+    def initiative(self):
+        return self.player.initiative
+
+    @property
+    def max_health(self):
+        return self.player.max_health
+
+    @property
+    def svg(self):
+        return self.player.svg
+
+    @property
+    def health_perc(self):
+        return math.floor((self.health / self.max_health) * 100)
+
+    @property
+    def render_svg(self):
+        return self.svg.format(public_id=self.public_id, top=self.top, left=self.left)
+
+    def __str__(self):
+        return self.player.name
+
+
 class PlayerLog(BaseModel):
     htclass = models.CharField(max_length=64, blank=True, null=True)
     log = models.TextField()
@@ -307,6 +394,7 @@ class EnemyTemplate(BaseModel):
     max_targets = models.IntegerField(default=1)
     level = models.IntegerField(default=1)
     award_xp = models.IntegerField(default=1)
+    spawn_weight = models.IntegerField('Relative spawn chance', default=1)
 
     archetype = models.ForeignKey(EnemyArchetype, on_delete=models.CASCADE)
     location = models.ForeignKey(Location, on_delete=models.CASCADE)
@@ -321,14 +409,51 @@ class EnemyTemplate(BaseModel):
         super().save(*args, **kwargs)
 
 
-class Enemy(Entity):
+class Enemy(BaseModel):
+    # Enemies only live for the duration of an event, so they are kept as narrow standalone rows holding just the
+    # combat fields instead of inheriting the wide Entity table. The sprite is read from the template.
+    type = 'E'
+
+    public_id = models.UUIDField(default=uuid.uuid4, editable=False, unique=True, db_index=True)
+    name = models.CharField('Name', max_length=32)
+    level = models.IntegerField(default=1)
+
+    attack_range = models.IntegerField(default=1)
+    min_damage = models.IntegerField(default=1)
+    max_damage = models.IntegerField(default=1)
+    speed = models.IntegerField(default=1)
+    initiative = models.IntegerField(default=0)
+    max_health = models.IntegerField(default=1)
+    health = models.IntegerField(default=1)
     award_xp = models.IntegerField(default=1)
 
-    def save(self, *args, **kwargs):
-        if not self.id:
-            self.type = 'E'
+    top = models.IntegerField(default=50)
+    left = models.IntegerField(default=50)
+    position = models.IntegerField(default=None, null=True)
+    dead = models.FloatField(null=True, blank=True)
+    event_joined = models.FloatField(default=0)
 
-        super().save(*args, **kwargs)
+    event = models.ForeignKey(Event, on_delete=models.CASCADE)
+    template = models.ForeignKey(EnemyTemplate, null=True, blank=True, on_delete=models.SET_NULL)
+
+    @property
+    def health_perc(self):
+        return math.floor((self.health / self.max_health) * 100)
+
+    @property
+    def svg(self):
+        # The template is set to null when it is deleted, the enemy keeps fighting with a stand-in sprite
+        if self.template_id is None:
+            return ENEMY_SVG
+
+        return self.template.svg
+
+    @property
+    def render_svg(self):
+        return self.svg.format(public_id=self.public_id, top=self.top, left=self.left)
+
+    def __str__(self):
+        return self.name
 
 
 class RegionChatMessage(BaseModel):
@@ -0,0 +1,92 @@
+"""
+Single-flight coalescing and throttling of Map update polls.
+
+Several tabs or an eager client can poll the same player's updates at once. Every update consumes the changes since
+the owner's last refresh, so overlapping polls would each re-run event processing and split the changes between them.
+Instead the first poll of a player runs and the duplicates that arrive while it is in flight wait for it and return
+the same response. A poll starting within settings.POLL_MIN_INTERVAL of the last one is answered with an empty 204
+without touching the database, its changes are picked up by the next poll.
+
+Coordination goes through the default cache. The local-memory cache used when CACHES is not configured is private
+to each worker process, so polls are then only coalesced and throttled within the process that receives them, and
+duplicates sent to different processes both run. Deployments with several worker processes need a shared cache
+backend (Redis, Memcached) for this to hold across them.
+"""
+import time
+import uuid
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+POLL_FLIGHT_KEY = 'poll-flight:{key}'
+POLL_RESULT_KEY = 'poll-result:{token}'
+POLL_LAST_KEY = 'poll-last:{key}'
+
+# Longest a poll is expected to run, a crashed leader's claim expires after this
+POLL_FLIGHT_TIMEOUT = 30
+
+# How long duplicates wait for the leader's response and how often they check for it. Kept to the client's poll
+# interval, a duplicate holds a worker thread while waiting and its changes are picked up by the next poll anyway.
+POLL_WAIT = 1
+POLL_WAIT_STEP = 0.02
+
+
+def coalesce_poll(key: str, handler: Callable[[], HttpResponse]) -> HttpResponse:
+    """
+    Returns handler(), or the response of the identical poll (same `key`) already in flight.
+    """
+    flight_key = POLL_FLIGHT_KEY.format(key=key)
+    last_key = POLL_LAST_KEY.format(key=key)
+    token = uuid.uuid4().hex
+
+    if not cache.add(flight_key, token, POLL_FLIGHT_TIMEOUT):
+        leader = cache.get(flight_key)
+
+        if leader is not None:
+            return _wait_for(flight_key, leader)
+
+        # The leader finished between the two calls, claim once more and leave the poll to the next one if a third
+        # poll was faster
+        if not cache.add(flight_key, token, POLL_FLIGHT_TIMEOUT):
+            return HttpResponse(status=204)
+
+    try:
+        # Measured from the start of the last poll, so regular polls are never throttled by a slow one
+        now = time.time()
+        last = cache.get(last_key)
+
+        if settings.POLL_MIN_INTERVAL and last is not None and now - last < settings.POLL_MIN_INTERVAL:
+            return HttpResponse(status=204)
+
+        cache.set(last_key, now, POLL_FLIGHT_TIMEOUT)
+        response = handler()
+        cache.set(POLL_RESULT_KEY.format(token=token), response, POLL_WAIT)
+
+        return response
+
+    finally:
+        # Only our own claim, it may have expired during a slow poll and been taken by the next one
+        if cache.get(flight_key) == token:
+            cache.delete(flight_key)
+
+
+def _wait_for(flight_key: str, leader: str) -> HttpResponse:
+    result_key = POLL_RESULT_KEY.format(token=leader)
+    deadline = time.monotonic() + POLL_WAIT
+
+    while time.monotonic() < deadline:
+        response = cache.get(result_key)
+
+        if response is not None:
+            return response
+
+        if cache.get(flight_key) != leader:
+            # Finished, with a result stored just now or without one because the leader failed
+            return cache.get(result_key, HttpResponse(status=204))
+
+        time.sleep(POLL_WAIT_STEP)
+
+    # Any changes are left to the next poll
+    return HttpResponse(status=204)
@@ -0,0 +1,85 @@
+import time
+
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+
+from .models import Event, EventLog, Enemy, PlayerState
+
+
+def _close_abandoned(cutoff: float, batch_size: int) -> int:
+    """
+    Ends a batch of events every player walked out of (travel, character switch, world change) before they ended,
+    dating the end to their last update so they are reaped like any other ended event.
+    The conditional UPDATE only applies while no slot is taken, so it can't close an event a player is joining.
+    """
+    event_ids = list(Event.objects
+                     .filter(ended__isnull=True, slots_taken=0, last_update__lt=cutoff)
+                     .exclude(Exists(PlayerState.objects.filter(event_id=OuterRef('id'))))
+                     .order_by('id')
+                     .values_list('id', flat=True)[:batch_size])
+
+    if not event_ids:
+        return 0
+
+    return (Event.objects
+            .filter(id__in=event_ids, ended__isnull=True, slots_taken=0)
+            .update(ended=F('last_update'), active=False))
+
+
+def _delete_batch(event_ids: list[int]) -> dict:
+    """
+    Deletes a batch of events and their enemies with a handful of set-based statements.
+    Enemy rows have nothing pointing at them, so the ORM deletes them with a single DELETE instead of collecting.
+    """
+    with transaction.atomic():
+        enemies, _ = Enemy.objects.filter(event_id__in=event_ids).delete()
+
+        # Event logs cascade and any players still pointing at the events are detached via SET_NULL
+        _, deleted = Event.objects.filter(id__in=event_ids).delete()
+
+    return {'events': deleted.get(Event._meta.label, 0),
+            'enemies': enemies,
+            'logs': deleted.get(EventLog._meta.label, 0)}
+
+
+def reap_ended_events(older_than: float = 3600, batch_size: int = 500, max_batches: int | None = None,
+                      pause: float = 0, report=None) -> dict:
+    """
+    Removes ended events older than `older_than` seconds along with their enemies and logs. Events left empty
+    without ending are closed first once they have not been updated for `older_than` seconds.
+
+    Work is split into batches of `batch_size` events, each in its own short transaction, so row locks are only
+    held for one batch at a time. `pause` sleeps between batches to leave room for the game traffic.
+    `report` is called with the running totals after every batch.
+    """
+    cutoff = time.time() - older_than
+    totals = {'events': 0, 'abandoned': 0, 'enemies': 0, 'logs': 0, 'batches': 0, 'seconds': 0.0}
+    start = time.perf_counter()
+
+    while max_batches is None or totals['batches'] < max_batches:
+        totals['abandoned'] += _close_abandoned(cutoff, batch_size)
+
+        event_ids = list(Event.objects.filter(ended__lt=cutoff)
+                         .order_by('id')
+                         .values_list('id', flat=True)[:batch_size])
+
+        if not event_ids:
+            break
+
+        deleted = _delete_batch(event_ids)
+
+        for key, count in deleted.items():
+            totals[key] += count
+
+        totals['batches'] += 1
+        totals['seconds'] = time.perf_counter() - start
+
+        if report:
+            report(totals)
+
+        if pause:
+            time.sleep(pause)
+
+    totals['seconds'] = time.perf_counter() - start
+
+    return totals
@@ -0,0 +1,104 @@
+import math
+import time
+import random
+import itertools
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+from core.utils import utils
+from .models import Event, Enemy, EventLog
+from .gamedata import location_templates
+
+SPAWN_TABLE_TIMEOUT = 60 * 60
+SPAWN_TABLE_KEY = 'spawn-table:{location_id}'
+
+# Template fields copied onto every spawned Enemy
+SPAWN_FIELDS = ('name', 'max_health', 'attack_range', 'min_damage', 'max_damage', 'speed', 'initiative', 'level',
+                'award_xp')
+
+
+@dataclass(frozen=True)
+class SpawnTable:
+    """
+    Snapshot of a location's enemy templates for spawning: the copied field values per template and the
+    cumulative spawn weights, so picking and instantiating enemies needs no queries.
+    """
+    template_ids: tuple[int, ...]
+    fields: tuple[dict, ...]
+    cum_weights: tuple[int, ...]
+
+    def __bool__(self):
+        return bool(self.template_ids)
+
+
+def build_spawn_table(location_id: int) -> SpawnTable:
+    templates = [t for t in location_templates(location_id).values() if t.spawn_weight > 0]
+
+    return SpawnTable(template_ids=tuple(t.id for t in templates),
+                      cum_weights=tuple(itertools.accumulate(t.spawn_weight for t in templates)),
+                      fields=tuple({field: getattr(t, field) for field in SPAWN_FIELDS} for t in templates))
+
+
+def get_spawn_table(location_id: int) -> SpawnTable:
+    """
+    Cached spawn table of a location, built on a miss. Template saves and deletes drop the entry, the timeout bounds
+    how long other processes can keep a stale copy with a per-process cache backend.
+    """
+    key = SPAWN_TABLE_KEY.format(location_id=location_id)
+    table = cache.get(key)
+
+    if table is None:
+        table = build_spawn_table(location_id)
+        cache.set(key, table, SPAWN_TABLE_TIMEOUT)
+
+    return table
+
+
+def invalidate_spawn_table(sender, instance, **kwargs) -> None:
+    cache.delete(SPAWN_TABLE_KEY.format(location_id=instance.location_id))
+
+
+def spawn_enemies(event: Event, table: SpawnTable) -> list[Enemy]:
+    """
+    Picks 2-5 enemies from a spawn table and inserts them, with their encounter logs, in one statement each.
+    """
+    now = time.time()
+    enemies = []
+    e_positions = []
+
+    # Spawn 2-5 enemies of any combination from the template set
+    num_enemy = random.choice(range(2, 6))
+    picks = random.choices(range(len(table.template_ids)), cum_weights=table.cum_weights, k=num_enemy)
+
+    for i in picks:
+        fields = table.fields[i]
+        position = 55 + fields['initiative']
+        left = utils.clamp(((position / event.size) * 100), 5, 95)
+        pos_round = 5 * round(left / 5)
+        e_positions.append(pos_round)
+        pos_count = e_positions.count(pos_round)
+
+        # Alternate vertical position of close enemies above and below
+        flip = 1
+        if pos_count % 2 == 0:
+            flip = -1
+
+        top = utils.clamp(50 + (math.floor(pos_count / 2) * 10 * flip), 5, 95)
+
+        enemies.append(Enemy(event=event,
+                             template_id=table.template_ids[i],
+                             event_joined=now,
+                             position=position,
+                             left=left,
+                             top=top,
+                             health=fields['max_health'],
+                             **fields))
+
+    Enemy.objects.bulk_create(enemies)
+    EventLog.objects.bulk_create([
+        EventLog(event=event, htclass='text-warning log-entry', log=f'Encountered lvl {e.level} {e.name}!')
+        for e in enemies
+    ])
+
+    return enemies
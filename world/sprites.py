@@ -0,0 +1,97 @@
+import re
+import hashlib
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.urls import reverse
+
+from core.utils.procgen_svg import SPRITE_CSS
+
+from .models import Location, PLAYER_SVG, ENEMY_SVG
+from .gamedata import location_templates
+
+SHEET_CACHE_TIMEOUT = 60 * 60
+SHEET_CACHE_KEY = 'sprite-sheet:{location_id}'
+
+_SVG_RE = re.compile(r'^\s*<svg\b([^>]*)>(.*)</svg>\s*$', re.DOTALL)
+_VIEWBOX_RE = re.compile(r'viewBox="([^"]*)"')
+
+
+@lru_cache(maxsize=4096)
+def split_sprite(svg: str) -> tuple[str, str, str]:
+    """
+    Splits a stored entity svg template into (symbol id, viewBox, inner markup).
+    The outer <svg> element only carries per-entity id and position, so everything inside it can be shared.
+    """
+    match = _SVG_RE.match(svg)
+
+    if not match:
+        raise ValueError('Entity svg must be a single <svg> element')
+
+    attrs, inner = match.groups()
+    inner = " ".join(inner.split())
+    viewbox = _VIEWBOX_RE.search(attrs)
+    viewbox = viewbox.group(1) if viewbox else '0 0 100 100'
+
+    key = 'sprite-' + hashlib.md5(f'{viewbox}|{inner}'.encode()).hexdigest()[:12]
+
+    return key, viewbox, inner
+
+
+def build_sprite_sheet(svgs) -> str:
+    """
+    Emits every distinct sprite once as a <symbol>, in a stable order so the same set always hashes the same.
+    The sprite classes are embedded since page stylesheets do not apply inside an external <use> reference.
+    """
+    symbols = {}
+
+    for svg in svgs:
+        key, viewbox, inner = split_sprite(svg)
+        symbols[key] = f'<symbol id="{key}" viewBox="{viewbox}">{inner}</symbol>'
+
+    body = ''.join(symbols[key] for key in sorted(symbols))
+
+    return f'<svg xmlns="http://www.w3.org/2000/svg"><style>{SPRITE_CSS}</style>{body}</svg>'
+
+
+def get_sprite_sheet(location: Location, refresh: bool = False) -> dict:
+    """
+    Returns the cached sheet for a location as {'version': str, 'body': str}, building it on a miss.
+    Pass refresh to rebuild it even when cached, e.g. when a request names a version this process has not seen.
+    """
+    key = SHEET_CACHE_KEY.format(location_id=location.id)
+    sheet = None if refresh else cache.get(key)
+
+    if sheet is None:
+        svgs = [PLAYER_SVG, ENEMY_SVG]
+        svgs.extend(template.svg for template in location_templates(location.id).values())
+        body = build_sprite_sheet(svgs)
+        sheet = {'version': hashlib.md5(body.encode()).hexdigest()[:12], 'body': body}
+        cache.set(key, sheet, SHEET_CACHE_TIMEOUT)
+
+    return sheet
+
+
+def invalidate_sprite_sheet(sender, instance, **kwargs) -> None:
+    cache.delete(SHEET_CACHE_KEY.format(location_id=instance.location_id))
+
+
+def sprite_sheet_url(location: Location) -> str:
+    """
+    Versioned sheet URL, the version changes with the content so responses can be cached as immutable.
+    """
+    sheet = get_sprite_sheet(location)
+    path = reverse('sprite_sheet', kwargs={'public_id': location.public_id})
+
+    return f"{path}?v={sheet['version']}"
+
+
+def render_sprite(entity, sheet_url: str) -> str:
+    """
+    Renders an entity as a positioned <use> reference into the location sprite sheet.
+    """
+    key, viewbox, _ = split_sprite(entity.svg)
+
+    return (f'<svg id="svg-{entity.public_id}" class="position-absolute sprite entity" '
+            f'style="top:{entity.top}%;left:{entity.left}%" viewBox="{viewbox}">'
+            f'<use href="{sheet_url}#{key}"/></svg>')
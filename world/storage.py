@@ -0,0 +1,51 @@
+from django.conf import settings
+from django.db import connections
+
+from .models import Enemy, EventLog
+
+# Rows in these tables only matter while an event is running and no durable table references them, so Postgres
+# allows them to be UNLOGGED and skip the WAL entirely.
+#
+# Recovery: after a crash or unclean shutdown Postgres truncates unlogged tables. Running dungeon events are left
+# without enemies, so the next poll from each player ends the event and detaches them, and the following polls
+# match them into freshly spawned events. Event logs are simply lost. Players, worlds and events themselves are
+# untouched because they stay logged.
+TRANSIENT_MODELS = (Enemy, EventLog)
+
+
+def sync_transient_tables(using: str = 'default') -> list[str]:
+    """
+    Brings the transient combat tables in line with UNLOGGED_COMBAT_TABLES and returns the tables that changed.
+    Does nothing on databases other than Postgres.
+    """
+    connection = connections[using]
+
+    if connection.vendor != 'postgresql':
+        return []
+
+    unlogged = settings.UNLOGGED_COMBAT_TABLES
+    persistence = 'u' if unlogged else 'p'
+    changed = []
+
+    with connection.cursor() as cursor:
+        for model in TRANSIENT_MODELS:
+            table = model._meta.db_table
+            cursor.execute("SELECT relpersistence FROM pg_class WHERE oid = to_regclass(%s)", [table])
+            row = cursor.fetchone()
+
+            if not row or row[0] == persistence:
+                continue
+
+            # Rewrites the table under an exclusive lock, which is why this only runs after migrate
+            cursor.execute(f"ALTER TABLE {connection.ops.quote_name(table)} SET {'UNLOGGED' if unlogged else 'LOGGED'}")
+            changed.append(table)
+
+    return changed
+
+
+def sync_transient_tables_handler(sender, using='default', verbosity=1, **kwargs):
+    changed = sync_transient_tables(using=using)
+
+    if changed and verbosity:
+        mode = 'UNLOGGED' if settings.UNLOGGED_COMBAT_TABLES else 'LOGGED'
+        print(f"  Set {mode}: {', '.join(changed)}")
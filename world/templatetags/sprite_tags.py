@@ -0,0 +1,17 @@
+from django import template
+from django.utils.safestring import mark_safe
+
+from world.sprites import render_sprite
+
+register = template.Library()
+
+
+@register.simple_tag
+def entity_svg(entity, sheet_url=None):
+    """
+    Renders an entity as a sprite sheet <use> reference when a sheet is available, otherwise as its full inline svg.
+    """
+    if sheet_url:
+        return mark_safe(render_sprite(entity, sheet_url))
+
+    return mark_safe(entity.render_svg)
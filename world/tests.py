@@ -1,3 +1,829 @@
-from django.test import TestCase
+import os
+import time
+import random
+import uuid
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection, connections, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models import F
+from django.http import HttpResponse
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+
+from authentication.models import User
+from . import event as events, matchmaking, polling, reaper, spawns, sprites, storage, worldgen
+from .matchmaking import join_event, leave_event
+from .models import (World, WorldJob, Region, Location, Event, EventLog, Enemy, EnemyArchetype, EnemyTemplate,
+                     Player, PlayerLog, PlayerState, RegionChatMessage, ENEMY_SVG)
+
+LAGGING = 'lagging_replica'
+ENTITY_SVG = '<svg id="svg-{public_id}" style="top:{top}%;left:{left}%" viewBox="0 0 100 100"><rect/></svg>'
+
+
+def on_other_connection(fn):
+    """
+    Runs fn in another thread, which Django gives its own database connection, as a concurrent request would.
+    """
+    def run():
+        try:
+            return fn()
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run).result()
+
+
+def create_archetypes():
+    for name in ('Brute', 'Skirmisher', 'Caster'):
+        EnemyArchetype.objects.create(name=name)
+
+
+def create_world(name: str = 'Test World') -> tuple[Location, Location]:
+    """
+    A one region world with a town and a dungeon whose single enemy template always spawns. Returns both locations.
+    """
+    world = World.objects.create(name=name)
+    region = Region.objects.create(name='Test Region', biome='F', world=world)
+    town = Location.objects.create(name='Test Town', type='T', region=region, max_players=100, spawn_rate=None)
+    dungeon = Location.objects.create(name='Test Dungeon', type='D', region=region, max_players=3, spawn_rate=5)
+    archetype = EnemyArchetype.objects.create(name='Brute')
+    EnemyTemplate.objects.create(name='Rat', svg=ENTITY_SVG, max_health=50, initiative=1, award_xp=1,
+                                 location=dungeon, archetype=archetype)
+    world.start_location = town
+    world.save(update_fields=['start_location'])
+
+    return town, dungeon
+
+
+def create_player(name: str, location: Location | None, max_health: int = 30) -> Player:
+    user = User.objects.create_user(username=name, password='password', alias=name)
+    player = Player(name=name, owner=user, active=user, location=location, max_health=max_health)
+    player.save()
+
+    return player
+
+
+class LaggingReplicaMixin:
+    """
+    Adds a read replica that has not received anything yet, an empty database with the schema, and routes the
+    opted-in reads to it.
+    """
+    @classmethod
+    def setUpClass(cls):
+        # Added here rather than on the class, the test runner checks the aliases of collected tests before this runs
+        path = tempfile.mktemp(suffix='.sqlite3')
+        databases = {**connections.settings, LAGGING: {'ENGINE': 'django.db.backends.sqlite3', 'NAME': path}}
+        connections.settings[LAGGING] = connections.configure_settings(databases)[LAGGING]
+        cls.addClassCleanup(os.remove, path)
+        cls.addClassCleanup(connections.settings.pop, LAGGING)
+        cls.addClassCleanup(connections.__delitem__, LAGGING)
+        cls.addClassCleanup(lambda: connections[LAGGING].close())
+
+        with connections[LAGGING].schema_editor() as editor:
+            for model in apps.get_models():
+                if model._meta.managed and not model._meta.proxy:
+                    editor.create_model(model)
+
+        cls.databases = {*cls.databases, LAGGING}
+        super().setUpClass()
+
+
+class WorldJobTests(TransactionTestCase):
+    def setUp(self):
+        create_archetypes()
+
+    @override_settings(WORLD_REGIONS=2, WORLDGEN_PROCESSES=1)
+    def test_progress_is_visible_while_the_job_runs(self):
+        job = WorldJob.objects.create(name='Progress World')
+        seen = []
+        generate_world = worldgen.generate_world
+
+        def observed(name, regions, report):
+            def spy(done):
+                report(done)
+                seen.append(on_other_connection(lambda: WorldJob.objects.values_list('status', 'progress')
+                                                .get(id=job.id)))
+
+            return generate_world(name, regions=regions, report=spy)
+
+        with mock.patch.object(worldgen, 'REGION_BATCH_SIZE', 1), \
+                mock.patch.object(worldgen, 'generate_world', observed):
+            worldgen.run_world_job(job.id)
+
+        job.refresh_from_db()
+
+        self.assertEqual(seen, [('R', 47), ('R', 95)])
+        self.assertEqual((job.status, job.progress), ('D', 100))
+        self.assertIsNotNone(job.world.start_location_id)
+        self.assertEqual(Region.objects.filter(world=job.world).count(), 2)
+
+    @override_settings(WORLD_REGIONS=1, WORLDGEN_PROCESSES=1, WORLD_POOL_SIZE=0)
+    def test_world_request_runs_one_job_and_joins_it(self):
+        player = create_player('founder', None)
+        self.client.force_login(player.owner)
+        submitted = []
+
+        with mock.patch.object(worldgen._executor, 'submit', lambda fn, *args: submitted.append((fn, args))):
+            first = self.client.post('/world', {'name': 'New World'}, secure=True)
+            self.client.post('/world', {'name': 'New World'}, secure=True)
+
+        # Both requests wait on the same job, which only runs once however often it was submitted
+        self.assertContains(first, 'New World')
+        self.assertEqual(WorldJob.objects.filter(name='New World').count(), 1)
+
+        with mock.patch.object(worldgen, 'generate_world', wraps=worldgen.generate_world) as generate_world:
+            for fn, args in submitted:
+                fn(*args)
+
+        self.assertEqual(generate_world.call_count, 1)
+        self.assertEqual(WorldJob.objects.get(name='New World').status, 'D')
+
+        self.client.post('/world', {'name': 'New World'}, secure=True)
+        world = World.objects.get(name='New World')
+        self.assertEqual(Player.objects.get(id=player.id).location_id, world.start_location_id)
+
+    @override_settings(WORLD_REGIONS=1, WORLDGEN_PROCESSES=1, WORLD_POOL_SIZE=0)
+    def test_deleted_world_of_a_done_job_is_generated_again(self):
+        job = WorldJob.objects.create(name='Lost World')
+        worldgen.run_world_job(job.id)
+        World.objects.get(name='Lost World').delete()
+        player = create_player('returning', None)
+        self.client.force_login(player.owner)
+
+        with mock.patch.object(worldgen._executor, 'submit', lambda fn, *args: fn(*args)):
+            response = self.client.post('/world', {'name': 'Lost World'}, secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'D')
+        self.assertIsNotNone(job.world)
+
+        self.client.post('/world', {'name': 'Lost World'}, secure=True)
+        self.assertEqual(Player.objects.get(id=player.id).location_id, job.world.start_location_id)
+
+    def test_failed_job_is_reported_and_retried(self):
+        job = WorldJob.objects.create(name='Failing World')
+
+        with mock.patch.object(worldgen, 'generate_world', side_effect=RuntimeError('no archetypes')), \
+                self.assertLogs(worldgen.logger, 'ERROR'):
+            worldgen.run_world_job(job.id)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.error), ('F', 'no archetypes'))
+        self.assertFalse(World.objects.filter(name='Failing World').exists())
+
+        worldgen.run_world_job(job.id)
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, 'D')
+
+    def test_running_job_is_not_claimed_again(self):
+        job = WorldJob.objects.create(name='Busy World', status='R', updated_at=time.time())
+
+        with mock.patch.object(worldgen, 'generate_world') as generate_world:
+            worldgen.run_world_job(job.id)
+
+        generate_world.assert_not_called()
+        self.assertEqual(WorldJob.objects.get(id=job.id).status, 'R')
+
+    @override_settings(WORLD_REGIONS=2, WORLDGEN_PROCESSES=1)
+    def test_replaced_run_stops_without_touching_the_job(self):
+        job = WorldJob.objects.create(name='Slow World')
+        generate_world = worldgen.generate_world
+
+        def reclaimed(name, regions, report):
+            def taken_over(done):
+                # Another run claimed the job after this one went stale
+                WorldJob.objects.filter(id=job.id).update(run_id=uuid.uuid4(), progress=0)
+                report(done)
+
+            return generate_world(name, regions=regions, report=taken_over)
+
+        with mock.patch.object(worldgen, 'REGION_BATCH_SIZE', 1), \
+                mock.patch.object(worldgen, 'generate_world', reclaimed), \
+                self.assertLogs(worldgen.logger, 'WARNING'):
+            worldgen.run_world_job(job.id)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.progress), ('R', 0))
+        self.assertFalse(World.objects.filter(name='Slow World').exists())
+
+    def test_incomplete_world_is_replaced(self):
+        World.objects.create(name='Broken World')
+        job = WorldJob.objects.create(name='Broken World')
+
+        worldgen.run_world_job(job.id)
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, 'D')
+        self.assertEqual(World.objects.filter(name='Broken World').count(), 1)
+        self.assertIsNotNone(job.world.start_location_id)
+
+
+@override_settings(GAME_DATA_CACHE='shared', POLL_MIN_INTERVAL=0, DATABASE_READ_ALIASES=[LAGGING])
+class ReplicaLagTests(LaggingReplicaMixin, TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_poll_deltas_are_read_from_the_primary(self):
+        town, _ = create_world()
+        reader = create_player('reader', town)
+        writer = create_player('writer', town)
+        User.objects.filter(id=reader.owner_id).update(last_refresh=time.time() - 5)
+
+        RegionChatMessage.objects.create(message='Hello from the primary', user=writer.owner, region=town.region)
+        PlayerLog.objects.create(player=reader, log='Logged on the primary')
+        self.client.force_login(reader.owner)
+
+        with CaptureQueriesContext(connections[LAGGING]) as replica_queries:
+            response = self.client.get('/', {'trigger': 'update'}, secure=True, HTTP_HX_REQUEST='true')
+
+        self.assertContains(response, 'Hello from the primary')
+        self.assertContains(response, 'Logged on the primary')
+        # The online player list still comes from the replica
+        self.assertTrue(replica_queries.captured_queries)
+
+
+@override_settings(GAME_DATA_CACHE='shared', DATABASE_READ_ALIASES=[LAGGING])
+class GameStateApiTests(LaggingReplicaMixin, APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.town, _ = create_world()
+        self.player = create_player('bot', self.town)
+        self.other = create_player('other', self.town)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.player.owner).key}')
+
+    def get_state(self, **params):
+        return self.client.get('/api/state', params, secure=True)
+
+    def test_full_snapshot(self):
+        RegionChatMessage.objects.create(message='Welcome', user=self.other.owner, region=self.town.region)
+        response = self.get_state(since=0)
+
+        self.assertEqual(response.status_code, 200)
+        state = response.json()
+        self.assertEqual(state['player']['id'], str(self.player.public_id))
+        self.assertEqual(state['travel']['loc'][0], str(self.town.public_id))
+        self.assertEqual([row[1:] for row in state['chat']], [['other', 'Welcome']])
+        self.assertIsNotNone(state['event'])
+
+    def test_delta_after_since(self):
+        RegionChatMessage.objects.create(message='Before', user=self.other.owner, region=self.town.region)
+        cursor = self.get_state(since=0).json()['cursor']
+        RegionChatMessage.objects.create(message='After', user=self.other.owner, region=self.town.region)
+
+        state = self.get_state(since=cursor).json()
+
+        # Read from the primary although the replica has not received the message
+        self.assertEqual([row[2] for row in state['chat']], ['After'])
+        self.assertIsNone(state['travel'])
+        self.assertGreaterEqual(state['cursor'], cursor)
+
+    def test_bad_since(self):
+        response = self.get_state(since='yesterday')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('since', response.json())
+
+    def test_token_required(self):
+        self.client.credentials()
+
+        self.assertEqual(self.get_state().status_code, 401)
+
+
+@override_settings(GAME_DATA_CACHE='shared', POLL_MIN_INTERVAL=0)
+class PollCoalescingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.flight_key = polling.POLL_FLIGHT_KEY.format(key='map:1')
+
+    def test_duplicates_share_the_leaders_response(self):
+        calls = []
+        followers = []
+
+        def leader():
+            calls.append('leader')
+            followers.append(executor.submit(polling.coalesce_poll, 'map:1', lambda: calls.append('follower')))
+            # Let the duplicate arrive while this poll is in flight
+            time.sleep(0.2)
+
+            return HttpResponse('leader')
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            response = polling.coalesce_poll('map:1', leader)
+
+        self.assertEqual(calls, ['leader'])
+        self.assertEqual(followers[0].result().content, response.content)
+        self.assertIsNone(cache.get(self.flight_key))
+
+    def test_claim_of_another_poll_is_kept(self):
+        def expired():
+            # This poll's claim expired and the next poll took over
+            cache.set(self.flight_key, 'next', polling.POLL_FLIGHT_TIMEOUT)
+
+            return HttpResponse()
+
+        polling.coalesce_poll('map:1', expired)
+
+        self.assertEqual(cache.get(self.flight_key), 'next')
+
+    def test_leader_finishing_during_the_claim_is_claimed_again(self):
+        calls = []
+
+        with mock.patch.object(polling.cache, 'add', side_effect=[False, True]):
+            response = polling.coalesce_poll('map:1', lambda: calls.append('poll') or HttpResponse('ran'))
+
+        self.assertEqual((calls, response.content), (['poll'], b'ran'))
+
+    def test_duplicates_wait_no_longer_than_a_poll_interval(self):
+        cache.set(self.flight_key, 'stuck', polling.POLL_FLIGHT_TIMEOUT)
+        started = time.monotonic()
+
+        response = polling.coalesce_poll('map:1', lambda: self.fail('ran while another poll was in flight'))
+
+        self.assertEqual(response.status_code, 204)
+        # The map polls every second
+        self.assertLess(time.monotonic() - started, 1.5)
+
+    @override_settings(POLL_MIN_INTERVAL=5)
+    def test_rapid_map_polls_are_throttled(self):
+        town, _ = create_world()
+        player = create_player('poller', town)
+        self.client.force_login(player.owner)
+
+        def poll():
+            return self.client.get('/', {'trigger': 'update'}, secure=True, HTTP_HX_REQUEST='true')
+
+        self.assertEqual(poll().status_code, 200)
+        self.assertEqual(poll().status_code, 204)
+
+
+def load_player(player: Player) -> Player:
+    return Player.objects.select_related('owner', 'location', 'state__event').get(id=player.id)
+
+
+@override_settings(GAME_DATA_CACHE='shared')
+class EventCommitTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        _, self.dungeon = create_world()
+        self.player = create_player('leader', self.dungeon)
+        self.other = create_player('other', self.dungeon)
+        self.event = join_event(self.player.state, self.dungeon)
+        join_event(self.other.state, self.dungeon)
+        Event.objects.filter(id=self.event.id).update(last_update=time.time() - 3)
+
+    def other_state(self) -> tuple:
+        return PlayerState.objects.values_list('event', 'health', 'position').get(player=self.other)
+
+    def simulate_then(self, concurrent_write):
+        """
+        Patches the simulation so concurrent_write runs from another connection once a poll has simulated.
+        """
+        simulate_event = events.simulate_event
+
+        def simulate(*args, **kwargs):
+            outcome = simulate_event(*args, **kwargs)
+            on_other_connection(concurrent_write)
+
+            return outcome
+
+        return mock.patch.object(events, 'simulate_event', simulate)
+
+    def test_join_and_leave_move_the_version(self):
+        version = Event.objects.get(id=self.event.id).version
+
+        leave_event(self.other.id)
+
+        self.assertEqual(Event.objects.get(id=self.event.id).version, version + 1)
+        self.assertEqual(self.other_state()[0], None)
+
+    def test_stale_outcome_is_rejected(self):
+        player = load_player(self.player)
+        snapshot = events.load_event(events.event_queryset(self.event.id, True))
+        outcome = events.simulate_event(player, snapshot, 3)
+        Event.objects.filter(id=self.event.id).update(version=F('version') + 1)
+
+        with transaction.atomic():
+            self.assertFalse(events.commit_event(player, snapshot, outcome))
+
+        self.assertFalse(PlayerLog.objects.filter(player=self.player).exists())
+
+    @override_settings(EVENT_OPTIMISTIC=True)
+    def test_player_leaving_mid_simulation_is_not_written(self):
+        before = self.other_state()
+
+        with self.simulate_then(lambda: leave_event(self.other.id)):
+            result = events.process_dungeon_event(load_player(self.player), self.event, True)
+
+        self.assertEqual(self.other_state(), (None,) + before[1:])
+        # The leader is shown the committed event instead, which the other player has left
+        self.assertEqual([e.pk for e in result['entities'] if e.type == 'P'], [self.player.id])
+
+    @override_settings(EVENT_OPTIMISTIC=True)
+    def test_ended_event_is_left_after_a_lost_race(self):
+        Enemy.objects.filter(event=self.event).update(dead=time.time())
+        other_commit = Event.objects.filter(id=self.event.id)
+
+        with self.simulate_then(lambda: other_commit.update(version=F('version') + 1)):
+            events.process_dungeon_event(load_player(self.player), self.event, True)
+
+        self.assertIsNone(PlayerState.objects.get(player=self.player).event_id)
+        self.assertIsNotNone(Event.objects.get(id=self.event.id).ended)
+
+    @override_settings(EVENT_SKIP_LOCKED=True)
+    def test_skip_locked_commit_measures_from_the_locked_row(self):
+        # The event read by the view is older than the row the poll locks
+        stale = Event.objects.get(id=self.event.id)
+        stale.last_update -= 100
+        version = stale.version
+
+        events.process_dungeon_event(load_player(self.player), stale, True)
+
+        event = Event.objects.get(id=self.event.id)
+        delta = float(PlayerLog.objects.get(player=self.player, log__startswith='Event last update delta')
+                      .log.rsplit(' ', 1)[1])
+        self.assertLess(delta, 10)
+        self.assertEqual(event.version, version + 1)
+        self.assertGreater(event.last_update, time.time() - 3)
+
+
+@override_settings(GAME_DATA_CACHE='shared')
+class MatchmakingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.town, self.dungeon = create_world()
+
+    def test_full_events_are_not_joined(self):
+        players = [create_player(f'player{i}', self.dungeon) for i in range(4)]
+        joined = [join_event(player.state, self.dungeon) for player in players]
+
+        # The fourth finds the event full and no new one can start within the claim window
+        self.assertEqual(len({event.id for event in joined[:3]}), 1)
+        self.assertIsNone(joined[3])
+        self.assertEqual(Event.objects.get(id=joined[0].id).slots_taken, 3)
+
+    def test_leaving_releases_the_slot(self):
+        player = create_player('leaver', self.dungeon)
+        event = join_event(player.state, self.dungeon)
+
+        self.assertEqual(leave_event(player.id), event.id)
+        self.assertEqual(Event.objects.get(id=event.id).slots_taken, 0)
+        self.assertIsNone(leave_event(player.id))
+
+    def test_joining_another_world_releases_the_slot(self):
+        player = create_player('traveller', self.dungeon)
+        event = join_event(player.state, self.dungeon)
+        other_town, _ = create_world('Other World')
+        self.client.force_login(player.owner)
+
+        self.client.post('/world', {'name': 'Other World'}, secure=True)
+
+        self.assertEqual(Event.objects.get(id=event.id).slots_taken, 0)
+        self.assertEqual(PlayerState.objects.get(player=player).event_id, None)
+        self.assertEqual(Player.objects.get(id=player.id).location_id, other_town.id)
+
+    def test_dungeon_cooldown_counts_from_the_last_event_ended(self):
+        self.assertTrue(matchmaking._claim_new_event(self.dungeon))
+
+        # Another event may start right after the claim window, none has ended yet
+        Location.objects.filter(id=self.dungeon.id).update(event_claimed=time.time() - matchmaking.EVENT_CLAIM_WINDOW)
+        self.assertTrue(matchmaking._claim_new_event(self.dungeon))
+
+        Location.objects.filter(id=self.dungeon.id).update(event_claimed=0, last_event=time.time())
+        self.assertFalse(matchmaking._claim_new_event(self.dungeon))
+        self.assertTrue(matchmaking._claim_new_event(self.town))
+
+
+@override_settings(GAME_DATA_CACHE='shared')
+class BatchGameStateApiTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        _, self.dungeon = create_world()
+        self.first = create_player('first', self.dungeon, max_health=1000)
+        self.second = Player(name='second', owner=self.first.owner, location=self.dungeon, max_health=1000)
+        self.second.save()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.first.owner).key}')
+
+    def test_characters_in_one_event_advance_it_once(self):
+        # The second character is already in the event the first one joins during the call
+        event = join_event(self.second.state, self.dungeon)
+        Event.objects.filter(id=event.id).update(last_update=time.time() - 3)
+        version = Event.objects.get(id=event.id).version
+
+        with mock.patch.object(events, 'simulate_event', wraps=events.simulate_event) as simulate:
+            response = self.client.get('/api/batch',
+                                       {'characters': f'{self.first.public_id},{self.second.public_id}'}, secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(simulate.call_count, 1)
+        self.assertEqual(set(response.json()['characters']), {str(self.first.public_id), str(self.second.public_id)})
+        self.assertEqual(PlayerState.objects.get(player=self.first).event_id, event.id)
+        # One slot taken by the first character and one simulation
+        self.assertEqual(Event.objects.get(id=event.id).version, version + 2)
+
+    def test_unknown_characters_are_reported(self):
+        other = create_player('other', self.dungeon)
+        response = self.client.get('/api/batch', {'characters': f'{self.first.public_id},{other.public_id}'},
+                                   secure=True)
+
+        self.assertEqual(list(response.json()['characters']), [str(self.first.public_id)])
+        self.assertEqual(response.json()['unavailable'], [str(other.public_id)])
+
+
+@override_settings(GAME_DATA_CACHE='shared', POLL_MIN_INTERVAL=0)
+class TemplateDeletionTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        _, self.dungeon = create_world()
+        self.player = create_player('fighter', self.dungeon, max_health=1000)
+        self.event = join_event(self.player.state, self.dungeon)
+        self.client.force_login(self.player.owner)
+
+    def test_enemies_of_a_deleted_template_keep_rendering(self):
+        EnemyTemplate.objects.filter(location=self.dungeon).delete()
+        enemy = Enemy.objects.filter(event=self.event).first()
+
+        self.assertIsNone(enemy.template_id)
+        self.assertEqual(enemy.svg, ENEMY_SVG)
+
+        for sprite_sheets in (False, True):
+            with self.subTest(sprite_sheets=sprite_sheets), self.settings(SPRITE_SHEETS=sprite_sheets):
+                response = self.client.get('/', secure=True)
+
+                self.assertContains(response, f'svg-{enemy.public_id}')
+
+    def test_sprite_sheet_holds_the_stand_in_sprite(self):
+        key, _, _ = sprites.split_sprite(ENEMY_SVG)
+
+        self.assertIn(f'id="{key}"', sprites.get_sprite_sheet(self.dungeon)['body'])
+
+
+@override_settings(GAME_DATA_CACHE='shared')
+class SpriteSheetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        _, self.dungeon = create_world()
+        self.url = sprites.sprite_sheet_url(self.dungeon)
+
+    def test_current_version_is_cached_as_immutable(self):
+        sheet = sprites.get_sprite_sheet(self.dungeon)
+        response = self.client.get(self.url, secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode(), sheet['body'])
+        self.assertEqual(response['ETag'], f'"{sheet["version"]}"')
+        self.assertIn('immutable', response['Cache-Control'])
+
+        response = self.client.get(self.url, secure=True, HTTP_IF_NONE_MATCH=f'"{sheet["version"]}"')
+
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_other_versions_are_redirected_to_the_current_one(self):
+        path = reverse('sprite_sheet', kwargs={'public_id': self.dungeon.public_id})
+
+        for query in ('?v=0123456789ab', ''):
+            with self.subTest(query=query):
+                response = self.client.get(path + query, secure=True)
+
+                self.assertRedirects(response, self.url, fetch_redirect_response=False)
+                self.assertNotIn('immutable', response['Cache-Control'])
+
+    def test_stale_sheet_is_rebuilt_for_a_newer_version(self):
+        sheet = sprites.get_sprite_sheet(self.dungeon)
+        cache.set(sprites.SHEET_CACHE_KEY.format(location_id=self.dungeon.id), {'version': 'stale', 'body': '<svg/>'})
+        response = self.client.get(self.url, secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode(), sheet['body'])
+        self.assertEqual(sprites.get_sprite_sheet(self.dungeon)['version'], sheet['version'])
+
+    def test_template_changes_invalidate_the_sheet(self):
+        svg = '<svg viewBox="0 0 10 10"><circle cx="5" cy="5" r="3"/></svg>'
+        key, _, _ = sprites.split_sprite(svg)
+        template = EnemyTemplate.objects.get(location=self.dungeon)
+        template.svg = svg
+        template.save()
+
+        self.assertNotEqual(sprites.sprite_sheet_url(self.dungeon), self.url)
+        self.assertIn(f'id="{key}"', sprites.get_sprite_sheet(self.dungeon)['body'])
+
+        template.delete()
+
+        self.assertNotIn(f'id="{key}"', sprites.get_sprite_sheet(self.dungeon)['body'])
+
+    def test_render_sprite_references_the_sheet(self):
+        state = create_player('fighter', self.dungeon).state
+        state.top, state.left = 30, 70
+        key, viewbox, _ = sprites.split_sprite(state.svg)
+        html = sprites.render_sprite(state, self.url)
+
+        self.assertIn(f'id="svg-{state.public_id}"', html)
+        self.assertIn(f'style="top:30%;left:70%" viewBox="{viewbox}"', html)
+        self.assertIn(f'<use href="{self.url}#{key}"/>', html)
+
+
+class ReaperTests(TestCase):
+    def setUp(self):
+        _, self.dungeon = create_world()
+        self.now = time.time()
+        self.old = self.now - 7200
+
+    def create_event(self, **fields) -> Event:
+        event = Event.objects.create(location=self.dungeon, **fields)
+        Enemy.objects.create(name='Rat', event=event)
+        EventLog.objects.create(event=event, log='A rat appears')
+
+        return event
+
+    def test_ended_and_abandoned_events_are_reaped(self):
+        self.create_event(active=False, ended=self.old, last_update=self.old)
+        # Left through Travel, which deactivates the event, and through a character switch, which does not
+        self.create_event(active=False, last_update=self.old)
+        self.create_event(last_update=self.old)
+
+        recently_ended = self.create_event(active=False, ended=self.now - 60, last_update=self.now - 60)
+        recently_left = self.create_event(active=False, last_update=self.now - 60)
+        occupied = self.create_event(last_update=self.old, slots_taken=1)
+        PlayerState.objects.filter(player=create_player('idler', self.dungeon)).update(event=occupied)
+
+        totals = reaper.reap_ended_events(older_than=3600)
+
+        kept = {recently_ended.id, recently_left.id, occupied.id}
+        self.assertEqual(set(Event.objects.values_list('id', flat=True)), kept)
+        self.assertEqual(set(Enemy.objects.values_list('event_id', flat=True)), kept)
+        self.assertEqual(set(EventLog.objects.values_list('event_id', flat=True)), kept)
+        self.assertEqual((totals['events'], totals['abandoned'], totals['enemies'], totals['logs']), (3, 2, 3, 3))
+
+    def test_abandoned_event_a_player_is_joining_is_kept(self):
+        # The slot is taken before the joining player's state points at the event
+        joining = self.create_event(last_update=self.old, slots_taken=1)
+
+        reaper.reap_ended_events(older_than=3600)
+
+        self.assertTrue(Event.objects.filter(id=joining.id, ended__isnull=True).exists())
+
+
+@override_settings(GAME_DATA_CACHE='shared', WORLD_POOL_SIZE=2, WORLD_REGIONS=1)
+class RegionPoolTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_archetypes()
+        patcher = mock.patch.object(worldgen._pool_executor, 'submit')
+        self.submit = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def pooled(self) -> set[int]:
+        return set(Region.objects.filter(world__isnull=True).values_list('id', flat=True))
+
+    def test_pool_is_filled_to_its_size(self):
+        self.assertEqual(worldgen.fill_region_pool(), 2)
+        self.assertEqual(len(self.pooled()), 2)
+        self.assertEqual(Location.objects.filter(region__world__isnull=True, type='T').count(), 2)
+        self.assertEqual(worldgen.fill_region_pool(), 0)
+
+    def test_pooled_region_is_claimed_once(self):
+        worldgen.fill_region_pool()
+        pooled = self.pooled()
+
+        first = worldgen.claim_pooled_world('First')
+        second = worldgen.claim_pooled_world('Second')
+
+        claimed = {first.region_set.get().id, second.region_set.get().id}
+        self.assertEqual(claimed, pooled)
+        self.assertEqual(first.start_location.region.world, first)
+        self.assertIsNone(worldgen.claim_pooled_world('Third'))
+        self.assertFalse(World.objects.filter(name='Third').exists())
+
+        # Claiming a name that already exists hands back that world without using up a region
+        worldgen.fill_region_pool()
+        self.assertEqual(worldgen.claim_pooled_world('First'), first)
+        self.assertEqual(len(self.pooled()), 2)
+
+    def test_claims_refill_the_pool(self):
+        worldgen.fill_region_pool()
+        worldgen.claim_pooled_world('First')
+
+        self.submit.assert_called_once_with(worldgen._refill_region_pool)
+        self.assertEqual(len(self.pooled()), 1)
+        self.assertEqual(worldgen.fill_region_pool(), 1)
+        self.assertEqual(len(self.pooled()), 2)
+
+    def test_pool_is_not_used_for_larger_worlds(self):
+        worldgen.fill_region_pool()
+
+        with self.settings(WORLD_REGIONS=2):
+            self.assertIsNone(worldgen.claim_pooled_world('Large'))
+
+        self.assertEqual(len(self.pooled()), 2)
+
+
+@override_settings(GAME_DATA_CACHE='shared')
+class SpawnTableTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        _, self.dungeon = create_world()
+        self.rat = EnemyTemplate.objects.get(location=self.dungeon)
+
+    def add_template(self, name: str, spawn_weight: int) -> EnemyTemplate:
+        return EnemyTemplate.objects.create(name=name, svg=ENTITY_SVG, max_health=80, initiative=2,
+                                            spawn_weight=spawn_weight, location=self.dungeon,
+                                            archetype=self.rat.archetype)
+
+    def test_template_changes_invalidate_the_cached_table(self):
+        self.assertEqual(spawns.get_spawn_table(self.dungeon.id).template_ids, (self.rat.id,))
+
+        with self.assertNumQueries(0):
+            spawns.get_spawn_table(self.dungeon.id)
+
+        wolf = self.add_template('Wolf', spawn_weight=3)
+        table = spawns.get_spawn_table(self.dungeon.id)
+
+        self.assertEqual(table.template_ids, (self.rat.id, wolf.id))
+        self.assertEqual(table.cum_weights, (self.rat.spawn_weight, self.rat.spawn_weight + 3))
+
+        self.rat.spawn_weight = 0
+        self.rat.save()
+
+        self.assertEqual(spawns.get_spawn_table(self.dungeon.id).template_ids, (wolf.id,))
+
+        wolf.delete()
+
+        self.assertFalse(spawns.get_spawn_table(self.dungeon.id))
+
+    def test_spawns_follow_the_template_weights(self):
+        self.add_template('Ghost', spawn_weight=0)
+        wolf = self.add_template('Wolf', spawn_weight=99 * self.rat.spawn_weight)
+        table = spawns.get_spawn_table(self.dungeon.id)
+        event = Event.objects.create(location=self.dungeon)
+
+        with mock.patch.object(spawns, 'random', random.Random(0)):
+            enemies = [enemy for _ in range(20) for enemy in spawns.spawn_enemies(event, table)]
+
+        names = [enemy.name for enemy in enemies]
+        self.assertNotIn('Ghost', names)
+        self.assertGreater(names.count('Wolf'), 0.9 * len(names))
+        self.assertEqual(Enemy.objects.filter(event=event).count(), len(enemies))
+        self.assertEqual(EventLog.objects.filter(event=event).count(), len(enemies))
+
+        spawned = Enemy.objects.filter(event=event, template=wolf).first()
+        self.assertEqual((spawned.health, spawned.max_health, spawned.initiative, spawned.award_xp),
+                         (80, 80, 2, wolf.award_xp))
+
+
+class TransientTableTests(TestCase):
+    def test_sync_is_a_no_op_outside_postgres(self):
+        self.assertNotEqual(connection.vendor, 'postgresql')
+
+        for unlogged in (True, False):
+            with self.subTest(unlogged=unlogged), self.settings(UNLOGGED_COMBAT_TABLES=unlogged):
+                with CaptureQueriesContext(connection) as queries, mock.patch('builtins.print') as printed:
+                    self.assertEqual(storage.sync_transient_tables(), [])
+                    storage.sync_transient_tables_handler(sender=None, verbosity=2)
+
+                self.assertEqual(len(queries), 0)
+                printed.assert_not_called()
+
+
+class PlayerStateMigrationTests(TransactionTestCase):
+    before = [('world', '0002_baseline_schema')]
+    after = [('world', '0003_player_state')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_existing_players_get_their_state(self):
+        apps = self.migrate(self.before)
+        world = apps.get_model('world', 'World').objects.create(name='Old World')
+        region = apps.get_model('world', 'Region').objects.create(name='Old Region', biome='F', world=world)
+        location = apps.get_model('world', 'Location').objects.create(name='Old Dungeon', type='D', region=region)
+        event = apps.get_model('world', 'Event').objects.create(location=location)
+        player = apps.get_model('world', 'Player').objects.create(name='veteran', type='P', max_health=30, health=12,
+                                                                  position=44, left=20, top=60, event=event,
+                                                                  event_joined=5, location=location)
+        apps.get_model('world', 'Player').objects.create(name='idle', type='P', max_health=30, health=30)
+
+        apps = self.migrate(self.after)
+        PlayerState = apps.get_model('world', 'PlayerState')
+
+        self.assertEqual(PlayerState.objects.count(), 2)
+        state = PlayerState.objects.get(player_id=player.pk)
+        self.assertEqual((state.health, state.position, state.left, state.top, state.event_id, state.event_joined),
+                         (12, 44, 20, 60, event.pk, 5))
+        self.assertEqual(apps.get_model('world', 'Event').objects.get(pk=event.pk).slots_taken, 1)
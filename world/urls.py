@@ -1,11 +1,13 @@
 from django.urls import path
 from .views import (UserProfileView, GetPlayerCharacters, CreateCharacter, SelectCharacter, SelectWorld,
-                    Map, Travel, RegionChat, Stats, Items)
+                    Map, Travel, RegionChat, Stats, Items, SpriteSheet, WorldJobStatus)
+from .api import GameState, BatchGameState
 
 
 urlpatterns = [
     path('characters', GetPlayerCharacters.as_view(), name='characters'),
     path('world', SelectWorld.as_view(), name='world'),
+    path('world/jobs/<uuid:public_id>', WorldJobStatus.as_view(), name='world_job'),
     path('items', Items.as_view(), name='items'),
     path('', Map.as_view(), name='home'),
     path('profile', UserProfileView.as_view(), name='profile'),
@@ -14,4 +16,7 @@ urlpatterns = [
     path('stats', Stats.as_view(), name='stats'),
     path('travel', Travel.as_view(), name='travel'),
     path('region_chat', RegionChat.as_view(), name='region_chat'),
+    path('sprites/<uuid:public_id>.svg', SpriteSheet.as_view(), name='sprite_sheet'),
+    path('api/state', GameState.as_view(), name='api_state'),
+    path('api/batch', BatchGameState.as_view(), name='api_batch'),
 ]
\ No newline at end of file
@@ -2,12 +2,14 @@ import json
 import time
 import re
 
-from django.db.models import QuerySet
+from django.db.models import Exists
 from django.views.generic import TemplateView, View
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect, render, reverse
 from django.http import HttpResponse
-from django.db import transaction
+from django.db import transaction, DEFAULT_DB_ALIAS
+from django.conf import settings
+from django.utils.cache import patch_cache_control
 
 from django.utils.html import strip_tags
 from django.template import engines
@@ -15,12 +17,18 @@ from django.template.loader import render_to_string
 
 from rest_framework.authtoken.models import Token
 
-from core.utils import generators
 from authentication.models import User
-from .models import (World, Region, Location, RegionChatMessage, Player, PlayerLog, PlayerClass, Event)
+from core import identity
+from core.replicas import read_db
+from .models import (World, WorldJob, Region, Location, RegionChatMessage, Player, PlayerState, PlayerLog, PlayerClass,
+                     Event)
 from .forms import CharacterCreateForm, WorldCreationForm
-from .event import process_dungeon_event, process_town_event, get_or_create_event
-from .enemy import generate_enemy_templates
+from .gamedata import player_classes, region_locations
+from .event import process_dungeon_event, process_town_event
+from .matchmaking import join_event, leave_event
+from .worldgen import submit_world_job, claim_pooled_world
+from .polling import coalesce_poll
+from .sprites import get_sprite_sheet, sprite_sheet_url, render_sprite
 
 
 class BaseView(View):
@@ -50,14 +58,14 @@ class BaseView(View):
         return cleaned.strip()
 
     @staticmethod
-    def get_player_classes() -> QuerySet:
-        classes = PlayerClass.objects.all().order_by('id')
-
-        return classes
+    def get_player_classes() -> tuple[PlayerClass, ...]:
+        return player_classes()
 
+    # Chat and logs are read as deltas since the owner's last refresh, which moves forward on the primary as soon as
+    # they are rendered. Rows a lagging replica has not received yet would never be shown, so they stay on the primary.
     @staticmethod
     def get_region_messages(player: Player, count: int = 50, full: bool = False):
-        messages = (RegionChatMessage.objects.all()
+        messages = (RegionChatMessage.objects
                     .select_related('user')
                     .filter(region=player.location.region, created_at__gte=time.time() - 600)
                     .order_by('-created_at'))[:count]
@@ -69,8 +77,8 @@ class BaseView(View):
         return None
 
     @staticmethod
-    def get_region_players(region: Region, timeout: int = 10):
-        players = (User.objects.all()
+    def get_region_players(region: Region, timeout: int = 10, db: str = DEFAULT_DB_ALIAS):
+        players = (User.objects.using(db)
                    .filter(player__location__region=region, last_refresh__gte=(time.time() - timeout))
                    .order_by('alias'))
 
@@ -92,7 +100,7 @@ class BaseView(View):
         region = current_location.region
         world = region.world
 
-        locations = Location.objects.all().filter(region=region).order_by('level', 'id')
+        locations = region_locations(region.id)
         towns = [location for location in locations if location.type == 'T']
         dungeons = [location for location in locations if location.type == 'D']
 
@@ -107,31 +115,28 @@ class BaseView(View):
     @staticmethod
     def get_event_data(player: Player, full: bool = False) -> tuple[dict | None, bool]:
         event_data = None
-        event = player.event
+        state = player.state
+        event = state.event
         location = player.location
         joined = False
 
         # If player is not already in an event, try to put them in one
-        if not player.event:
-            event = get_or_create_event(location)
-
-            if event:
-                player.event = event
-                player.position = 40
-                player.event_joined = time.time()
-                player.save(update_fields=['event', 'position', 'event_joined'])
-
-                joined = True
+        if not state.event_id:
+            event = join_event(state, location)
+            joined = event is not None
 
         if location.type == 'D':
             event_data = {'log': [{'log': 'Exploring...', 'htclass': 'text-white log-entry'}], 'entities': None}
 
             if event:
-                event_data = process_dungeon_event(player, event, full)
+                event_data = process_dungeon_event(player, event, full or joined)
 
         elif location.type == 'T' and event:
             event_data = process_town_event(player, event, full, joined)
 
+        if event_data and event_data.get('entities') and settings.SPRITE_SHEETS:
+            event_data['sprite_sheet'] = sprite_sheet_url(location)
+
         return event_data, joined
 
     def prep_user(self, related: list = ()) -> User | None:
@@ -151,6 +156,9 @@ class BaseView(View):
             .get(id=user_id)
         )
 
+        identity.share_user(self.request, user)
+        identity.track(user)
+
         return user
 
     def prep_player(self, related: list = ()) -> tuple[Player | None, bool]:
@@ -167,14 +175,38 @@ class BaseView(View):
         try:
             player = (
                 Player.objects
-                .select_related(*related)
+                .select_related('owner', *related)
                 .get(active_id=user_id)
             )
         except Player.DoesNotExist:
             return None, True
 
+        identity.share_user(self.request, player.owner)
+        identity.track(player)
+
         return player, True
 
+    @staticmethod
+    def save_refresh(player: Player) -> Player:
+        '''
+        Moves the owner's last refresh to now and returns the player to render the refresh with.
+
+        The request's own writes reach the player through the identity map (core/identity.py), so it is only loaded
+        again when another request moved its travel or stat watermarks in the meantime, e.g. a party member's poll
+        killing it. The loaded owner keeps the previous last refresh, which the rendered changes are selected by.
+        '''
+        now = time.time()
+        unchanged = Player.objects.filter(id=player.id, last_travel=player.last_travel,
+                                          last_stat_update=player.last_stat_update)
+
+        if User.objects.filter(Exists(unchanged), id=player.owner_id).update(last_refresh=now):
+            return player
+
+        player = Player.objects.select_related('location__region__world', 'state__event', 'owner').get(id=player.id)
+        User.objects.filter(id=player.owner_id).update(last_refresh=now)
+
+        return player
+
 
 class UserProfileView(LoginRequiredMixin, TemplateView):
     template_name = 'profile.html'
@@ -260,7 +292,7 @@ class GetPlayerCharacters(BaseView):
         if not user:
             return redirect('login')
 
-        characters = Player.objects.filter(owner=user).order_by('id')
+        characters = Player.objects.using(read_db(request)).filter(owner=user).order_by('id')
         context = {'characters': characters}
 
         return render(request, self.template_name, context)
@@ -277,12 +309,18 @@ class SelectCharacter(BaseView):
         path = reverse('world')
 
         if delete:
+            for player_id in Player.objects.filter(owner_id=user.id, public_id=selected).values_list('id', flat=True):
+                leave_event(player_id)
+
             del_count, _ = Player.objects.filter(owner_id=user.id, public_id=selected).delete()
             path = reverse('characters')
 
         else:
             with transaction.atomic():
-                Player.objects.filter(active_id=user.id).update(active=None, event=None, event_joined=0)
+                for player_id in Player.objects.filter(active_id=user.id).values_list('id', flat=True):
+                    leave_event(player_id)
+
+                Player.objects.filter(active_id=user.id).update(active=None)
                 update_count = Player.objects.filter(owner_id=user.id, public_id=selected).update(active=user)
 
                 if update_count == 0:
@@ -377,55 +415,88 @@ class SelectWorld(BaseView):
         form = WorldCreationForm(request.POST)
 
         if form.is_valid():
-            with transaction.atomic():
-                world_form = form.save(commit=False)
-                world, created = World.objects.get_or_create(
-                    name=world_form.name
-                )
+            name = form.cleaned_data['name']
+            world = World.objects.filter(name=name, start_location__isnull=False).first()
 
-                if created:
-                    # For a new world, create the starting Region and locations
-                    region_data = generators.generate_region(seed=world.name, level=1)
-                    region = Region(name=region_data['name'], biome=region_data['biome'], world=world)
-                    region.save()
+            if world is None and not WorldJob.objects.filter(name=name).exists():
+                world = claim_pooled_world(name)
 
-                    for town in region_data['locations']['towns']:
-                        t = Location.objects.create(name=town['name'], level=town['level'], region=region,
-                                                    type='T', spawn_rate=None, max_players=100)
+            if world is None:
+                job = submit_world_job(name)
 
-                        world.start_location = t
+                if job.status != 'D':
+                    return render(request, self.template_name, {'form': form, 'job': job})
 
-                    for dungeon in region_data['locations']['dungeons']:
-                        d = Location.objects.create(name=dungeon['name'], level=dungeon['level'], region=region,
-                                                    type='D', spawn_rate=5, max_players=3)
+                world = job.world
 
-                        generate_enemy_templates(loc=d, biome=region_data['biome'], count=5)
+            return self.join_world(request, player, world)
 
-                    world.save()
+        return render(request, self.template_name, {'form': form})
 
-                player.location = world.start_location
-                player.save(update_fields=['location'])
+    @staticmethod
+    def join_world(request, player: Player, world: World) -> HttpResponse:
+        with transaction.atomic():
+            # The event of the old world would otherwise keep the player's slot
+            leave_event(player.id)
+            player.location_id = world.start_location_id
+            player.save(update_fields=['location'])
 
-            if request.headers.get('HX-Request'):
-                response = HttpResponse(status=204)
+        if request.headers.get('HX-Request'):
+            response = HttpResponse(status=204)
 
-                location_data = {
-                    "path": reverse('home'),
-                    "target": "#main-content",
-                    "swap": "innerHTML"
-                }
+            location_data = {
+                "path": reverse('home'),
+                "target": "#main-content",
+                "swap": "innerHTML"
+            }
 
-                response['HX-Location'] = json.dumps(location_data)
-                return response
+            response['HX-Location'] = json.dumps(location_data)
+            return response
 
-        return render(request, self.template_name, {'form': form})
+        return redirect('home')
+
+
+class WorldJobStatus(BaseView):
+    template_name = 'partials/world_job.html'
+
+    def get(self, request, public_id):
+        player, user_auth = self.prep_player(['location'])
+
+        if not user_auth:
+            return redirect('login')
+
+        if not player:
+            return redirect('characters')
+
+        job = WorldJob.objects.select_related('world').filter(public_id=public_id).first()
+
+        if job is None:
+            return HttpResponse(status=404)
+
+        if job.status == 'D' and job.world_id is None:
+            # The world was deleted after the job finished
+            job = submit_world_job(job.name)
+
+        if job.status == 'D':
+            return SelectWorld.join_world(request, player, job.world)
+
+        return render(request, self.template_name, {'job': job})
 
 
 class Map(BaseView):
     template_name = 'map.html'
 
     def get(self, request):
-        player, user_auth = self.prep_player(['location__region__world', 'event', 'owner'])
+        user_id = request.session.get('_auth_user_id')
+
+        # Update polls of the same user in flight at once share one response, see world/polling.py
+        if user_id and request.GET.get('trigger', None) == 'update':
+            return coalesce_poll(f'map:{user_id}', lambda: self.render_map(request))
+
+        return self.render_map(request)
+
+    def render_map(self, request):
+        player, user_auth = self.prep_player(['location__region__world', 'state__event'])
 
         if not user_auth:
             return redirect('login')
@@ -443,9 +514,9 @@ class Map(BaseView):
             headers = {}
             trigger_data = {}
             recent_messages = self.get_region_messages(player=player)
-            recent_player_logs = self.get_player_logs(player=player)
-            region_players = self.get_region_players(region=player.location.region)
+            region_players = self.get_region_players(region=player.location.region, db=read_db(request))
             event_data, event_joined = self.get_event_data(player=player)
+            recent_player_logs = self.get_player_logs(player=player)
 
             if recent_player_logs['logs']:
                 context['status'] = recent_player_logs
@@ -479,7 +550,9 @@ class Map(BaseView):
                                                   'left': int(entity.left)}
                                                 for entity in event_data['entities']]}
                         trigger_data['triggerMove'] = move_data
-                        new_svgs = [entity.render_svg for entity in event_data['entities']
+                        sheet_url = event_data.get('sprite_sheet')
+                        new_svgs = [render_sprite(entity, sheet_url) if sheet_url else entity.render_svg
+                                    for entity in event_data['entities']
                                     if entity.event_joined >= player.owner.last_refresh]
 
                         if new_svgs:
@@ -496,13 +569,13 @@ class Map(BaseView):
 
                     trigger_data['triggerDefeatAnimation'] = living_svgs
 
-            # Requery player to get updated location and last_travel
-            player = Player.objects.select_related('location__region__world', 'owner').get(id=player.id)
+            # Location and last_travel changed by this poll (death/respawn) are already on the player
+            player = self.save_refresh(player)
 
             context['character'] = player
             trigger_data['updateStatus'] = {
                 'hp_perc': player.health_perc,
-                'hp_curr': player.health,
+                'hp_curr': player.state.health,
                 'hp_max': player.max_health,
                 'mp_perc': player.mana_perc,
                 'mp_curr': player.mana,
@@ -545,9 +618,6 @@ class Map(BaseView):
                                     'entities': None}
                 context['event_log_swap'] = 'replace'
 
-            player.owner.last_refresh = time.time()
-            player.owner.save(update_fields=['last_refresh'])
-
             headers['HX-Trigger'] = json.dumps(trigger_data)
 
             if partials:
@@ -558,11 +628,11 @@ class Map(BaseView):
         # Render full template ( initial load )
         else:
             recent_messages = self.get_region_messages(player=player, full=True)
-            region_players = self.get_region_players(region=player.location.region)
-            context['status'] = self.get_player_logs(player=player, full=True)
-            context['player_log_swap'] = 'replace'
+            region_players = self.get_region_players(region=player.location.region, db=read_db(request))
             context['travel'] = self.get_travel_data(player=player)
             context['event'], _ = self.get_event_data(player=player, full=True)
+            context['status'] = self.get_player_logs(player=player, full=True)
+            context['player_log_swap'] = 'replace'
             context['event_log_swap'] = 'replace'
             context['region_players'] = region_players
             context['messages'] = recent_messages
@@ -583,7 +653,7 @@ class Travel(BaseView):
                 'partials/event_footer.html']
 
     def post(self, request):
-        player, user_auth = self.prep_player(['location__region', 'event',])
+        player, user_auth = self.prep_player(['location__region', 'state__event'])
 
         if not user_auth:
             return redirect('login')
@@ -593,31 +663,41 @@ class Travel(BaseView):
 
         context = {'update': True, 'event_log_swap': 'replace', 'player_log_swap': 'append'}
         context['status'] = self.get_player_logs(player=player)
-        selected_location = Location.objects.select_related('region').get(public_id=request.POST['public_id'])
+        selected_location = Location.objects.select_related('region__world').get(public_id=request.POST['public_id'])
 
         if selected_location != player.location:
             if selected_location.region == player.location.region:
                 with transaction.atomic():
-                    if player.event:
+                    if player.state.event:
+                        event_id = player.state.event_id
+
                         # Process any remaining event ticks before changing location
                         self.get_event_data(player=player, full=True)
                         self.partials.append('partials/player_log.html')
 
                         # If we are the last player to leave an event, then set it to inactive
-                        event_players = player.event.entity_set.all().filter(type='P').exclude(pk=player.id)
+                        event_players = (PlayerState.objects.all()
+                                         .filter(event_id=event_id)
+                                         .exclude(player_id=player.id))
                         if not event_players:
-                            Event.objects.all().filter(id=player.event_id).update(active=False)
+                            Event.objects.all().filter(id=event_id).update(active=False)
+
+                        # Unless the event already took us out (ended, or death and respawn)
+                        if player.state.event_id:
+                            leave_event(player.id, event_id=event_id)
 
                     # Update to new location if we weren't force-traveled via event outcome (death and respawn)
                     if player.last_travel < player.owner.last_refresh:
                         Player.objects.all().filter(id=player.id).update(location=selected_location)
+                        identity.record(Player, player.id, location=selected_location)
 
-                # Refetch player object after updates
-                player = Player.objects.select_related('location__region__world', 'event', 'owner').get(pk=player.id)
+                # The player already carries the writes above through the identity map
+                context['event'], _ = self.get_event_data(player=player, full=True)
+                player = self.save_refresh(player)
                 trigger_data = {
                     'updateStatus': {
                         'hp_perc': player.health_perc,
-                        'hp_curr': player.health,
+                        'hp_curr': player.state.health,
                         'hp_max': player.max_health,
                         'mp_perc': player.mana_perc,
                         'mp_curr': player.mana,
@@ -629,7 +709,6 @@ class Travel(BaseView):
                     }
                 }
                 headers = {'HX-Trigger': json.dumps(trigger_data)}
-                context['event'], _ = self.get_event_data(player=player, full=True)
                 context['travel'] = self.get_travel_data(player=player)
                 event_header_partial = """
                     <div id="event-card-header" hx-swap-oob="true" class="card-header d-flex justify-content-between">
@@ -641,9 +720,6 @@ class Travel(BaseView):
                     </div>
                 """
 
-                player.owner.last_refresh = time.time()
-                player.owner.save(update_fields=['last_refresh'])
-
                 return self.render_partials(request, self.partials, [event_header_partial], headers,  context)
 
             return HttpResponse('Invalid selection', status=400)
@@ -655,7 +731,7 @@ class RegionChat(BaseView):
     template = 'partials/region_chat.html'
 
     def post(self, request):
-        player, user_auth = self.prep_player(['location__region', 'owner'])
+        player, user_auth = self.prep_player(['location__region'])
 
         if not user_auth:
             return redirect('login')
@@ -674,3 +750,38 @@ class RegionChat(BaseView):
         context['messages'] = messages
 
         return render(request, self.template, context)
+
+
+class SpriteSheet(View):
+    def get(self, request, public_id):
+        try:
+            location = Location.objects.only('id', 'public_id').get(public_id=public_id)
+        except Location.DoesNotExist:
+            return HttpResponse(status=404)
+
+        version = request.GET.get('v')
+        sheet = get_sprite_sheet(location)
+
+        if version != sheet['version']:
+            # This process may hold an older sheet than the one the page was rendered with
+            sheet = get_sprite_sheet(location, refresh=True)
+
+        if version != sheet['version']:
+            # Never serve other content under a versioned URL, send the client to the current one instead
+            response = redirect(sprite_sheet_url(location))
+            patch_cache_control(response, no_cache=True)
+
+            return response
+
+        etag = f'"{sheet["version"]}"'
+
+        if request.headers.get('If-None-Match') == etag:
+            response = HttpResponse(status=304)
+        else:
+            response = HttpResponse(sheet['body'], content_type='image/svg+xml')
+
+        # The requested version matches the content, so this URL never changes and can be cached indefinitely
+        response['ETag'] = etag
+        patch_cache_control(response, public=True, max_age=settings.SPRITE_SHEET_MAX_AGE, immutable=True)
+
+        return response
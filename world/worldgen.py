@@ -0,0 +1,347 @@
+import time
+import uuid
+import random
+import logging
+import threading
+import multiprocessing
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import django
+
+from django.conf import settings
+from django.db import connection, transaction, IntegrityError
+from django.db.models import Q
+
+from core.utils import generators
+from .models import World, WorldJob, Region, Location, EnemyTemplate, EnemyArchetype
+from .gamedata import enemy_archetypes
+from .enemy import plan_enemy_templates
+
+logger = logging.getLogger(__name__)
+
+# A running job that has not reported progress for this long is assumed to have died with its process
+JOB_STALE_AFTER = 300
+
+_executor = ThreadPoolExecutor(max_workers=settings.WORLDGEN_WORKERS, thread_name_prefix='worldgen')
+# Refills get their own thread so they never queue in front of a player's world job
+_pool_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='worldgen-pool')
+
+# World layout
+# Regions come in level bands of REGION_BAND_SIZE, each band REGION_BAND_LEVELS above the one before it, which
+# matches the level spread of a region's dungeons. Planned regions are written REGION_BATCH_SIZE at a time.
+REGION_BAND_SIZE = 5
+REGION_BAND_LEVELS = 4
+REGION_BATCH_SIZE = 50
+
+_region_processes: ProcessPoolExecutor | None = None
+_region_processes_lock = threading.Lock()
+
+
+def plan_region(seed: str, level: int, archetypes: list[EnemyArchetype]) -> dict:
+    """
+    Everything needed to persist one region, its locations and their enemy templates, without touching the database.
+    """
+    region_data = generators.generate_region(seed=seed, level=level)
+    locations = []
+
+    for town in region_data['locations']['towns']:
+        locations.append({'name': town['name'], 'level': town['level'], 'type': 'T',
+                          'spawn_rate': None, 'max_players': 100, 'templates': []})
+
+    for dungeon in region_data['locations']['dungeons']:
+        templates = plan_enemy_templates(seed=dungeon['name'], level=dungeon['level'], biome=region_data['biome'],
+                                         count=5, archetypes=archetypes)
+        locations.append({'name': dungeon['name'], 'level': dungeon['level'], 'type': 'D',
+                          'spawn_rate': 5, 'max_players': 3, 'templates': templates})
+
+    return {'name': region_data['name'], 'biome': region_data['biome'], 'level': level, 'locations': locations}
+
+
+def persist_regions(world: World | None, region_plans: list[dict]) -> tuple[list[Region], list[Location]]:
+    """
+    Writes planned regions with one bulk insert per table and returns the regions and their locations in plan order.
+    Must run inside a transaction.
+    """
+    regions = Region.objects.bulk_create([
+        Region(name=r['name'], biome=r['biome'], level=r['level'], world=world) for r in region_plans
+    ])
+
+    planned = [(region, loc) for region, r in zip(regions, region_plans) for loc in r['locations']]
+    locations = Location.objects.bulk_create([
+        Location(name=loc['name'], level=loc['level'], type=loc['type'], spawn_rate=loc['spawn_rate'],
+                 max_players=loc['max_players'], region=region)
+        for region, loc in planned
+    ])
+
+    EnemyTemplate.objects.bulk_create([
+        EnemyTemplate(location=location, **fields)
+        for location, (_, loc) in zip(locations, planned)
+        for fields in loc['templates']
+    ], batch_size=500)
+
+    return regions, locations
+
+
+def region_seed(name: str, index: int) -> str:
+    # The first region keeps the world name as its seed, so single-region worlds are unchanged
+    return name if index == 0 else f'{name}#{index}'
+
+
+def region_level(index: int) -> int:
+    return 1 + (index // REGION_BAND_SIZE) * REGION_BAND_LEVELS
+
+
+def plan_region_links(name: str, count: int) -> list[tuple[int, int]]:
+    """
+    Region index pairs to connect. Every region links back to a random earlier region in its own or the previous
+    band, a tree rooted at the start region so all of them are reachable, and some get a second link for loops.
+    """
+    rng = random.Random(f'{name}#links')
+    links = []
+
+    for index in range(1, count):
+        first = max(0, (index // REGION_BAND_SIZE - 1) * REGION_BAND_SIZE)
+        parent = rng.randrange(first, index)
+        links.append((parent, index))
+
+        if index - first > 1 and rng.random() < 0.3:
+            other = rng.randrange(first, index)
+
+            if other != parent:
+                links.append((other, index))
+
+    return links
+
+
+def _plan_region_task(task: tuple) -> dict:
+    name, index, archetypes = task
+
+    return plan_region(seed=region_seed(name, index), level=region_level(index), archetypes=archetypes)
+
+
+def _get_region_processes() -> ProcessPoolExecutor:
+    """
+    Shared process pool for planning regions. Workers start from a forkserver, so they never inherit the threads
+    of a web process, and set Django up once.
+    """
+    global _region_processes
+
+    with _region_processes_lock:
+        if _region_processes is None:
+            _region_processes = ProcessPoolExecutor(max_workers=settings.WORLDGEN_PROCESSES,
+                                                    mp_context=multiprocessing.get_context('forkserver'),
+                                                    initializer=django.setup)
+
+    return _region_processes
+
+
+def plan_regions(name: str, count: int, archetypes: list[EnemyArchetype]):
+    """
+    Yields the plans of a world's regions in order. Larger worlds are planned across the process pool.
+    """
+    tasks = [(name, index, archetypes) for index in range(count)]
+
+    if count < REGION_BAND_SIZE or settings.WORLDGEN_PROCESSES < 2:
+        return map(_plan_region_task, tasks)
+
+    chunksize = max(1, count // (settings.WORLDGEN_PROCESSES * 4))
+
+    return _get_region_processes().map(_plan_region_task, tasks, chunksize=chunksize)
+
+
+def generate_world(name: str, regions: int = 1, report=None) -> World:
+    """
+    Generates and stores a world of `regions` connected regions, deterministically from its name.
+
+    Plans are written in batches as they arrive from the pool, so inserts overlap the remaining generation. Every
+    batch is its own transaction, so `report`, called with the number of regions written after each one, runs with
+    nothing uncommitted and its progress is visible to other connections right away. The world only counts as
+    complete once the region links and its start location, the first town, are written at the end. An incomplete
+    world left behind by an earlier run of the same name is replaced, so callers must hold the job's claim: the run
+    that wrote it is then known to have stopped reporting and stops at its next report (see run_world_job).
+    """
+    archetypes = list(enemy_archetypes())
+    plans = iter(plan_regions(name, regions, archetypes))
+    region_ids = []
+    start_location = None
+
+    World.objects.filter(name=name, start_location__isnull=True).delete()
+    world = World.objects.create(name=name)
+
+    try:
+        while batch := list(islice(plans, REGION_BATCH_SIZE)):
+            with transaction.atomic():
+                created, locations = persist_regions(world, batch)
+
+            region_ids.extend(region.id for region in created)
+
+            if start_location is None:
+                start_location = next(location for location in locations if location.type == 'T')
+
+            if report:
+                report(len(region_ids))
+
+        with transaction.atomic():
+            Link = Region.connections.through
+            Link.objects.bulk_create([
+                Link(from_region_id=region_ids[a], to_region_id=region_ids[b])
+                for pair in plan_region_links(name, regions)
+                for a, b in (pair, pair[::-1])
+            ], batch_size=1000)
+
+            world.start_location = start_location
+            world.save(update_fields=['start_location'])
+
+    except BaseException:
+        world.delete()
+        raise
+
+    return world
+
+
+# Region pool
+# With WORLD_POOL_SIZE set, regions are generated ahead of time and stored with no world. A new world claims one
+# in a single short transaction instead of waiting for generation; claims refill the pool in the background.
+def fill_region_pool(size: int | None = None) -> int:
+    """
+    Generates pooled regions until `size` (default settings.WORLD_POOL_SIZE) are waiting. Returns how many were added.
+    """
+    size = settings.WORLD_POOL_SIZE if size is None else size
+    missing = size - Region.objects.filter(world__isnull=True).count()
+
+    if missing <= 0:
+        return 0
+
+    archetypes = list(enemy_archetypes())
+
+    for _ in range(missing):
+        plan = plan_region(seed=f'pool-{uuid.uuid4().hex}', level=1, archetypes=archetypes)
+
+        with transaction.atomic():
+            persist_regions(None, [plan])
+
+    return missing
+
+
+def _refill_region_pool() -> None:
+    try:
+        fill_region_pool()
+    except Exception:
+        logger.exception('Refilling the region pool failed')
+    finally:
+        connection.close()
+
+
+def claim_pooled_world(name: str) -> World | None:
+    """
+    Creates a world around a pooled region, or returns None when the pool is disabled or empty.
+    Pooled regions stand alone, so the pool is only used for single-region worlds.
+    """
+    if not settings.WORLD_POOL_SIZE or settings.WORLD_REGIONS > 1:
+        return None
+
+    try:
+        with transaction.atomic():
+            region = (Region.objects.select_for_update(skip_locked=True)
+                      .filter(world__isnull=True)
+                      .order_by('id')
+                      .first())
+
+            if region is None:
+                world = None
+            else:
+                town = Location.objects.filter(region=region, type='T').order_by('id').first()
+                world = World.objects.create(name=name, start_location=town)
+                Region.objects.filter(id=region.id).update(world=world)
+
+    except IntegrityError:
+        # Another request created this world first
+        world = World.objects.filter(name=name, start_location__isnull=False).first()
+
+    _pool_executor.submit(_refill_region_pool)
+
+    return world
+
+
+class JobReclaimed(Exception):
+    """
+    The job of a run was claimed by another run after this one stopped reporting for JOB_STALE_AFTER.
+    """
+
+
+def _set_job(job_id: int, run_id: uuid.UUID, **fields) -> None:
+    """
+    Updates a job and refreshes its updated_at, only while `run_id` still holds the claim.
+    """
+    if not WorldJob.objects.filter(id=job_id, run_id=run_id).update(updated_at=time.time(), **fields):
+        raise JobReclaimed(f'World generation job {job_id} was claimed by another run')
+
+
+def run_world_job(job_id: int) -> None:
+    """
+    Generates and stores the world of a job. Claiming is a conditional update, so a job submitted more than once
+    still only runs once. Every progress report refreshes the claim, a run is only replaced once it has not reported
+    for JOB_STALE_AFTER, and a replaced run stops at its next report without touching the job again.
+    """
+    now = time.time()
+    run_id = uuid.uuid4()
+    claimable = (Q(status__in=['P', 'F'])
+                 | Q(status='R', updated_at__lt=now - JOB_STALE_AFTER)
+                 | Q(status='D', world__isnull=True))
+
+    try:
+        if not WorldJob.objects.filter(claimable, id=job_id).update(status='R', progress=0, error='',
+                                                                    updated_at=now, run_id=run_id):
+            return
+
+        job = WorldJob.objects.get(id=job_id)
+        world = World.objects.filter(name=job.name, start_location__isnull=False).first()
+
+        if world is None:
+            regions = settings.WORLD_REGIONS
+
+            def report(done):
+                _set_job(job_id, run_id, progress=95 * done // regions)
+
+            try:
+                world = generate_world(job.name, regions=regions, report=report)
+            except IntegrityError:
+                # The name was taken from the region pool while this job was generating
+                world = World.objects.get(name=job.name)
+
+        _set_job(job_id, run_id, status='D', progress=100, world=world)
+
+    except JobReclaimed:
+        logger.warning('World generation job %s was taken over by another run', job_id)
+
+    except Exception as e:
+        logger.exception('World generation job %s failed', job_id)
+
+        try:
+            _set_job(job_id, run_id, status='F', error=str(e)[:500])
+        except JobReclaimed:
+            pass
+
+    finally:
+        connection.close()
+
+
+def submit_world_job(name: str) -> WorldJob:
+    """
+    Returns the job for a world name, starting it in the background unless it is finished or already running.
+    A finished job whose world has been deleted since starts over, the name is free to generate again.
+    """
+    job, _ = WorldJob.objects.get_or_create(name=name)
+
+    if job.status == 'D' and job.world_id is None:
+        WorldJob.objects.filter(id=job.id, status='D', world__isnull=True).update(status='P', progress=0,
+                                                                                  updated_at=time.time())
+        job.refresh_from_db()
+
+    stale = job.status == 'R' and job.updated_at < time.time() - JOB_STALE_AFTER
+
+    if job.status in ('P', 'F') or stale:
+        _executor.submit(run_world_job, job.id)
+
+    return job